@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh command-line batch symmetry tool
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import objio, batch
+
+
+def write_grid_obj(file_path, columns=5, rows=3, offsets=None):
+    """
+    Writes an OBJ file with a grid of quads symmetric in YZ plane. Vertex of row r and column c has index
+    r * columns + c. Offsets is a dictionary with the offset added to some vertices.
+    """
+
+    offsets = offsets or dict()
+    with open(file_path, 'w') as obj_file:
+        for row in range(rows):
+            for column in range(columns):
+                point = np.array([column - (columns - 1) / 2.0, row, 0.0]) + offsets.get(row * columns + column, 0.0)
+                obj_file.write('v {} {} {}\n'.format(*point))
+        for row in range(rows - 1):
+            for column in range(columns - 1):
+                vertex = row * columns + column + 1
+                obj_file.write('f {} {} {} {}\n'.format(vertex, vertex + 1, vertex + columns + 1, vertex + columns))
+
+
+class BatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp(prefix='symmesh_tests_')
+        self._symmetric_path = os.path.join(self._directory, 'symmetric.obj')
+        self._asymmetric_path = os.path.join(self._directory, 'asymmetric.obj')
+        write_grid_obj(self._symmetric_path)
+        write_grid_obj(self._asymmetric_path, offsets={3: [0.0, 0.3, 0.0]})
+
+    def tearDown(self):
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def test_process_obj_file(self):
+        report = batch.process_obj_file(self._asymmetric_path, axis=0, tolerance=0.001)
+
+        self.assertTrue(report['success'])
+        self.assertFalse(report['is_symmetric'])
+        self.assertEqual([report[key] for key in ('vertices', 'pairs', 'seam', 'asymmetric')], [15, 5, 3, 2])
+        self.assertTrue(batch.process_obj_file(self._symmetric_path, memory_map=True)['is_symmetric'])
+
+    def test_write_mirrored_and_flipped(self):
+        output_directory = os.path.join(self._directory, 'output')
+        os.makedirs(output_directory)
+        report = batch.process_obj_file(
+            self._asymmetric_path, axis=0, tolerance=0.001, mirror=True, flip=True, output_directory=output_directory,
+            topology=True)
+
+        # Topology symmetry table pairs the moved vertex too, so it is mirrored and flipped with its partner
+        self.assertEqual(report['pairs'], 6)
+        self.assertEqual(report['asymmetric'], 0)
+        mirrored_points = objio.read_obj_points(report['mirrored'])
+        flipped_points = objio.read_obj_points(report['flipped'])
+        self.assertEqual(os.path.dirname(report['mirrored']), output_directory)
+        np.testing.assert_allclose(mirrored_points[[1, 3]], [[-1.0, 0.3, 0.0], [1.0, 0.3, 0.0]])
+        np.testing.assert_allclose(flipped_points[[1, 3]], [[-1.0, 0.3, 0.0], [1.0, 0.0, 0.0]])
+
+    def test_detect_axis(self):
+        report = batch.process_obj_file(self._symmetric_path, axis=-1)
+
+        self.assertEqual(report['axis'], 'YZ')
+        self.assertTrue(report['is_symmetric'])
+
+    def test_run(self):
+        missing_path = os.path.join(self._directory, 'missing.obj')
+        obj_files = [self._asymmetric_path, missing_path, self._symmetric_path]
+        reports = batch.run(obj_files, jobs=1, axis=0, tolerance=0.001)
+
+        self.assertEqual([report['path'] for report in reports], obj_files)
+        self.assertEqual([report['success'] for report in reports], [True, False, True])
+        self.assertEqual([report.get('is_symmetric') for report in reports], [False, None, True])
+        self.assertTrue(batch.format_report(reports[1]).startswith('[ERROR]'))
+
+    def test_find_obj_files(self):
+        self.assertEqual(batch.find_obj_files([self._directory]), [self._asymmetric_path, self._symmetric_path])
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh point cache
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import cache
+
+
+class PointCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp(prefix='symmesh_tests_')
+        self._points = np.arange(30, dtype=np.float64).reshape(10, 3)
+
+    def tearDown(self):
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def test_memory_map_round_trip(self):
+        point_cache = cache.PointCache(memory_map=True, directory=self._directory)
+        array = point_cache.store('geo_object', self._points)
+
+        self.assertIsInstance(array, np.memmap)
+        self.assertIn('geo_object', point_cache)
+        np.testing.assert_array_equal(point_cache.get('geo_object'), self._points)
+        file_names = os.listdir(self._directory)
+        self.assertEqual(len(file_names), 1)
+        np.testing.assert_array_equal(np.load(os.path.join(self._directory, file_names[0])), self._points)
+
+        del array
+        point_cache.remove('geo_object')
+        self.assertNotIn('geo_object', point_cache)
+        self.assertIsNone(point_cache.get('geo_object'))
+        self.assertEqual(os.listdir(self._directory), list())
+
+    def test_create(self):
+        point_cache = cache.PointCache(memory_map=True, directory=self._directory)
+        array = point_cache.create('geo_world', self._points.shape)
+        array[:] = self._points
+
+        self.assertIsInstance(array, np.memmap)
+        np.testing.assert_array_equal(point_cache.get('geo_world'), self._points)
+
+        del array
+        point_cache.clear()
+        self.assertEqual(len(point_cache), 0)
+        self.assertEqual(os.listdir(self._directory), list())
+
+    def test_min_vertices(self):
+        point_cache = cache.PointCache(memory_map=True, directory=self._directory, min_vertices=100)
+        array = point_cache.store('geo_object', self._points)
+        self._points[0] = -1.0
+
+        self.assertNotIsInstance(array, np.memmap)
+        self.assertEqual(array[0, 0], 0.0)
+        self.assertEqual(os.listdir(self._directory), list())
+
+    def test_temporary_directory(self):
+        point_cache = cache.PointCache(memory_map=True)
+        point_cache.store('geo_object', self._points)
+        directory = point_cache.directory
+
+        self.assertTrue(os.path.isdir(directory))
+        point_cache.clear()
+        self.assertFalse(os.path.isdir(directory))
@@ -0,0 +1,529 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh symmetry engine
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import itertools
+import unittest
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import engine
+
+
+def get_noisy_symmetric_points(half_count=300, noise=0.0004, seed=0):
+    """
+    Returns points symmetric in YZ plane whose negative side is displaced by random noise. Points are close enough so
+    several vertices compete for the same candidates.
+    """
+
+    random_state = np.random.RandomState(seed)
+    half_points = random_state.uniform(0.0, 0.02, (half_count, 3)) + [0.01, 0.0, 0.0]
+    mirrored_points = half_points * [-1.0, 1.0, 1.0] + random_state.uniform(-noise, noise, half_points.shape)
+    seam_points = random_state.uniform(0.0, 0.02, (10, 3)) * [0.0, 1.0, 1.0]
+
+    return np.vstack([half_points, mirrored_points, seam_points])
+
+
+def get_grid_mesh(columns=5, rows=3):
+    """
+    Returns points and faces of a grid of quads symmetric in YZ plane. Vertex of row r and column c has index
+    r * columns + c and its mirror vertex is the one of the same row at column columns - 1 - c.
+    """
+
+    x, y = np.meshgrid(np.arange(columns) - (columns - 1) / 2.0, np.arange(rows))
+    points = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+    face_vertices = list()
+    for row in range(rows - 1):
+        for column in range(columns - 1):
+            vertex = row * columns + column
+            face_vertices.extend([vertex, vertex + 1, vertex + columns + 1, vertex + columns])
+
+    return points, np.full(len(face_vertices) // 4, 4), np.array(face_vertices)
+
+
+class SolveAssignmentTests(unittest.TestCase):
+
+    def _get_brute_force_cost(self, cost_matrix):
+        rows, columns = cost_matrix.shape
+        if rows <= columns:
+            return min(
+                cost_matrix[np.arange(rows), list(permutation)].sum()
+                for permutation in itertools.permutations(range(columns), rows))
+
+        return self._get_brute_force_cost(cost_matrix.T)
+
+    def test_matches_brute_force(self):
+        random_state = np.random.RandomState(1)
+        for shape in [(1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (3, 5), (5, 3), (2, 6), (6, 4)]:
+            for _ in range(10):
+                cost_matrix = random_state.uniform(0.0, 10.0, shape)
+                assignment = engine._solve_assignment(cost_matrix)
+                assigned_rows = np.flatnonzero(assignment != -1)
+                self.assertEqual(len(assigned_rows), min(shape))
+                self.assertEqual(len(np.unique(assignment[assigned_rows])), min(shape))
+                self.assertAlmostEqual(
+                    cost_matrix[assigned_rows, assignment[assigned_rows]].sum(),
+                    self._get_brute_force_cost(cost_matrix))
+
+    def test_integer_costs_with_ties(self):
+        random_state = np.random.RandomState(2)
+        for _ in range(20):
+            cost_matrix = random_state.randint(0, 3, (5, 5)).astype(np.float64)
+            assignment = engine._solve_assignment(cost_matrix)
+            self.assertAlmostEqual(
+                cost_matrix[np.arange(5), assignment].sum(), self._get_brute_force_cost(cost_matrix))
+
+
+class BuildSymmetryTableTests(unittest.TestCase):
+
+    def test_symmetric_points(self):
+        points = get_noisy_symmetric_points()
+        pairs, seam, asymmetric = engine.build_symmetry_table(points, axis=0, tolerance=0.001)
+
+        self.assertEqual(len(pairs), 300)
+        self.assertEqual(len(seam), 10)
+        self.assertEqual(len(asymmetric), 0)
+        self.assertTrue(np.all(engine.get_symmetric_pairs_mask(points, pairs, axis=0, tolerance=0.001)))
+
+    def test_exact_symmetric_points(self):
+        points = get_noisy_symmetric_points(noise=0.0)
+        pairs, _, asymmetric = engine.build_symmetry_table(points, axis=0, tolerance=0.001)
+
+        np.testing.assert_array_equal(pairs, np.column_stack([np.arange(300), np.arange(300, 600)]))
+        self.assertEqual(len(asymmetric), 0)
+
+    def test_vertex_order_invariance(self):
+        points = get_noisy_symmetric_points(half_count=500, noise=0.0008)
+        pairs, seam, asymmetric = engine.build_symmetry_table(points, axis=0, tolerance=0.001)
+
+        random_state = np.random.RandomState(3)
+        for _ in range(3):
+            permutation = random_state.permutation(len(points))
+            permuted_pairs, permuted_seam, permuted_asymmetric = engine.build_symmetry_table(
+                points[permutation], axis=0, tolerance=0.001)
+
+            # Indices of the permuted points are mapped back to the original vertex indices
+            permuted_pairs = permutation[permuted_pairs]
+            permuted_pairs = permuted_pairs[np.argsort(permuted_pairs[:, 0])]
+            np.testing.assert_array_equal(permuted_pairs, pairs)
+            np.testing.assert_array_equal(np.sort(permutation[permuted_seam]), seam)
+            np.testing.assert_array_equal(np.sort(permutation[permuted_asymmetric]), asymmetric)
+
+    def test_mirror_plane_offset(self):
+        points = get_noisy_symmetric_points()
+        mid = 2.5
+        points[:, 0] += mid
+        pairs, seam, asymmetric = engine.build_symmetry_table(points, axis=0, tolerance=0.001, mid=mid)
+
+        self.assertEqual(len(pairs), 300)
+        self.assertEqual(len(seam), 10)
+        self.assertTrue(np.all(engine.get_symmetric_pairs_mask(points, pairs, axis=0, tolerance=0.001, mid=mid)))
+
+
+class ShellSymmetryTests(unittest.TestCase):
+
+    def setUp(self):
+        random_state = np.random.RandomState(4)
+        piece = random_state.uniform(0.0, 0.1, (50, 3))
+        pieces = [piece + [0.5, 0.0, 0.0], piece + [0.5, 0.105, 0.0]]
+        self._points = np.vstack([pieces[0], pieces[0] * [-1.0, 1.0, 1.0], pieces[1], pieces[1] * [-1.0, 1.0, 1.0]])
+        self._shells = np.repeat(np.arange(4), 50)
+
+    def test_match_shells(self):
+        np.testing.assert_array_equal(
+            engine.match_shells(self._points, self._shells, axis=0, tolerance=0.0001), [1, 0, 3, 2])
+
+    def test_match_edited_shells(self):
+        self._points[3, 1] += 0.005
+        np.testing.assert_array_equal(
+            engine.match_shells(self._points, self._shells, axis=0, tolerance=0.0001), [1, 0, 3, 2])
+
+    def test_unmatched_shell_vertices(self):
+        # Shells whose mirror shell is not found are still paired by the global matcher
+        shell_map = np.array([-1, -1, 3, 2])
+        pairs, _, asymmetric = engine.build_shell_symmetry_table(
+            self._points, self._shells, axis=0, tolerance=0.0001, shell_map=shell_map)
+
+        self.assertEqual(len(pairs), 100)
+        self.assertEqual(len(asymmetric), 0)
+        self.assertTrue(np.all(np.abs(pairs[:, 1] - pairs[:, 0]) == 50))
+
+    def test_incremental_check_keeps_shells(self):
+        symmetry_check = engine.IncrementalSymmetryCheck(self._points, axis=0, tolerance=0.0001, shells=self._shells)
+        points = self._points.copy()
+        points[3, 2] += 0.01
+        np.testing.assert_array_equal(symmetry_check.update(points), [3])
+        np.testing.assert_array_equal(symmetry_check.asymmetric, [3, 53])
+
+        points = points.copy()
+        points[3, 2] -= 0.01
+        symmetry_check.update(points)
+        self.assertTrue(symmetry_check.is_symmetric)
+        self.assertEqual(symmetry_check.mirror_map[3], 53)
+
+
+class DetectMirrorAxisTests(unittest.TestCase):
+
+    def test_symmetric_points(self):
+        points = get_noisy_symmetric_points(noise=0.0)
+        self.assertEqual(engine.get_mirror_match_score(points, axis=0, tolerance=0.001), 1.0)
+        self.assertEqual(engine.detect_mirror_axis(points, tolerance=0.001)[0], 0)
+
+    def test_on_plane_samples_are_skipped(self):
+        # Half of the vertices lie on the YZ plane and the other half have no mirror vertex
+        random_state = np.random.RandomState(5)
+        points = random_state.uniform(0.1, 1.0, (200, 3))
+        points[::2, 0] = 0.0
+        self.assertEqual(engine.get_mirror_match_score(points, axis=0, tolerance=0.001), 0.0)
+
+    def test_flat_points(self):
+        # Points lying on the YZ plane match themselves in YZ, but are only mirrored in XZ
+        y, z = np.meshgrid(np.linspace(-1.0, 1.0, 20), np.linspace(0.0, 1.0, 10))
+        points = np.column_stack([np.zeros(y.size), y.ravel(), z.ravel()])
+        best_axis, scores = engine.detect_mirror_axis(points, tolerance=0.001)
+
+        self.assertEqual(best_axis, 1)
+        self.assertEqual(scores[:2], [0.0, 1.0])
+
+    def test_flat_asymmetric_points(self):
+        # Lying on the XY plane must not make an asymmetric flat geometry symmetric in XY
+        points, _, _ = get_grid_mesh(columns=7, rows=5)
+        points[1, 1] += 0.2
+        best_axis, scores = engine.detect_mirror_axis(points, tolerance=0.001)
+
+        self.assertEqual(best_axis, 0)
+        self.assertEqual(scores[2], 0.0)
+        self.assertLess(scores[0], 1.0)
+
+
+class PrecheckSymmetryTests(unittest.TestCase):
+
+    def test_few_asymmetric_outliers(self):
+        # A few far away asymmetric vertices move the centroid and correlate axes, but most vertices are symmetric
+        points = get_noisy_symmetric_points(noise=0.0)
+        outliers = np.array([[5.0, 5.0, 0.0], [6.0, 6.0, 0.0], [7.0, 7.0, 0.0]])
+        plausible, precheck = engine.precheck_symmetry(np.vstack([points, outliers]), axis=0, tolerance=0.001)
+
+        self.assertTrue(plausible)
+        self.assertGreaterEqual(precheck['score'], 0.9)
+
+    def test_asymmetric_points(self):
+        random_state = np.random.RandomState(6)
+        points = random_state.uniform(-1.0, 1.0, (500, 3))
+        plausible, _ = engine.precheck_symmetry(points, axis=0, tolerance=0.001)
+
+        self.assertFalse(plausible)
+
+
+class WeightedMirrorTests(unittest.TestCase):
+
+    def setUp(self):
+        # Vertex 0 (positive side) is paired with vertex 1 (negative side) and vertex 2 is a seam vertex
+        self._base_points = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        self._mirror_map = np.array([1, 0, 2])
+        self._points = np.array([[2.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.2, 1.0, 0.0]])
+
+    def _mirror(self, weights, flip=False):
+        return engine.mirror_points(
+            self._points, self._base_points, self._mirror_map, axis=0, flip=flip, weights=weights)
+
+    def test_full_weights(self):
+        np.testing.assert_allclose(
+            self._mirror(np.ones(3)), engine.mirror_points(self._points, self._base_points, self._mirror_map))
+        np.testing.assert_allclose(self._mirror(np.ones(3)), [[2.0, 1.0, 0.0], [-2.0, 1.0, 0.0], [0.0, 1.0, 0.0]])
+
+    def test_zero_weights(self):
+        np.testing.assert_allclose(self._mirror(np.zeros(3)), self._points)
+
+    def test_partial_weights(self):
+        np.testing.assert_allclose(
+            self._mirror(np.full(3, 0.5)), [[2.0, 1.0, 0.0], [-1.5, 0.5, 0.0], [0.1, 1.0, 0.0]])
+
+    def test_targets_take_source_weights(self):
+        # Negative vertex follows the weight of the positive vertex it is mirrored from, not its own one
+        np.testing.assert_allclose(self._mirror(np.array([0.5, 0.0, 0.0]))[1], [-1.5, 0.5, 0.0])
+        np.testing.assert_allclose(self._mirror(np.array([0.0, 1.0, 0.0]))[1], self._points[1])
+
+    def test_flip_weights(self):
+        np.testing.assert_allclose(
+            self._mirror(np.ones(3), flip=True), [[1.0, 0.0, 0.0], [-2.0, 1.0, 0.0], [-0.2, 1.0, 0.0]])
+        np.testing.assert_allclose(self._mirror(np.zeros(3), flip=True), self._points)
+        np.testing.assert_allclose(
+            self._mirror(np.full(3, 0.5), flip=True), [[1.5, 0.5, 0.0], [-1.5, 0.5, 0.0], [0.0, 1.0, 0.0]])
+
+    def test_blend_points(self):
+        # Revert blends points towards base points by their weights
+        base_points = np.zeros((3, 3))
+        np.testing.assert_allclose(engine.blend_points(self._points, base_points, np.zeros(3)), self._points)
+        np.testing.assert_allclose(engine.blend_points(self._points, base_points, np.ones(3)), base_points)
+        np.testing.assert_allclose(
+            engine.blend_points(self._points, base_points, [0.5, 0.0, 1.0]),
+            [[1.0, 0.5, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+
+        out = np.empty((3, 3))
+        self.assertIs(engine.blend_points(self._points, base_points, np.full(3, 0.5), out=out), out)
+        np.testing.assert_allclose(out, self._points * 0.5)
+
+
+class ApplyMirrorTests(unittest.TestCase):
+
+    def setUp(self):
+        self._base_points = get_noisy_symmetric_points(half_count=20, noise=0.0)
+        self._mirror_map = np.full(len(self._base_points), -1)
+        self._mirror_map[:20] = np.arange(20, 40)
+        self._mirror_map[20:40] = np.arange(20)
+        self._mirror_map[40:] = np.arange(40, 50)
+        self._mirror_indices = engine.get_mirror_indices(self._base_points, self._mirror_map, axis=0)
+
+    def test_stacked_targets(self):
+        random_state = np.random.RandomState(7)
+        targets = self._base_points + random_state.uniform(-0.01, 0.01, (3,) + self._base_points.shape)
+        mids = np.array([0.0, 0.5, -1.0])
+        for flip in (False, True):
+            result = engine.apply_mirror(targets, self._mirror_indices, axis=0, mid=mids, flip=flip)
+            self.assertEqual(result.shape, targets.shape)
+            for i, target in enumerate(targets):
+                np.testing.assert_allclose(
+                    result[i], engine.apply_mirror(target, self._mirror_indices, axis=0, mid=mids[i], flip=flip))
+
+    def test_stacked_deltas(self):
+        random_state = np.random.RandomState(8)
+        deltas = random_state.uniform(-0.01, 0.01, (2,) + self._base_points.shape)
+        result = engine.apply_mirror(deltas, self._mirror_indices, axis=0, mid=[1.0, 2.0], deltas=True)
+        for i, target_deltas in enumerate(deltas):
+            np.testing.assert_allclose(
+                result[i], engine.apply_mirror(target_deltas, self._mirror_indices, axis=0, deltas=True))
+
+    def test_symmetrize_points(self):
+        random_state = np.random.RandomState(9)
+        mid = 0.5
+        base_points = self._base_points + [mid, 0.0, 0.0]
+        points = base_points + random_state.uniform(-0.001, 0.001, base_points.shape)
+        result = engine.symmetrize_points(points, self._mirror_indices, axis=0, mid=mid)
+
+        mirrored = result[self._mirror_map] * [-1.0, 1.0, 1.0] + [2 * mid, 0.0, 0.0]
+        np.testing.assert_allclose(result, mirrored, atol=1e-12)
+        np.testing.assert_allclose(result[40:, 0], mid)
+        np.testing.assert_allclose(result[:20, 1:], (points[:20, 1:] + points[20:40, 1:]) * 0.5)
+
+        # Symmetric points are left untouched
+        np.testing.assert_allclose(
+            engine.symmetrize_points(result, self._mirror_indices, axis=0, mid=mid, out=result), mirrored, atol=1e-12)
+
+
+class SparseDeltasTests(unittest.TestCase):
+
+    def setUp(self):
+        self._base_points = get_noisy_symmetric_points(half_count=20, noise=0.0)
+        self._mirror_map = np.concatenate([np.arange(20, 40), np.arange(20), np.arange(40, 50)])
+        self._points = self._base_points.copy()
+        self._points[[2, 5, 41]] += [[0.01, 0.02, 0.0], [0.0, 0.0, -0.01], [0.005, 0.01, 0.0]]
+        self._points[27] += [0.0, 0.03, 0.0]
+
+    def test_get_sparse_deltas(self):
+        indices, deltas = engine.get_sparse_deltas(self._points, self._base_points)
+
+        np.testing.assert_array_equal(indices, [2, 5, 27, 41])
+        np.testing.assert_allclose(deltas, (self._points - self._base_points)[indices])
+        self.assertEqual(len(engine.get_sparse_deltas(self._base_points, self._base_points)[0]), 0)
+
+    def test_matches_dense_mirror(self):
+        dense_deltas = self._points - self._base_points
+        indices, deltas = engine.get_sparse_deltas(self._points, self._base_points)
+        for neg_to_pos, flip in itertools.product((False, True), (False, True)):
+            mirror_indices = engine.get_mirror_indices(
+                self._base_points, self._mirror_map, axis=0, neg_to_pos=neg_to_pos)
+            expected_deltas = engine.apply_mirror(dense_deltas, mirror_indices, axis=0, flip=flip, deltas=True)
+            changed, new_deltas = engine.mirror_sparse_deltas(
+                indices, deltas, self._base_points, self._mirror_map, axis=0, neg_to_pos=neg_to_pos, flip=flip)
+
+            # Only vertices whose delta changes are returned
+            expected_changed = np.flatnonzero(np.any(np.abs(expected_deltas - dense_deltas) > 1e-9, axis=1))
+            np.testing.assert_array_equal(changed, expected_changed)
+            np.testing.assert_allclose(new_deltas, expected_deltas[changed])
+
+    def test_no_deltas(self):
+        changed, new_deltas = engine.mirror_sparse_deltas(
+            np.zeros(0, dtype=np.int64), np.zeros((0, 3)), self._base_points, self._mirror_map, axis=0)
+
+        self.assertEqual(len(changed), 0)
+        self.assertEqual(new_deltas.shape, (0, 3))
+
+
+class ToleranceSweepTests(unittest.TestCase):
+
+    def setUp(self):
+        # Pair 0-1 is exactly symmetric, pair 2-3 is off by 0.002, vertex 4 is 0.0005 away from the plane and vertex 5
+        # has no mirror vertex at all
+        self._points = np.array([
+            [1.0, 0.0, 0.0], [-1.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0], [-1.0, 1.0, 0.002],
+            [0.0005, 2.0, 0.0],
+            [3.0, 3.0, 3.0]])
+
+    def test_get_mirror_distances(self):
+        distances = engine.get_mirror_distances(self._points, axis=0, max_tolerance=0.01)
+
+        np.testing.assert_allclose(distances, [0.0, 0.0, 0.002, 0.002, 0.0005, np.inf])
+
+    def test_mirror_plane_offset(self):
+        distances = engine.get_mirror_distances(self._points + [2.0, 0.0, 0.0], axis=0, mid=2.0, max_tolerance=0.01)
+
+        np.testing.assert_allclose(distances, [0.0, 0.0, 0.002, 0.002, 0.0005, np.inf], atol=1e-12)
+
+    def test_distances_above_max_tolerance(self):
+        distances = engine.get_mirror_distances(self._points, axis=0, max_tolerance=0.001)
+
+        np.testing.assert_allclose(distances, [0.0, 0.0, np.inf, np.inf, 0.0005, np.inf])
+
+    def test_matches_brute_force(self):
+        points = get_noisy_symmetric_points(noise=0.002)
+        mirrored = points * [-1.0, 1.0, 1.0]
+        brute_force = np.abs(mirrored[:, np.newaxis, :] - points[np.newaxis, :, :]).max(axis=2).min(axis=1)
+        brute_force = np.minimum(brute_force, np.abs(points[:, 0]))
+        brute_force[brute_force > 0.01] = np.inf
+
+        np.testing.assert_allclose(engine.get_mirror_distances(points, axis=0, max_tolerance=0.01), brute_force)
+
+    def test_count(self):
+        sweep = engine.ToleranceSweep(self._points, axis=0, max_tolerance=0.01)
+
+        self.assertEqual(sweep.vertex_count, 6)
+        self.assertEqual(sweep.count(0.0001), (2, 4))
+        self.assertEqual(sweep.count(0.001), (3, 3))
+        self.assertEqual(sweep.count(0.005), (5, 1))
+        self.assertEqual(sweep.count(1.0), (5, 1))
+        self.assertTrue(sweep.matches(0, 0.0, 6, tolerance=0.005))
+        self.assertFalse(sweep.matches(0, 0.0, 6, tolerance=0.05))
+        self.assertFalse(sweep.matches(1, 0.0, 6))
+        self.assertFalse(sweep.matches(0, 0.0, 7))
+
+
+class TopologySymmetryTests(unittest.TestCase):
+
+    def setUp(self):
+        self._points, self._face_counts, self._face_vertices = get_grid_mesh()
+
+    def test_find_seam_edges(self):
+        seam_edges = engine.find_seam_edges(self._points, self._face_counts, self._face_vertices, axis=0)
+
+        np.testing.assert_array_equal(seam_edges, [[7, 2], [12, 7]])
+        self.assertEqual(len(engine.find_seam_edges(self._points, self._face_counts, self._face_vertices, axis=1)), 0)
+
+    def test_build_topology_symmetry_table(self):
+        seam_edges = engine.find_seam_edges(self._points, self._face_counts, self._face_vertices, axis=0)
+        pairs, seam, asymmetric = engine.build_topology_symmetry_table(
+            self._points, self._face_counts, self._face_vertices, seam_edges, axis=0)
+
+        np.testing.assert_array_equal(pairs, [[4, 0], [3, 1], [9, 5], [8, 6], [14, 10], [13, 11]])
+        np.testing.assert_array_equal(seam, [2, 7, 12])
+        self.assertEqual(len(asymmetric), 0)
+
+    def test_posed_points(self):
+        # Table only depends on connectivity, so moving the negative side far beyond tolerance gives the same table
+        seam_edges = engine.find_seam_edges(self._points, self._face_counts, self._face_vertices, axis=0)
+        expected = engine.build_topology_symmetry_table(
+            self._points, self._face_counts, self._face_vertices, seam_edges, axis=0)
+
+        posed_points = self._points.copy()
+        negative = posed_points[:, 0] < 0
+        posed_points[negative] += np.random.RandomState(10).uniform(-0.3, 0.3, (np.count_nonzero(negative), 3))
+        result = engine.build_topology_symmetry_table(
+            posed_points, self._face_counts, self._face_vertices, seam_edges, axis=0)
+        for array, expected_array in zip(result, expected):
+            np.testing.assert_array_equal(array, expected_array)
+
+    def test_asymmetric_topology(self):
+        # First quad is split in two triangles, so the vertex only used by it cannot be paired
+        face_counts = np.concatenate([[3, 3], self._face_counts[1:]])
+        face_vertices = np.concatenate([[0, 1, 6, 0, 6, 5], self._face_vertices[4:]])
+        pairs, seam, asymmetric = engine.build_topology_symmetry_table(
+            self._points, face_counts, face_vertices, [[7, 2], [12, 7]], axis=0)
+
+        np.testing.assert_array_equal(asymmetric, [0, 4])
+        np.testing.assert_array_equal(seam, [2, 7, 12])
+        self.assertEqual(len(pairs), 5)
+
+
+class MatchQuantizedPointsTests(unittest.TestCase):
+
+    def test_exact_points(self):
+        points = get_noisy_symmetric_points(noise=0.0)[:300]
+        permutation = np.random.RandomState(11).permutation(300)
+        paired_a, paired_b = engine._match_quantized_points(points, points[permutation], 0.001)
+
+        self.assertGreater(len(paired_a), 250)
+        np.testing.assert_array_equal(permutation[paired_b], paired_a)
+
+    def test_ambiguous_points(self):
+        tolerance = 0.001
+        points_a = np.array([
+            [0.0102, 0.0, 0.0],
+            [0.0202, 0.0, 0.0],
+            [0.0302, 0.0, 0.0], [0.0305, 0.0, 0.0],
+            [0.0409999, 0.0, 0.0]])
+        points_b = np.array([
+            [0.0102, 0.0, 0.0],
+            [0.0206, 0.0, 0.0],
+            [0.0302, 0.0, 0.0],
+            [0.0410001, 0.0, 0.0]])
+        paired_a, paired_b = engine._match_quantized_points(points_a, points_b, tolerance)
+
+        # Only the first point is paired: second points are too far apart, third cell holds two points and fourth
+        # points fall in neighbour cells
+        np.testing.assert_array_equal(paired_a, [0])
+        np.testing.assert_array_equal(paired_b, [0])
+
+    def test_empty_points(self):
+        paired_a, paired_b = engine._match_quantized_points(np.zeros((0, 3)), np.ones((3, 3)), 0.001)
+
+        self.assertEqual(len(paired_a), 0)
+        self.assertEqual(len(paired_b), 0)
+
+
+class ComponentMirrorMapTests(unittest.TestCase):
+
+    def setUp(self):
+        self._points, self._face_counts, self._face_vertices = get_grid_mesh()
+        self._mirror_map = (np.arange(15) // 5) * 5 + 4 - np.arange(15) % 5
+
+    def test_edge_mirror_map(self):
+        edges_a, edges_b = engine.get_edges(self._face_counts, self._face_vertices)
+        edge_mirror_map = engine.get_edge_mirror_map(edges_a, edges_b, self._mirror_map)
+
+        np.testing.assert_array_equal(edge_mirror_map[edge_mirror_map], np.arange(len(edges_a)))
+        mirror_edges = np.sort(np.column_stack([self._mirror_map[edges_a], self._mirror_map[edges_b]]), axis=1)
+        np.testing.assert_array_equal(mirror_edges, np.column_stack([edges_a, edges_b])[edge_mirror_map])
+
+        # Seam edges are their own mirror edges
+        seam_edges = np.flatnonzero((edges_a % 5 == 2) & (edges_b % 5 == 2))
+        self.assertEqual(len(seam_edges), 2)
+        np.testing.assert_array_equal(edge_mirror_map[seam_edges], seam_edges)
+
+    def test_asymmetric_edges(self):
+        edges_a, edges_b = engine.get_edges(self._face_counts, self._face_vertices)
+        mirror_map = self._mirror_map.copy()
+        mirror_map[[0, 4]] = -1
+        edge_mirror_map = engine.get_edge_mirror_map(edges_a, edges_b, mirror_map)
+
+        asymmetric = np.isin(edges_a, [0, 4]) | np.isin(edges_b, [0, 4])
+        self.assertTrue(np.all(edge_mirror_map[asymmetric] == -1))
+        self.assertTrue(np.all(edge_mirror_map[~asymmetric] != -1))
+
+    def test_face_mirror_map(self):
+        face_mirror_map = engine.get_face_mirror_map(self._face_counts, self._face_vertices, self._mirror_map)
+
+        np.testing.assert_array_equal(face_mirror_map, [3, 2, 1, 0, 7, 6, 5, 4])
+
+    def test_asymmetric_faces(self):
+        # First quad is split in two triangles, so it has no mirror face
+        face_counts = np.concatenate([[3, 3], self._face_counts[1:]])
+        face_vertices = np.concatenate([[0, 1, 6, 0, 6, 5], self._face_vertices[4:]])
+        face_mirror_map = engine.get_face_mirror_map(face_counts, face_vertices, self._mirror_map)
+
+        np.testing.assert_array_equal(face_mirror_map, [-1, -1, 3, 2, -1, 8, 7, 6, 5])
@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh OBJ reading and writing functions
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import objio
+
+OBJ_DATA = (
+    b'# test mesh\r\n'
+    b'v 1.0 0.0 0.0\r\n'
+    b'v -1.0 0.0 0.0\r\n'
+    b'v 0.0 1.0 0.0 0.5 0.5 0.5\r\n'
+    b'vt 0.0 0.0\r\n'
+    b'vn 0.0 0.0 1.0\r\n'
+    b'f 1/1/1 2/1/1 3/1/1\r\n'
+    b'v 0.0 -1.0 0.0\r\n'
+    b'f -4//1 -1//1 -3//1\r\n'
+)
+
+
+class ObjIOTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp(prefix='symmesh_tests_')
+        self._obj_path = os.path.join(self._directory, 'mesh.obj')
+        with open(self._obj_path, 'wb') as obj_file:
+            obj_file.write(OBJ_DATA)
+
+    def tearDown(self):
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def test_read_obj(self):
+        obj_mesh = objio.read_obj(self._obj_path, chunk_size=2)
+        np.testing.assert_allclose(
+            obj_mesh.points, [[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, -1.0, 0.0]])
+        np.testing.assert_array_equal(obj_mesh.face_counts, [3, 3])
+        # Negative indices are relative to the vertices read before the face
+        np.testing.assert_array_equal(obj_mesh.face_vertices, [0, 1, 2, 0, 3, 1])
+
+    def test_read_obj_points(self):
+        points = objio.read_obj_points(self._obj_path)
+        self.assertEqual(points.shape, (4, 3))
+
+    def test_write_obj_points_keeps_line_endings(self):
+        points = objio.read_obj_points(self._obj_path)
+        points[2] = [0.0, 2.123456789, 0.0]
+        output_path = os.path.join(self._directory, 'output.obj')
+        objio.write_obj_points(self._obj_path, points, output_path=output_path)
+
+        with open(output_path, 'rb') as obj_file:
+            data = obj_file.read()
+        self.assertEqual(data.count(b'\n'), data.count(b'\r\n'))
+        self.assertIn(b'v 0.000000 2.123457 0.000000 0.5 0.5 0.5\r\n', data)
+        np.testing.assert_allclose(objio.read_obj_points(output_path), points, atol=1e-6)
+
+    def test_write_obj_points_in_place(self):
+        points = objio.read_obj_points(self._obj_path)
+        points[0] = [0.5, 0.0, 0.0]
+        objio.write_obj_points(self._obj_path, points)
+
+        np.testing.assert_allclose(objio.read_obj_points(self._obj_path), points)
+        self.assertEqual(objio.read_obj(self._obj_path).face_count, 2)
@@ -0,0 +1,95 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh command profiler
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tpRigToolkit.tools.symmesh.core import profiler
+
+
+class DummyServer(object):
+
+    def __init__(self):
+        super(DummyServer, self).__init__()
+
+        self.profiler = profiler.CommandProfiler()
+
+    @profiler.profile_command
+    def mirror(self, data, reply):
+        reply['result'] = sum(range(data['count']))
+
+
+class CommandProfilerTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp(prefix='symmesh_tests_')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _get_profile_files(self, extension='.prof', directory=None):
+        return sorted(
+            file_name for file_name in os.listdir(directory or self._directory) if file_name.endswith(extension))
+
+    def test_disabled(self):
+        command_profiler = profiler.CommandProfiler()
+        command_profiler.enable(count=0, output_directory=self._directory)
+
+        self.assertEqual(command_profiler.run('mirror', 'geo', lambda value: value * 2, 21), 42)
+        self.assertEqual(command_profiler.remaining, 0)
+        self.assertEqual(os.listdir(self._directory), list())
+
+    def test_profile_next_commands(self):
+        command_profiler = profiler.CommandProfiler()
+        output_directory = os.path.join(self._directory, 'profiles')
+        command_profiler.enable(count=2, output_directory=output_directory)
+        for _ in range(3):
+            self.assertEqual(command_profiler.run('mirror', '|root|geo', lambda value: value * 2, 21), 42)
+
+        # Only the given number of commands is profiled and each of them gets its own files
+        self.assertEqual(command_profiler.remaining, 0)
+        profile_files = self._get_profile_files(directory=output_directory)
+        self.assertEqual(len(profile_files), 2)
+        self.assertTrue(all(file_name.startswith('mirror_root_geo_') for file_name in profile_files))
+        if profiler.tracemalloc is not None:
+            self.assertEqual(len(self._get_profile_files('.tracemalloc', directory=output_directory)), 2)
+
+    def test_failed_command_is_profiled(self):
+        def _fail():
+            raise ValueError('failed')
+
+        command_profiler = profiler.CommandProfiler()
+        command_profiler.enable(output_directory=self._directory)
+        with self.assertRaises(ValueError):
+            command_profiler.run('mirror', '', _fail)
+
+        profile_files = self._get_profile_files()
+        self.assertEqual(len(profile_files), 1)
+        self.assertTrue(profile_files[0].startswith('mirror_no_geo_'))
+
+    def test_disable(self):
+        command_profiler = profiler.CommandProfiler()
+        command_profiler.enable(count=5, output_directory=self._directory)
+        command_profiler.disable()
+        command_profiler.run('mirror', 'geo', lambda: None)
+
+        self.assertEqual(command_profiler.remaining, 0)
+        self.assertEqual(os.listdir(self._directory), list())
+
+    def test_profile_command(self):
+        server = DummyServer()
+        server.profiler.enable(output_directory=self._directory)
+        reply = dict()
+        server.mirror({'geo': 'geo', 'count': 10}, reply)
+
+        self.assertEqual(reply['result'], 45)
+        self.assertEqual(server.mirror.__name__, 'mirror')
+        self.assertEqual(len(self._get_profile_files()), 1)
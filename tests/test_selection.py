@@ -0,0 +1,102 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh vertex selection
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import engine, selection
+
+
+class VertexSelectionTests(unittest.TestCase):
+
+    def test_from_indices(self):
+        vertex_selection = selection.VertexSelection.from_indices([0, 3, 9, 9, -1, 10], 10)
+
+        self.assertEqual(len(vertex_selection), 3)
+        self.assertEqual(list(vertex_selection), [0, 3, 9])
+        self.assertIn(9, vertex_selection)
+        self.assertNotIn(10, vertex_selection)
+        np.testing.assert_array_equal(vertex_selection.mask, np.isin(np.arange(10), [0, 3, 9]))
+
+    def test_empty(self):
+        vertex_selection = selection.VertexSelection.empty(10)
+
+        self.assertFalse(vertex_selection)
+        self.assertEqual(len(vertex_selection), 0)
+        self.assertEqual(vertex_selection.indices.tolist(), list())
+
+    def test_set_operations(self):
+        selection_a = selection.VertexSelection.from_indices([0, 1, 2], 5)
+        selection_b = selection.VertexSelection.from_indices([2, 3], 5)
+
+        self.assertEqual(list(selection_a | selection_b), [0, 1, 2, 3])
+        self.assertEqual(list(selection_a & selection_b), [2])
+        self.assertEqual(list(selection_a - selection_b), [0, 1])
+        self.assertEqual(list(selection_a ^ selection_b), [0, 1, 3])
+        with self.assertRaises(ValueError):
+            selection_a.union(selection.VertexSelection.empty(6))
+
+    def test_mirror(self):
+        mirror_map = np.array([1, 0, 2, -1])
+        vertex_selection = selection.VertexSelection.from_indices([0, 2, 3], 4)
+
+        self.assertEqual(list(vertex_selection.mirror(mirror_map)), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            vertex_selection.mirror(mirror_map[:3])
+
+    def test_combine(self):
+        vertex_selection = selection.VertexSelection.from_indices([0, 2], 4)
+        mirror_selection = selection.VertexSelection.from_indices([1, 2], 4)
+
+        self.assertEqual(list(vertex_selection.combine(mirror_selection, selection.REPLACE_MODE)), [1, 2])
+        self.assertEqual(list(vertex_selection.combine(mirror_selection, selection.ADD_MODE)), [0, 1, 2])
+        self.assertEqual(list(vertex_selection.combine(mirror_selection, selection.TOGGLE_MODE)), [0, 1])
+        self.assertEqual(list(vertex_selection.combine(mirror_selection, selection.INTERSECT_MODE)), [2])
+        with self.assertRaises(ValueError):
+            vertex_selection.combine(mirror_selection, -1)
+
+    def test_grow(self):
+        # Strip of 4 quads: vertices 0-4 on the bottom row and 5-9 on the top row
+        face_counts = [4, 4, 4, 4]
+        face_vertices = [0, 1, 6, 5, 1, 2, 7, 6, 2, 3, 8, 7, 3, 4, 9, 8]
+        edges_a, edges_b = engine.get_edges(face_counts, face_vertices)
+        self.assertEqual(len(edges_a), 13)
+
+        vertex_selection = selection.VertexSelection.from_indices([0], 10)
+        self.assertEqual(list(vertex_selection.grow(edges_a, edges_b)), [0, 1, 5])
+        self.assertEqual(list(vertex_selection.grow(edges_a, edges_b, steps=2)), [0, 1, 2, 5, 6])
+        self.assertEqual(list(vertex_selection.grow(edges_a, edges_b, steps=100)), list(range(10)))
+        self.assertEqual(list(vertex_selection.grow(edges_a, edges_b, steps=0)), [0])
+        self.assertFalse(selection.VertexSelection.empty(10).grow(edges_a, edges_b))
+
+    def test_sparse_round_trip(self):
+        # Few selected vertices are serialized as indices
+        vertex_selection = selection.VertexSelection.from_indices([5, 999], 1000)
+        data = vertex_selection.to_bytes()
+
+        self.assertEqual(data[0:1], bytes(bytearray([selection.INDICES_ENCODING])))
+        self.assertEqual(selection.VertexSelection.from_bytes(data), vertex_selection)
+        self.assertEqual(selection.VertexSelection.loads(vertex_selection.dumps()), vertex_selection)
+
+    def test_dense_round_trip(self):
+        # Many selected vertices are serialized as a bitset
+        vertex_selection = selection.VertexSelection.from_mask(np.arange(1001) % 3 == 0)
+        data = vertex_selection.to_bytes()
+
+        self.assertEqual(data[0:1], bytes(bytearray([selection.BITSET_ENCODING])))
+        loaded_selection = selection.VertexSelection.loads(vertex_selection.dumps())
+        self.assertEqual(loaded_selection, vertex_selection)
+        self.assertEqual(loaded_selection.vertex_count, 1001)
+
+    def test_empty_round_trip(self):
+        vertex_selection = selection.VertexSelection.empty(7)
+
+        self.assertEqual(selection.VertexSelection.loads(vertex_selection.dumps()), vertex_selection)
+        self.assertIsNone(selection.VertexSelection.loads(''))
@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-symmesh symmetry table
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import unittest
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import symmetry
+
+POINTS = np.array([
+    [1.0, 0.0, 0.0],
+    [-1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [2.0, 1.0, 0.0],
+    [-2.0, 1.0, 0.0],
+    [3.0, 0.0, 0.0]
+])
+
+
+class SymmetryTableTests(unittest.TestCase):
+
+    def setUp(self):
+        self._table = symmetry.SymmetryTable.from_table(
+            POINTS, [[0, 1], [3, 4]], [2], [5], axis=0, tolerance=0.01, mid=0.0,
+            fingerprint=symmetry.get_topology_fingerprint(len(POINTS)))
+
+    def _assert_tables_equal(self, table, other_table):
+        np.testing.assert_array_equal(table.pairs, other_table.pairs)
+        np.testing.assert_array_equal(table.sides, other_table.sides)
+        self.assertEqual(table.axis, other_table.axis)
+        self.assertEqual(table.tolerance, other_table.tolerance)
+        self.assertEqual(table.mid, other_table.mid)
+        self.assertEqual(table.fingerprint, other_table.fingerprint)
+        self.assertEqual(table.get_digest(), other_table.get_digest())
+
+    def test_sides(self):
+        self.assertEqual(self._table.vertex_count, 6)
+        np.testing.assert_array_equal(self._table.seam, [2])
+        np.testing.assert_array_equal(self._table.asymmetric, [5])
+        self.assertFalse(self._table.is_symmetric)
+        np.testing.assert_array_equal(
+            self._table.get_side_mask(symmetry.SIDE_NEGATIVE | symmetry.SIDE_SEAM),
+            [False, True, True, False, True, False])
+
+    def test_mirror_map(self):
+        np.testing.assert_array_equal(self._table.mirror_map, [1, 0, 2, 4, 3, -1])
+
+    def test_dumps_loads(self):
+        data = self._table.dumps()
+        self.assertIsInstance(data, str)
+        self._assert_tables_equal(symmetry.SymmetryTable.loads(data), self._table)
+        self.assertIsNone(symmetry.SymmetryTable.loads(''))
+
+    def test_bytes_round_trip(self):
+        self._assert_tables_equal(symmetry.SymmetryTable.from_bytes(self._table.to_bytes()), self._table)
+
+    def test_table_without_pairs(self):
+        # Tables without pairs are valid tables: they must not be confused with missing tables
+        table = symmetry.SymmetryTable.from_table(POINTS[[2]], np.zeros((0, 2)), [0], [], axis=0)
+        loaded_table = symmetry.SymmetryTable.loads(table.dumps())
+
+        self.assertEqual(len(loaded_table), 0)
+        self.assertIsNotNone(loaded_table)
+        self.assertTrue(loaded_table.is_symmetric)
+        self._assert_tables_equal(loaded_table, table)
+
+    def test_matches(self):
+        self.assertTrue(self._table.matches(6))
+        self.assertTrue(self._table.matches(6, fingerprint=symmetry.get_topology_fingerprint(6)))
+        self.assertFalse(self._table.matches(7))
+        self.assertFalse(self._table.matches(6, fingerprint=symmetry.get_topology_fingerprint(6, [3], [0, 1, 2])))
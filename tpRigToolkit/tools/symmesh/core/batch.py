@@ -0,0 +1,250 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tpRigToolkit-tools-symmesh offline command-line batch symmetry tool
+Checks symmetry of OBJ files without launching any DCC and optionally writes mirrored or flipped meshes
+
+Usage:
+    symmesh-batch assets/ character.obj --axis YZ --tolerance 0.001 --mirror --output-directory mirrored/
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import logging
+import argparse
+import traceback
+import functools
+import multiprocessing
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import consts, engine, objio, cache
+
+logger = logging.getLogger(consts.TOOL_ID)
+
+OBJ_EXTENSION = '.obj'
+AUTO_AXIS = 'AUTO'
+
+
+def find_obj_files(paths):
+    """
+    Returns all OBJ files found in the given paths. Directories are walked recursively.
+    :param paths: list(str), list of OBJ files or directories
+    :return: list(str)
+    """
+
+    obj_files = list()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, file_names in os.walk(path):
+                for file_name in sorted(file_names):
+                    if os.path.splitext(file_name)[-1].lower() == OBJ_EXTENSION:
+                        obj_files.append(os.path.join(root, file_name))
+        elif os.path.isfile(path):
+            obj_files.append(path)
+        else:
+            logger.warning('OBJ file or directory does not exists: "{}"'.format(path))
+
+    return obj_files
+
+
+def process_obj_file(
+        file_path, axis=0, tolerance=0.001, use_pivot=True, neg_to_pos=False, mirror=False, flip=False,
+        output_directory=None, memory_map=False, cache_directory=None, precheck=False, min_score=0.9,
+        per_shell=False, topology=False):
+    """
+    Checks symmetry of the given OBJ file and optionally writes its mirrored or flipped version
+    :param file_path: str, path of the OBJ file
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY). If -1, mirror axis is detected automatically.
+    :param tolerance: float
+    :param use_pivot: bool, whether to use world origin as mirror plane origin or the bounding box center
+    :param neg_to_pos: bool, whether to mirror from negative side to positive side
+    :param mirror: bool, whether to write mirrored mesh
+    :param flip: bool, whether to write flipped mesh
+    :param output_directory: str or None, directory where mirrored/flipped meshes are written. If not given, meshes
+        are written next to the source file
+    :param memory_map: bool, whether or not point arrays are spilled to .npy files and memory-mapped
+    :param cache_directory: str or None, directory where .npy files are stored. If not given, a temporary directory
+        is used
+    :param precheck: bool, whether or not clearly asymmetric meshes are rejected with a quick pre-check before
+        building their symmetry table. Pre-check is skipped when mirrored or flipped meshes are written.
+    :param min_score: float, minimum fraction of symmetric vertices used by pre-check
+    :param per_shell: bool, whether or not vertices are only matched inside shells and their mirror shells
+    :param topology: bool, whether or not symmetry table is built walking mesh connectivity from the edges that lie on
+        the mirror plane instead of matching vertex positions
+    :return: dict, symmetry report of the OBJ file
+    """
+
+    report = {'path': file_path, 'success': False}
+    point_cache = cache.PointCache(memory_map=memory_map, directory=cache_directory)
+
+    try:
+        obj_mesh = objio.read_obj(
+            file_path, read_faces=per_shell or topology,
+            allocate_points=functools.partial(point_cache.create, '{}_points'.format(file_path)))
+        points = obj_mesh.points
+        if axis == -1:
+            axis, _ = engine.detect_mirror_axis(points, tolerance=tolerance, use_pivot=use_pivot)
+            report['axis'] = consts.AXIS[axis]
+        mid = engine.get_mid(points, axis, use_pivot=use_pivot)
+        if precheck and not mirror and not flip:
+            plausible, _ = engine.precheck_symmetry(
+                points, axis=axis, tolerance=tolerance, mid=mid, min_score=min_score)
+            if not plausible:
+                report.update({'vertices': len(points), 'is_symmetric': False, 'rejected': True, 'success': True})
+                return report
+        if topology:
+            seam_edges = engine.find_seam_edges(
+                points, obj_mesh.face_counts, obj_mesh.face_vertices, axis=axis, tolerance=tolerance, mid=mid)
+            pairs, seam, asymmetric = engine.build_topology_symmetry_table(
+                points, obj_mesh.face_counts, obj_mesh.face_vertices, seam_edges, axis=axis, mid=mid)
+        elif per_shell:
+            shells = engine.get_shells(obj_mesh.vertex_count, obj_mesh.face_counts, obj_mesh.face_vertices)
+            pairs, seam, asymmetric = engine.build_shell_symmetry_table(
+                points, shells, axis=axis, tolerance=tolerance, mid=mid, processes=1)
+        else:
+            pairs, seam, asymmetric = engine.build_symmetry_table(points, axis=axis, tolerance=tolerance, mid=mid)
+        report.update({
+            'vertices': len(points),
+            'pairs': len(pairs),
+            'seam': len(seam),
+            'asymmetric': len(asymmetric),
+            'is_symmetric': not len(asymmetric)
+        })
+
+        outputs = list()
+        if mirror:
+            outputs.append(('mirrored', False))
+        if flip:
+            outputs.append(('flipped', True))
+        if outputs:
+            mirror_map = engine.get_mirror_map(pairs, seam, len(points))
+            file_directory, file_name = os.path.split(file_path)
+            output_directory = output_directory or file_directory
+            new_points = point_cache.create('{}_output'.format(file_path), points.shape)
+            for suffix, flip_points in outputs:
+                engine.mirror_points(
+                    points, points, mirror_map, axis=axis, mid=mid, base_mid=mid, tolerance=tolerance,
+                    neg_to_pos=neg_to_pos, flip=flip_points, out=new_points)
+                output_path = os.path.join(
+                    output_directory, '{}_{}{}'.format(os.path.splitext(file_name)[0], suffix, OBJ_EXTENSION))
+                changed = np.flatnonzero(np.any(new_points != points, axis=1))
+                objio.write_obj_points(file_path, new_points, output_path=output_path, indices=changed)
+                report[suffix] = output_path
+
+        report['success'] = True
+    except Exception as exc:
+        report['error'] = '{} | {}'.format(exc, traceback.format_exc())
+    finally:
+        point_cache.clear()
+
+    return report
+
+
+def run(obj_files, jobs=None, **kwargs):
+    """
+    Processes given OBJ files in parallel
+    :param obj_files: list(str), list of OBJ files to process
+    :param jobs: int or None, number of worker processes. If not given, available cores are used.
+    :param kwargs: dict, keyword arguments passed to process_obj_file function
+    :return: list(dict), symmetry reports of the OBJ files
+    """
+
+    jobs = min(jobs or multiprocessing.cpu_count(), len(obj_files))
+    process_fn = functools.partial(process_obj_file, **kwargs)
+    if jobs <= 1:
+        return [process_fn(obj_file) for obj_file in obj_files]
+
+    pool = multiprocessing.Pool(processes=jobs)
+    try:
+        return pool.map(process_fn, obj_files, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def format_report(report):
+    """
+    Returns a printable line of the given symmetry report
+    :param report: dict
+    :return: str
+    """
+
+    if not report['success']:
+        return '[ERROR] {}: {}'.format(report['path'], report.get('error', ''))
+
+    status = 'SYMMETRIC' if report['is_symmetric'] else 'ASYMMETRIC'
+    if 'axis' in report:
+        status = '{} {}'.format(status, report['axis'])
+    if report.get('rejected'):
+        return '[{}] {}: {} vertices | rejected by pre-check'.format(status, report['path'], report['vertices'])
+    line = '[{}] {}: {} vertices | {} pairs | {} seam | {} asymmetric'.format(
+        status, report['path'], report['vertices'], report['pairs'], report['seam'], report['asymmetric'])
+    for suffix in ('mirrored', 'flipped'):
+        if suffix in report:
+            line += ' | {}: {}'.format(suffix, report[suffix])
+
+    return line
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Checks symmetry of OBJ files and writes mirrored/flipped meshes')
+    parser.add_argument('paths', nargs='+', help='OBJ files or directories containing OBJ files')
+    parser.add_argument(
+        '--axis', choices=consts.AXIS + [AUTO_AXIS], default=consts.AXIS[0],
+        help='Mirror axis plane. {} detects it automatically per file'.format(AUTO_AXIS))
+    parser.add_argument('--tolerance', type=float, default=0.001, help='Symmetry tolerance')
+    parser.add_argument(
+        '--use-bounding-box', action='store_true', help='Use bounding box center as origin instead of world origin')
+    parser.add_argument('--neg-to-pos', action='store_true', help='Operate from negative side to positive side')
+    parser.add_argument('--mirror', action='store_true', help='Write mirrored meshes')
+    parser.add_argument('--flip', action='store_true', help='Write flipped meshes')
+    parser.add_argument('--output-directory', help='Directory where mirrored/flipped meshes are written')
+    parser.add_argument(
+        '--memory-map', action='store_true', help='Spill point arrays to .npy files and memory-map them')
+    parser.add_argument('--cache-directory', help='Directory where memory-mapped .npy files are stored')
+    parser.add_argument(
+        '--precheck', action='store_true',
+        help='Reject clearly asymmetric meshes with a quick pre-check instead of building their symmetry table')
+    parser.add_argument(
+        '--min-score', type=float, default=0.9,
+        help='Minimum fraction of symmetric vertices a mesh needs to pass the pre-check')
+    parser.add_argument(
+        '--per-shell', action='store_true',
+        help='Match vertices only inside shells and their mirror shells (for meshes with duplicated pieces)')
+    parser.add_argument(
+        '--topology', action='store_true',
+        help='Build symmetry tables walking mesh connectivity from the edges that lie on the mirror plane')
+    parser.add_argument('--jobs', type=int, default=None, help='Number of worker processes. Defaults to core count')
+    parsed_args = parser.parse_args(args)
+
+    obj_files = find_obj_files(parsed_args.paths)
+    if not obj_files:
+        logger.warning('No OBJ files found!')
+        return 1
+
+    if parsed_args.output_directory and not os.path.isdir(parsed_args.output_directory):
+        os.makedirs(parsed_args.output_directory)
+
+    axis = -1 if parsed_args.axis == AUTO_AXIS else consts.AXIS.index(parsed_args.axis)
+    reports = run(
+        obj_files, jobs=parsed_args.jobs, axis=axis, tolerance=parsed_args.tolerance,
+        use_pivot=not parsed_args.use_bounding_box, neg_to_pos=parsed_args.neg_to_pos, mirror=parsed_args.mirror,
+        flip=parsed_args.flip, output_directory=parsed_args.output_directory, memory_map=parsed_args.memory_map,
+        cache_directory=parsed_args.cache_directory, precheck=parsed_args.precheck, min_score=parsed_args.min_score,
+        per_shell=parsed_args.per_shell, topology=parsed_args.topology)
+
+    for report in reports:
+        print(format_report(report))
+    total_asymmetric = len([report for report in reports if report['success'] and not report['is_symmetric']])
+    total_errors = len([report for report in reports if not report['success']])
+    print('{} file(s) processed | {} asymmetric | {} error(s)'.format(len(reports), total_asymmetric, total_errors))
+
+    return 1 if total_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
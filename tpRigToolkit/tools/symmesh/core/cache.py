@@ -0,0 +1,216 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains point array caches used by tpRigToolkit-tools-symmesh
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+import shutil
+import logging
+import tempfile
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import consts
+
+logger = logging.getLogger(consts.TOOL_ID)
+
+
+class PointCache(object):
+    """
+    Class that stores point arrays by key
+    If memory mapping is enabled, arrays are spilled to .npy files and memory-mapped, so working sets of very large
+    meshes are paged on demand instead of living in RAM.
+    """
+
+    def __init__(self, memory_map=False, directory=None, min_vertices=0):
+        """
+        :param memory_map: bool, whether or not arrays should be spilled to .npy files and memory-mapped
+        :param directory: str or None, directory where .npy files are stored. If not given, a temporary directory is
+            created when needed.
+        :param min_vertices: int, arrays with less points than this value are always kept in memory
+        """
+
+        super(PointCache, self).__init__()
+
+        self._memory_map = memory_map
+        self._directory = directory
+        self._temp_directory = None
+        self._min_vertices = min_vertices
+        self._arrays = dict()
+        self._paths = dict()
+        self._file_index = 0
+
+    def __contains__(self, key):
+        return key in self._arrays
+
+    def __len__(self):
+        return len(self._arrays)
+
+    @property
+    def memory_map(self):
+        return self._memory_map
+
+    @property
+    def directory(self):
+        if self._directory:
+            return self._directory
+        if not self._temp_directory:
+            self._temp_directory = tempfile.mkdtemp(prefix='symmesh_cache_')
+
+        return self._temp_directory
+
+    def get(self, key, default=None):
+        """
+        Returns the array stored with the given key
+        :param key: str
+        :param default: object, value returned if no array is stored with given key
+        :return: np.array or np.memmap
+        """
+
+        return self._arrays.get(key, default)
+
+    def create(self, key, shape, dtype=np.float64):
+        """
+        Creates a new writable array with the given key and shape. Previous array stored with the same key is removed.
+        :param key: str
+        :param shape: tuple(int)
+        :param dtype: np.dtype
+        :return: np.array or np.memmap
+        """
+
+        self.remove(key)
+
+        if not self._use_memory_map(shape):
+            array = np.empty(shape, dtype=dtype)
+        else:
+            path = self._get_path(key)
+            array = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=tuple(shape))
+            self._paths[key] = path
+        self._arrays[key] = array
+
+        return array
+
+    def store(self, key, points):
+        """
+        Stores a copy of the given points with the given key
+        :param key: str
+        :param points: np.array
+        :return: np.array or np.memmap, stored array
+        """
+
+        points = np.asarray(points)
+        if not self._use_memory_map(points.shape):
+            self.remove(key)
+            array = self._arrays[key] = np.array(points, copy=True)
+            return array
+
+        array = self.create(key, points.shape, dtype=points.dtype)
+        array[:] = points
+        array.flush()
+
+        return array
+
+    def remove(self, key):
+        """
+        Removes the array stored with the given key and its .npy file, if any
+        :param key: str
+        """
+
+        self._arrays.pop(key, None)
+        path = self._paths.pop(key, None)
+        if not path:
+            return
+
+        # On Windows, file cannot be removed while memory map is still referenced
+        try:
+            os.remove(path)
+        except OSError as exc:
+            logger.debug('Impossible to remove point cache file "{}": {}'.format(path, exc))
+
+    def clear(self):
+        """
+        Removes all stored arrays and their .npy files
+        """
+
+        for key in list(self._arrays.keys()):
+            self.remove(key)
+        if self._temp_directory:
+            shutil.rmtree(self._temp_directory, ignore_errors=True)
+            self._temp_directory = None
+
+    def _use_memory_map(self, shape):
+        """
+        Internal function that returns whether or not an array with given shape should be memory-mapped
+        :param shape: tuple(int)
+        :return: bool
+        """
+
+        return self._memory_map and shape[0] >= self._min_vertices
+
+    def _get_path(self, key):
+        """
+        Internal function that returns the .npy file path used to store the array with the given key
+        :param key: str
+        :return: str
+        """
+
+        directory = self.directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        file_name = re.sub(r'[^\w\-]+', '_', str(key)).strip('_') or 'points'
+        self._file_index += 1
+
+        return os.path.join(directory, '{}_{}.npy'.format(file_name, self._file_index))
+
+
+class GeometrySnapshot(object):
+    """
+    Class that stores a snapshot of the geometry data that is reused between commands: object and world space points,
+    world bounding box, world pivot, vertex shells, edges and topology fingerprint (computed when they are needed
+    for the first time).
+    Snapshot is marked as dirty when the geometry changes, so it is taken again the next time it is requested.
+    """
+
+    __slots__ = ('geo', 'points', 'world_points', 'bounding_box', 'pivot', 'shells', 'edges', 'fingerprint', 'dirty',
+                 'callbacks')
+
+    def __init__(self, geo, points, world_points, bounding_box, pivot):
+        self.geo = geo
+        self.points = points
+        self.world_points = world_points
+        self.bounding_box = list(bounding_box)
+        self.pivot = list(pivot)
+        self.shells = None
+        self.edges = None
+        self.fingerprint = None
+        self.dirty = False
+        self.callbacks = list()
+
+    @property
+    def vertex_count(self):
+        return len(self.points)
+
+    def get_mid(self, axis, use_pivot=True):
+        """
+        Returns the position of the mirror plane along the given axis
+        :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+        :param use_pivot: bool, whether to use the pivot as origin or the bounding box center
+        :return: float
+        """
+
+        if use_pivot:
+            return self.pivot[axis]
+
+        return self.bounding_box[axis] + ((self.bounding_box[axis + 3] - self.bounding_box[axis]) / 2)
+
+    def set_dirty(self, *args):
+        """
+        Marks snapshot as dirty. Can be used as DCC change callback.
+        """
+
+        self.dirty = True
@@ -9,11 +9,39 @@ from __future__ import print_function, division, absolute_import
 
 from tpDcc.core import client
 
+from tpRigToolkit.tools.symmesh.core import symmetry, selection
+
 
 class SymmeshClient(client.DccClient, object):
 
     PORT = 25221
 
+    def set_profiling(self, count=1, output_directory=None):
+        cmd = {
+            'cmd': 'set_profiling',
+            'count': count,
+            'output_directory': output_directory
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return 0
+
+        return reply_dict['result']
+
+    def set_snapshot_cache(self, memory_map=False, directory=None, min_vertices=0):
+        cmd = {
+            'cmd': 'set_snapshot_cache',
+            'memory_map': memory_map,
+            'directory': directory,
+            'min_vertices': min_vertices
+        }
+
+        reply_dict = self.send(cmd)
+
+        return self.is_valid_reply(reply_dict)
+
     def get_selected_info(self):
         cmd = {
             'cmd': 'get_selected_info'
@@ -22,11 +50,38 @@ class SymmeshClient(client.DccClient, object):
         reply_dict = self.send(cmd)
 
         if not self.is_valid_reply(reply_dict):
-            return ['', list()]
+            return '', None
+
+        selected_geo, selected_vertices = reply_dict['result']
+
+        return selected_geo, selection.VertexSelection.loads(selected_vertices)
+
+    def set_base_geo(self, base_geo):
+        cmd = {
+            'cmd': 'set_base_geo',
+            'base_geo': base_geo
+        }
+
+        reply_dict = self.send(cmd)
+
+        return self.is_valid_reply(reply_dict)
+
+    def detect_mirror_axis(self, geo, tolerance, use_pivot):
+        cmd = {
+            'cmd': 'detect_mirror_axis',
+            'geo': geo,
+            'tolerance': tolerance,
+            'use_pivot': use_pivot
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return -1, list()
 
         return reply_dict['result']
 
-    def check_symmetry(self, geo, axis, tolerance, table, use_pivot, select_asymmetric_vertices):
+    def check_symmetry(self, geo, axis, tolerance, table, use_pivot, select_asymmetric_vertices, topology=False):
         cmd = {
             'cmd': 'check_symmetry',
             'geo': geo,
@@ -34,13 +89,51 @@ class SymmeshClient(client.DccClient, object):
             'tolerance': tolerance,
             'table': table,
             'use_pivot': use_pivot,
-            'select_asymmetric_vertices': select_asymmetric_vertices
+            'select_asymmetric_vertices': select_asymmetric_vertices,
+            'topology': topology
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return None, None, False
+
+        non_symm_verts, symmetry_table, is_symmetric = reply_dict['result']
+
+        return (
+            selection.VertexSelection.loads(non_symm_verts), symmetry.SymmetryTable.loads(symmetry_table), is_symmetric)
+
+    def get_tolerance_counts(self, geo, axis, tolerance, use_pivot):
+        cmd = {
+            'cmd': 'get_tolerance_counts',
+            'geo': geo,
+            'axis': axis,
+            'tolerance': tolerance,
+            'use_pivot': use_pivot
         }
 
         reply_dict = self.send(cmd)
 
         if not self.is_valid_reply(reply_dict):
-            return list(), list(), False
+            return -1, -1
+
+        return reply_dict['result']
+
+    def check_symmetry_batch(self, geos, axis, tolerance, use_pivot, table=False, precheck=False):
+        cmd = {
+            'cmd': 'check_symmetry_batch',
+            'geos': geos,
+            'axis': axis,
+            'tolerance': tolerance,
+            'use_pivot': use_pivot,
+            'table': table,
+            'precheck': precheck
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
 
         return reply_dict['result']
 
@@ -55,26 +148,28 @@ class SymmeshClient(client.DccClient, object):
         reply_dict = self.send(cmd)
 
         if not self.is_valid_reply(reply_dict):
-            return list()
+            return None
 
-        return reply_dict['result']
+        return selection.VertexSelection.loads(reply_dict['result'])
 
-    def selection_mirror(self, geo, vertices, symmetry_table):
+    def selection_mirror(self, geo, vertices, symmetry_table, mode=selection.REPLACE_MODE):
         cmd = {
             'cmd': 'selection_mirror',
             'geo': geo,
-            'selected_vertices': vertices,
-            'symmetry_table': symmetry_table
+            'selected_vertices': vertices.dumps() if vertices is not None else '',
+            'symmetry_table': symmetry_table.dumps() if symmetry_table is not None else '',
+            'mode': mode
         }
 
         reply_dict = self.send(cmd)
 
         if not self.is_valid_reply(reply_dict):
-            return list()
+            return None
 
-        return reply_dict['result']
+        return selection.VertexSelection.loads(reply_dict['result'])
 
-    def get_side_selected_vertices(self, geo, base_geo, axis, select_negative, use_pivot, tolerance):
+    def get_side_selected_vertices(
+            self, geo, base_geo, axis, select_negative, use_pivot, tolerance, symmetry_table=None):
         cmd = {
             'cmd': 'get_side_selected_vertices',
             'geo': geo,
@@ -83,28 +178,31 @@ class SymmeshClient(client.DccClient, object):
             'select_negative': select_negative,
             'use_pivot': use_pivot,
             'tolerance': tolerance,
+            'symmetry_table': symmetry_table.dumps() if symmetry_table is not None else ''
         }
 
         reply_dict = self.send(cmd)
 
         if not self.is_valid_reply(reply_dict):
-            return list()
+            return None
 
-        return reply_dict['result']
+        return selection.VertexSelection.loads(reply_dict['result'])
 
     def mirror_selected(
-            self, geo, base_geo, selected_vertices, axis, select_negative, use_pivot, tolerance, flip, symmetry_table):
+            self, geo, base_geo, selected_vertices, axis, select_negative, use_pivot, tolerance, flip, symmetry_table,
+            soft_selection=False):
         cmd = {
             'cmd': 'mirror_selected',
             'geo': geo,
             'base_geo': base_geo,
-            'selected_vertices': selected_vertices,
+            'selected_vertices': selected_vertices.dumps() if selected_vertices is not None else '',
             'axis': axis,
             'neg_to_pos': select_negative,
             'use_pivot': use_pivot,
             'tolerance': tolerance,
             'flip': flip,
-            'symmetry_table': symmetry_table
+            'symmetry_table': symmetry_table.dumps() if symmetry_table is not None else '',
+            'soft_selection': soft_selection
         }
 
         reply_dict = self.send(cmd)
@@ -114,13 +212,55 @@ class SymmeshClient(client.DccClient, object):
 
         return reply_dict['success']
 
-    def revert_selected_to_base(self, geo, base_geo, selected_vertices, bias):
+    def symmetrize_selected(self, geo, base_geo, selected_vertices, axis, use_pivot, tolerance, symmetry_table):
+        cmd = {
+            'cmd': 'symmetrize_selected',
+            'geo': geo,
+            'base_geo': base_geo,
+            'selected_vertices': selected_vertices.dumps() if selected_vertices is not None else '',
+            'axis': axis,
+            'use_pivot': use_pivot,
+            'tolerance': tolerance,
+            'symmetry_table': symmetry_table.dumps() if symmetry_table is not None else ''
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return False
+
+        return reply_dict['success']
+
+    def mirror_targets(
+            self, targets, base_geo, axis, select_negative, use_pivot, tolerance, flip, symmetry_table, deltas=False):
+        cmd = {
+            'cmd': 'mirror_targets',
+            'targets': targets,
+            'base_geo': base_geo,
+            'axis': axis,
+            'neg_to_pos': select_negative,
+            'use_pivot': use_pivot,
+            'tolerance': tolerance,
+            'flip': flip,
+            'symmetry_table': symmetry_table.dumps() if symmetry_table is not None else '',
+            'deltas': deltas
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict['result']
+
+    def revert_selected_to_base(self, geo, base_geo, selected_vertices, bias, soft_selection=False):
         cmd = {
             'cmd': 'revert_selected_to_base',
             'geo': geo,
             'base_geo': base_geo,
-            'selected_vertices': selected_vertices,
-            'bias': bias
+            'selected_vertices': selected_vertices.dumps() if selected_vertices is not None else '',
+            'bias': bias,
+            'soft_selection': soft_selection
         }
 
         reply_dict = self.send(cmd)
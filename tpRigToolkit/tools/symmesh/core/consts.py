@@ -8,9 +8,15 @@ Module that contains consts definitions used by tpRigToolkit-tools-symmesh
 TOOL_ID = 'tpRigToolkit-tools-symmesh'
 
 AXIS = ['YZ', 'XZ', 'XY']
+SELECTION_MIRROR_MODES = ['Replace', 'Add', 'Toggle', 'Intersect']
 MATCH_STR = 'm'
 MID_OFFSET_TOLERANCE = -.0000001
 MAX_PROGRESS_BAR_THRESHOLD = 800
+TOLERANCE_SWEEP_RANGE = 0.01
+MAX_ASSIGNMENT_GROUP_SIZE = 64
+EXACT_MATCH_FACTOR = 0.01
+SHELL_MATCH_FACTOR = 0.1
+MAX_SET_POINT_VERTICES = 1000
 
 
 def get_mirror_vertex_index(symmetry_table, vertex_index):
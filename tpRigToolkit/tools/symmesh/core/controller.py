@@ -25,14 +25,38 @@ class SymmeshController(object):
     def client(self):
         return self._client()
 
+    def set_mirror_axis(self, axis):
+        if axis == self._model.mirror_axis:
+            return
+        self._model.mirror_axis = axis
+        self.clear_selection()
+        self.update_tolerance_counts()
+
+    def set_auto_mirror_axis(self, flag):
+        self._model.auto_mirror_axis = flag
+
     def set_global_tolerance(self, tolerance_value):
         self._model.global_tolerance = tolerance_value
+        self.update_tolerance_counts()
 
     def set_operate_positive_to_negative_x_axis(self, flag):
         self._model.operate_from_positive_to_negative_x_axis = flag
 
     def set_use_pivot_as_origin(self, flag):
         self._model.use_pivot_as_origin = flag
+        self.update_tolerance_counts()
+
+    def set_topology_symmetry(self, flag):
+        self._model.topology_symmetry = flag
+
+    def set_mirror_deltas(self, flag):
+        self._model.mirror_deltas = flag
+
+    def set_selection_mirror_mode(self, mode):
+        self._model.selection_mirror_mode = mode
+
+    def set_use_soft_selection(self, flag):
+        self._model.use_soft_selection = flag
 
     def set_revert_bias(self, value):
         self._model.revert_bias = value
@@ -52,22 +76,71 @@ class SymmeshController(object):
 
         self._model.base_geo = selected_geo
         self._model.selected_vertices = selected_vertices
+        self.client.set_base_geo(selected_geo)
+
+        if self._model.auto_mirror_axis:
+            axis, _ = self.client.detect_mirror_axis(
+                geo=selected_geo, tolerance=self._model.global_tolerance, use_pivot=self._model.use_pivot_as_origin)
+            if axis != -1:
+                self._model.mirror_axis = axis
 
         _, symmetry_table, is_symmetric = self.check_symmetry(table=True, select_asymmetric_vertices=False)
         self._model.symmetry_table = symmetry_table
         self._model.is_symmetric = is_symmetric
+        self.update_tolerance_counts()
 
         return True
 
+    def update_tolerance_counts(self):
+        """
+        Updates the number of base geometry vertices that are matched and unmatched with current global tolerance
+        """
+
+        base_geo = self._model.base_geo
+        if not base_geo:
+            self._model.tolerance_counts = (-1, -1)
+            return
+
+        self._model.tolerance_counts = self.client.get_tolerance_counts(
+            geo=base_geo, axis=self._model.mirror_axis, tolerance=self._model.global_tolerance,
+            use_pivot=self._model.use_pivot_as_origin)
+
     def check_symmetry(self, table=True, select_asymmetric_vertices=True):
         selected_geo = self._model.base_geo
         axis = self._model.mirror_axis
         tolerance = self._model.global_tolerance
         use_pivot = self._model.use_pivot_as_origin
+        topology = self._model.topology_symmetry
 
         return self.client.check_symmetry(
             geo=selected_geo, axis=axis, tolerance=tolerance, table=table, use_pivot=use_pivot,
-            select_asymmetric_vertices=select_asymmetric_vertices)
+            select_asymmetric_vertices=select_asymmetric_vertices, topology=topology)
+
+    def check_symmetry_batch(self, geos=None):
+        """
+        Checks symmetry of the given geometries (or selected geometries) in one request and logs a summary per geometry
+        :param geos: list(str) or None
+        :return: list(dict)
+        """
+
+        axis = self._model.mirror_axis
+        tolerance = self._model.global_tolerance
+        use_pivot = self._model.use_pivot_as_origin
+
+        summaries = self.client.check_symmetry_batch(
+            geos=geos or list(), axis=axis, tolerance=tolerance, use_pivot=use_pivot, precheck=True)
+        for summary in summaries:
+            if not summary.get('success', False):
+                logger.warning('{}: {}'.format(summary['geo'], summary.get('msg', 'Impossible to check symmetry')))
+            elif summary['is_symmetric']:
+                logger.info('{}: symmetrical ({} vertices)'.format(summary['geo'], summary['vertices']))
+            elif summary.get('rejected', False):
+                logger.warning('{}: clearly asymmetric ({} vertices)'.format(summary['geo'], summary['vertices']))
+            else:
+                logger.warning('{}: {} asymmetric vert(s) of {}'.format(
+                    summary['geo'], summary['asymmetric'], summary['vertices']))
+
+        return summaries
 
     def select_moved_vertices(self):
         selected_geo, selected_vertices = self.client.get_selected_info()
@@ -83,16 +156,17 @@ class SymmeshController(object):
 
     def selection_mirror(self):
         selected_geo, selected_vertices = self.client.get_selected_info()
-        if not selected_geo or not selected_vertices:
+        if not selected_geo:
             return False
 
         symmetry_table = self._model.symmetry_table
 
-        if not symmetry_table:
+        if symmetry_table is None:
             logger.warning('No Base Geometry Selected!')
             return selected_vertices
 
-        mirror_vertices = self.client.selection_mirror(selected_geo, selected_vertices, symmetry_table)
+        mirror_vertices = self.client.selection_mirror(
+            selected_geo, selected_vertices, symmetry_table, mode=self._model.selection_mirror_mode)
 
         return mirror_vertices
 
@@ -102,7 +176,7 @@ class SymmeshController(object):
             return
 
         symmetry_table = self._model.symmetry_table
-        if not symmetry_table:
+        if symmetry_table is None:
             logger.warning('No Base Geometry Selected!')
             return selected_vertices
 
@@ -115,7 +189,7 @@ class SymmeshController(object):
         return self.client.mirror_selected(
             geo=selected_geo, base_geo=base_geo, selected_vertices=selected_vertices, axis=axis,
             select_negative=neg_to_pos, use_pivot=use_pivot, tolerance=tolerance, flip=False,
-            symmetry_table=symmetry_table)
+            symmetry_table=symmetry_table, soft_selection=self._model.use_soft_selection)
 
     def flip_selected(self):
         selected_geo, selected_vertices = self.client.get_selected_info()
@@ -123,7 +197,7 @@ class SymmeshController(object):
             return
 
         symmetry_table = self._model.symmetry_table
-        if not symmetry_table:
+        if symmetry_table is None:
             logger.warning('No Base Geometry Selected!')
             return selected_vertices
 
@@ -136,12 +210,61 @@ class SymmeshController(object):
         if not selected_vertices:
             selected_vertices = self.client.get_side_selected_vertices(
                 geo=selected_geo, base_geo=base_geo, axis=axis, select_negative=neg_to_pos,
-                use_pivot=use_pivot, tolerance=tolerance)
+                use_pivot=use_pivot, tolerance=tolerance, symmetry_table=symmetry_table)
 
         return self.client.mirror_selected(
             geo=selected_geo, base_geo=base_geo, selected_vertices=selected_vertices, axis=axis,
             select_negative=neg_to_pos, use_pivot=use_pivot, tolerance=tolerance, flip=True,
-            symmetry_table=symmetry_table)
+            symmetry_table=symmetry_table, soft_selection=self._model.use_soft_selection)
+
+    def symmetrize_selected(self):
+        selected_geo, selected_vertices = self.client.get_selected_info()
+        if not selected_geo:
+            return
+
+        symmetry_table = self._model.symmetry_table
+        if symmetry_table is None:
+            logger.warning('No Base Geometry Selected!')
+            return selected_vertices
+
+        base_geo = self._model.base_geo
+        axis = self._model.mirror_axis
+        tolerance = self._model.global_tolerance
+        use_pivot = self._model.use_pivot_as_origin
+
+        return self.client.symmetrize_selected(
+            geo=selected_geo, base_geo=base_geo, selected_vertices=selected_vertices, axis=axis, use_pivot=use_pivot,
+            tolerance=tolerance, symmetry_table=symmetry_table)
+
+    def mirror_targets(self, targets=None, flip=False):
+        """
+        Mirrors (or flips) given target geometries (or selected ones) using base geometry symmetry table
+        :param targets: list(str) or None
+        :param flip: bool
+        :return: list(str), list of mirrored targets
+        """
+
+        symmetry_table = self._model.symmetry_table
+        if symmetry_table is None:
+            logger.warning('No Base Geometry Selected!')
+            return list()
+
+        base_geo = self._model.base_geo
+        axis = self._model.mirror_axis
+        tolerance = self._model.global_tolerance
+        use_pivot = self._model.use_pivot_as_origin
+        neg_to_pos = self._model.operate_from_positive_to_negative_x_axis
+        mirror_deltas = self._model.mirror_deltas
+
+        return self.client.mirror_targets(
+            targets=targets or list(), base_geo=base_geo, axis=axis, select_negative=neg_to_pos,
+            use_pivot=use_pivot, tolerance=tolerance, flip=flip, symmetry_table=symmetry_table, deltas=mirror_deltas)
+
+    def mirror_selected_targets(self):
+        return self.mirror_targets(flip=False)
+
+    def flip_selected_targets(self):
+        return self.mirror_targets(flip=True)
 
     def revert_selected_to_base(self):
         selected_geo, selected_vertices = self.client.get_selected_info()
@@ -157,10 +280,11 @@ class SymmeshController(object):
         if not selected_vertices:
             selected_vertices = self.client.get_side_selected_vertices(
                 geo=selected_geo, base_geo=base_geo, axis=axis, select_negative=2,
-                use_pivot=use_pivot, tolerance=tolerance)
+                use_pivot=use_pivot, tolerance=tolerance, symmetry_table=self._model.symmetry_table)
 
         return self.client.revert_selected_to_base(
-            geo=selected_geo, base_geo=base_geo, selected_vertices=selected_vertices, bias=revert_bias)
+            geo=selected_geo, base_geo=base_geo, selected_vertices=selected_vertices, bias=revert_bias,
+            soft_selection=self._model.use_soft_selection)
 
     def clear_selection(self):
         """
@@ -169,5 +293,6 @@ class SymmeshController(object):
 
         self._model.base_geo = ''
         self._model.alt_base_geo = ''
-        self._model.symmetry_table = list()
+        self._model.selected_vertices = None
+        self._model.symmetry_table = None
         self._model.is_symmetric = False
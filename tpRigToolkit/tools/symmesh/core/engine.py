@@ -0,0 +1,1545 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC independent symmetry engine used by tpRigToolkit-tools-symmesh
+Geometry is represented as NumPy arrays of points with shape (N, 3)
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import collections
+import multiprocessing
+from multiprocessing import pool
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import consts
+
+
+def get_mid(points, axis, use_pivot=True, pivot=None):
+    """
+    Returns the position of the mirror plane along the given axis
+    :param points: np.array, (N, 3) array of points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param use_pivot: bool, whether to use the pivot as origin or the bounding box center
+    :param pivot: list(float, float, float) or None, pivot position. If not given origin is used.
+    :return: float
+    """
+
+    if use_pivot:
+        return float(pivot[axis]) if pivot is not None else 0.0
+
+    points = np.asarray(points)
+    if not len(points):
+        return 0.0
+    column = points[:, axis]
+
+    return float(column.min() + (column.max() - column.min()) / 2.0)
+
+
+def transform_points(points, matrix):
+    """
+    Transforms given points by the given 4x4 matrix with a single matrix multiplication
+    Matrix follows row-vector convention (translation stored in the last row), as Maya matrices do.
+    :param points: np.array, (N, 3) array of points
+    :param matrix: np.array, (4, 4) transformation matrix
+    :return: np.array, (N, 3) array of transformed points
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    matrix = np.asarray(matrix, dtype=np.float64).reshape(4, 4)
+
+    return np.dot(points, matrix[:3, :3]) + matrix[3, :3]
+
+
+def get_sample_indices(vertex_count, sample_size=1000):
+    """
+    Returns evenly distributed vertex indices used to compute quick sampled scores
+    :param vertex_count: int
+    :param sample_size: int, maximum number of samples
+    :return: np.array
+    """
+
+    if vertex_count <= sample_size:
+        return np.arange(vertex_count)
+
+    return np.linspace(0, vertex_count - 1, sample_size).astype(np.int64)
+
+
+def get_mirror_match_score(points, axis=0, tolerance=0.001, mid=0.0, sample_size=1000):
+    """
+    Returns the fraction of sampled vertices whose mirrored position matches a vertex of the given points
+    Sampled vertices that lie on the mirror plane are skipped, as they always match themselves. If all of them lie on
+    the mirror plane, geometry is symmetric and score is 1.
+    :param points: np.array, (N, 3) array of points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :param sample_size: int, maximum number of sampled vertices
+    :return: float, score between 0 and 1
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    if not len(points):
+        return 0.0
+
+    samples = points[get_sample_indices(len(points), sample_size)]
+    samples = samples[np.abs(samples[:, axis] - mid) >= tolerance]
+    if not len(samples):
+        return 1.0
+    samples[:, axis] = 2 * mid - samples[:, axis]
+    matched, _ = _get_grid_candidates(samples, points, tolerance)
+
+    return float(np.count_nonzero(np.bincount(matched, minlength=len(samples)))) / len(samples)
+
+
+def detect_mirror_axis(points, tolerance=0.001, use_pivot=True, pivot=None, sample_size=1000):
+    """
+    Detects the mirror axis of the given points evaluating YZ, XZ and XY planes with a quick sampled match score
+    An axis whose sampled vertices all lie on its mirror plane is degenerate: those vertices match themselves, so a flat
+    geometry would always be detected as symmetric across the plane it lies on, even if it is not symmetric at all.
+    Degenerate axes score 0. Axes with the same score are sorted by the fraction of sampled vertices that lie off their
+    mirror plane.
+    :param points: np.array, (N, 3) array of points
+    :param tolerance: float
+    :param use_pivot: bool, whether to use the pivot as origin or the bounding box center
+    :param pivot: list(float, float, float) or None, pivot position. If not given origin is used.
+    :param sample_size: int, maximum number of sampled vertices
+    :return: tuple(int, list(float)), best mirror axis index and match score of each axis
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    samples = points[get_sample_indices(len(points), sample_size)]
+
+    scores = list()
+    off_plane_ratios = list()
+    for axis in range(len(consts.AXIS)):
+        mid = get_mid(points, axis, use_pivot=use_pivot, pivot=pivot)
+        off_plane_ratio = float(np.mean(np.abs(samples[:, axis] - mid) >= tolerance)) if len(samples) else 0.0
+        off_plane_ratios.append(off_plane_ratio)
+        if not off_plane_ratio:
+            scores.append(0.0)
+            continue
+        scores.append(get_mirror_match_score(points, axis=axis, tolerance=tolerance, mid=mid, sample_size=sample_size))
+    best_axis = max(range(len(scores)), key=lambda i: (scores[i], off_plane_ratios[i]))
+
+    return best_axis, scores
+
+
+def build_symmetry_table(points, axis=0, tolerance=0.001, mid=0.0, shells=None, shell_map=None):
+    """
+    Builds symmetry table of the given points
+    Vertices are split in positive and negative sides and each positive vertex is matched with the negative vertex
+    whose mirrored position is within tolerance. Vertices that share a cell of a tolerance sized integer grid with the
+    mirrored position of a single vertex are paired first with a hash join, so exactly symmetric geometries do not need
+    any tolerance search. Candidates of the rest of positive vertices are searched in the 27 grid cells around them.
+    Positive and negative vertices that compete for the same candidates form a conflict group and each conflict group
+    is resolved with a minimum cost assignment, so the table does not depend on vertex order and dense areas get the
+    closest pairs instead of the first ones found.
+    :param points: np.array, (N, 3) array of points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float, maximum distance allowed between a vertex and the mirrored position of its partner
+    :param mid: float, position of the mirror plane along the mirror axis
+    :param shells: np.array or None, shell index of each vertex. If given (with shell_map), vertices are matched
+        inside shells and their mirror shells first and vertices left unmatched are matched with any vertex.
+    :param shell_map: np.array or None, mirror shell of each shell (see match_shells)
+    :return: tuple(np.array, np.array, np.array), (K, 2) array of positive/negative vertex index pairs, seam vertex
+        indices and asymmetric vertex indices
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    if shells is not None and shell_map is not None:
+        shells = np.asarray(shells, dtype=np.int64)
+        shell_map = np.asarray(shell_map, dtype=np.int64)
+    else:
+        shells = shell_map = None
+
+    offsets = points[:, axis] - mid
+    seam_mask = np.abs(offsets) < tolerance
+    pos_verts = np.flatnonzero(~seam_mask & (offsets >= consts.MID_OFFSET_TOLERANCE))
+    neg_verts = np.flatnonzero(~seam_mask & (offsets < consts.MID_OFFSET_TOLERANCE))
+
+    mirrored_neg_points = points[neg_verts]
+    mirrored_neg_points[:, axis] = 2 * mid - mirrored_neg_points[:, axis]
+    exact_pos, exact_neg = _match_quantized_points(points[pos_verts], mirrored_neg_points, tolerance)
+    if shells is not None:
+        valid = get_shell_pairs_mask(shells[pos_verts[exact_pos]], shells[neg_verts[exact_neg]], shell_map)
+        exact_pos = exact_pos[valid]
+        exact_neg = exact_neg[valid]
+    exact_pairs = np.column_stack([pos_verts[exact_pos], neg_verts[exact_neg]])
+    pos_verts = np.delete(pos_verts, exact_pos)
+    neg_verts = np.delete(neg_verts, exact_neg)
+    mirrored_neg_points = np.delete(mirrored_neg_points, exact_neg, axis=0)
+
+    pos_points = points[pos_verts]
+    if shells is None:
+        pair_pos, pair_neg = _match_mirrored_points(pos_points, mirrored_neg_points, axis, tolerance)
+    else:
+        pair_pos, pair_neg = _match_mirrored_points(
+            pos_points, mirrored_neg_points, axis, tolerance, shells_a=shells[pos_verts], shells_b=shells[neg_verts],
+            shell_map=shell_map)
+
+        # Vertices left unmatched (for example, vertices of shells whose mirror shell was not found) are matched
+        # with any other unmatched vertex
+        free_pos = np.delete(np.arange(len(pos_verts)), pair_pos)
+        free_neg = np.delete(np.arange(len(neg_verts)), pair_neg)
+        free_pair_pos, free_pair_neg = _match_mirrored_points(
+            pos_points[free_pos], mirrored_neg_points[free_neg], axis, tolerance)
+        pair_pos = np.concatenate([pair_pos, free_pos[free_pair_pos]])
+        pair_neg = np.concatenate([pair_neg, free_neg[free_pair_neg]])
+
+    pos_matched = np.zeros(len(pos_verts), dtype=bool)
+    neg_matched = np.zeros(len(neg_verts), dtype=bool)
+    pos_matched[pair_pos] = True
+    neg_matched[pair_neg] = True
+    pairs = np.concatenate([exact_pairs, np.column_stack([pos_verts[pair_pos], neg_verts[pair_neg]])]).astype(
+        np.int64).reshape(-1, 2)
+    pairs = pairs[np.argsort(pairs[:, 0], kind='mergesort')]
+    seam = np.flatnonzero(seam_mask)
+    asymmetric = np.sort(np.concatenate([pos_verts[~pos_matched], neg_verts[~neg_matched]]))
+
+    return pairs, seam, asymmetric
+
+
+def _match_mirrored_points(points, mirrored_points, axis, tolerance, shells_a=None, shells_b=None, shell_map=None):
+    """
+    Internal function that matches positive side points with mirrored negative side points within tolerance
+    :param points: np.array, (N, 3) array of positive side points
+    :param mirrored_points: np.array, (M, 3) array of mirrored negative side points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param shells_a: np.array or None, shell index of each positive side point
+    :param shells_b: np.array or None, shell index of each negative side point
+    :param shell_map: np.array or None, mirror shell of each shell. If given, only points of mirror shells are matched
+    :return: tuple(np.array, np.array), indices of the matched points of each array sorted by first array index
+    """
+
+    # Grid search is inclusive in all axes, but vertices must be closer than tolerance in the axes of the mirror plane
+    candidates_a, candidates_b = _get_grid_candidates(
+        points, mirrored_points, tolerance, shells_a=shells_a, shells_b=shells_b, shell_map=shell_map)
+    differences = points[candidates_a] - mirrored_points[candidates_b]
+    valid = np.all(np.abs(differences[:, [(axis + 1) % 3, (axis + 2) % 3]]) < tolerance, axis=1)
+
+    return _resolve_candidates(
+        candidates_a[valid], candidates_b[valid], len(points), len(mirrored_points),
+        costs=np.sum(differences[valid] ** 2, axis=1))
+
+
+def _get_grid_candidates(points_a, points_b, tolerance, shells_a=None, shells_b=None, shell_map=None):
+    """
+    Internal function that returns all pairs of points of both given arrays that are within tolerance in every axis
+    Points of the second array are hashed in an integer grid of tolerance sized cells and only the 27 cells around
+    each point of the first array are searched, so the search does not depend on how points spread along any axis.
+    :param points_a: np.array, (N, 3) array of points
+    :param points_b: np.array, (M, 3) array of points
+    :param tolerance: float
+    :param shells_a: np.array or None, shell index of each point of the first array
+    :param shells_b: np.array or None, shell index of each point of the second array
+    :param shell_map: np.array or None, mirror shell of each shell. If given, points of shells that are not mirror
+        shells are never candidates (see get_shell_pairs_mask)
+    :return: tuple(np.array, np.array), indices of the candidate points of each array sorted by first array index
+    """
+
+    empty = np.zeros(0, dtype=np.int64)
+    if not len(points_a) or not len(points_b) or tolerance <= 0:
+        return empty, empty
+
+    # Cells are offset by one so neighbour cells of every point have positive coordinates. Keys of huge grids wrap
+    # around, which only adds candidates of colliding cells that are rejected by the distance check.
+    cells_a = np.floor(points_a / tolerance)
+    cells_b = np.floor(points_b / tolerance)
+    min_cell = np.minimum(cells_a.min(axis=0), cells_b.min(axis=0)) - 1
+    extents = (np.maximum(cells_a.max(axis=0), cells_b.max(axis=0)) - min_cell + 2).astype(np.int64)
+    cells_a = (cells_a - min_cell).astype(np.int64)
+    cells_b = (cells_b - min_cell).astype(np.int64)
+
+    def _get_keys(cell_coords):
+        return (cell_coords[:, 0] * extents[1] + cell_coords[:, 1]) * extents[2] + cell_coords[:, 2]
+
+    keys = _get_keys(cells_b)
+    order = np.argsort(keys, kind='mergesort')
+    sorted_keys = keys[order]
+
+    candidates_a = list()
+    candidates_b = list()
+    for offset in np.array(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1])).reshape(3, -1).T:
+        neighbour_keys = _get_keys(cells_a + offset)
+        lower = np.searchsorted(sorted_keys, neighbour_keys, side='left')
+        upper = np.searchsorted(sorted_keys, neighbour_keys, side='right')
+
+        # Candidates of each point are a contiguous window of the sorted points, so windows are walked one position
+        # at a time for all points at once instead of looping over points
+        active = np.flatnonzero(upper > lower)
+        position = lower[active]
+        while len(active):
+            neighbours = order[position]
+            valid = np.all(np.abs(points_b[neighbours] - points_a[active]) <= tolerance, axis=1)
+            if shell_map is not None:
+                valid &= get_shell_pairs_mask(shells_a[active], shells_b[neighbours], shell_map)
+            candidates_a.append(active[valid])
+            candidates_b.append(neighbours[valid])
+            position = position + 1
+            remaining = position < upper[active]
+            active = active[remaining]
+            position = position[remaining]
+
+    candidates_a = np.concatenate(candidates_a or [empty])
+    candidates_b = np.concatenate(candidates_b or [empty])
+    order = np.lexsort((candidates_b, candidates_a))
+
+    return candidates_a[order], candidates_b[order]
+
+
+def _match_quantized_points(points_a, points_b, tolerance):
+    """
+    Internal function that pairs points of both given arrays that fall in the same cell of an integer grid of tolerance
+    sized cells. Only cells that contain a single point of each array are paired and only if both points are at the
+    same position (within consts.EXACT_MATCH_FACTOR of the tolerance); points in other cells (or whose partner fell in
+    a neighbour cell) are left to tolerance search, so pairs of noisy geometries are still resolved by assignment.
+    :param points_a: np.array, (N, 3) array of points
+    :param points_b: np.array, (M, 3) array of points
+    :param tolerance: float
+    :return: tuple(np.array, np.array), indices of paired points of each array
+    """
+
+    empty = np.zeros(0, dtype=np.int64)
+    if not len(points_a) or not len(points_b) or tolerance <= 0:
+        return empty, empty
+
+    cells_a = np.floor(points_a / tolerance)
+    cells_b = np.floor(points_b / tolerance)
+    min_cell = np.minimum(cells_a.min(axis=0), cells_b.min(axis=0))
+    extents = np.maximum(cells_a.max(axis=0), cells_b.max(axis=0)) - min_cell + 1
+    if np.prod(extents) >= 2 ** 62:
+        return empty, empty
+
+    extents = extents.astype(np.int64)
+    cells_a = (cells_a - min_cell).astype(np.int64)
+    cells_b = (cells_b - min_cell).astype(np.int64)
+    keys_a = (cells_a[:, 0] * extents[1] + cells_a[:, 1]) * extents[2] + cells_a[:, 2]
+    keys_b = (cells_b[:, 0] * extents[1] + cells_b[:, 1]) * extents[2] + cells_b[:, 2]
+
+    unique_a, indices_a, counts_a = np.unique(keys_a, return_index=True, return_counts=True)
+    unique_b, indices_b, counts_b = np.unique(keys_b, return_index=True, return_counts=True)
+    _, common_a, common_b = np.intersect1d(
+        unique_a[counts_a == 1], unique_b[counts_b == 1], assume_unique=True, return_indices=True)
+    paired_a = indices_a[counts_a == 1][common_a]
+    paired_b = indices_b[counts_b == 1][common_b]
+    valid = np.all(np.abs(points_a[paired_a] - points_b[paired_b]) <= tolerance * consts.EXACT_MATCH_FACTOR, axis=1)
+
+    return paired_a[valid], paired_b[valid]
+
+
+def _resolve_candidates(candidates_a, candidates_b, count_a, count_b, costs):
+    """
+    Internal function that selects the candidate pairs that match as many vertices as possible with the minimum cost
+    Candidates are split in conflict groups (connected components of the candidates graph). Groups with one candidate
+    are accepted directly, small groups are solved optimally with the Hungarian method and groups bigger than
+    consts.MAX_ASSIGNMENT_GROUP_SIZE take the cheapest candidates first.
+    :param candidates_a: np.array, first vertex of each candidate pair
+    :param candidates_b: np.array, second vertex of each candidate pair
+    :param count_a: int, total number of first vertices
+    :param count_b: int, total number of second vertices
+    :param costs: np.array, cost of each candidate pair
+    :return: tuple(np.array, np.array), first and second vertices of the selected pairs sorted by first vertex
+    """
+
+    if not len(candidates_a):
+        return candidates_a, candidates_b
+
+    groups = get_connected_components(count_a + count_b, candidates_a, candidates_b + count_a)[candidates_a]
+    order = np.lexsort((candidates_b, candidates_a, groups))
+    groups = groups[order]
+    candidates_a = candidates_a[order]
+    candidates_b = candidates_b[order]
+    costs = costs[order]
+    group_starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    group_ends = np.r_[group_starts[1:], len(groups)]
+
+    single = group_ends - group_starts == 1
+    selected = [group_starts[single]]
+    for start, end in zip(group_starts[~single], group_ends[~single]):
+        group_a = candidates_a[start:end]
+        group_b = candidates_b[start:end]
+        group_costs = costs[start:end]
+        rows, row_indices = np.unique(group_a, return_inverse=True)
+        columns, column_indices = np.unique(group_b, return_inverse=True)
+        if max(len(rows), len(columns)) > consts.MAX_ASSIGNMENT_GROUP_SIZE:
+            selected.append(start + _solve_greedy_assignment(row_indices, column_indices, group_costs))
+            continue
+
+        # Missing candidates get a cost bigger than any feasible assignment, so the number of pairs is maximized first
+        infeasible_cost = (group_costs.sum() + 1.0) * (len(rows) + len(columns))
+        cost_matrix = np.full((len(rows), len(columns)), infeasible_cost)
+        candidate_matrix = np.full((len(rows), len(columns)), -1, dtype=np.int64)
+        cost_matrix[row_indices, column_indices] = group_costs
+        candidate_matrix[row_indices, column_indices] = np.arange(start, end)
+        assignment = _solve_assignment(cost_matrix)
+        assigned_rows = np.flatnonzero(assignment != -1)
+        assigned = candidate_matrix[assigned_rows, assignment[assigned_rows]]
+        selected.append(assigned[assigned != -1])
+
+    selected = np.sort(np.concatenate(selected))
+    selected = selected[np.argsort(candidates_a[selected], kind='mergesort')]
+
+    return candidates_a[selected], candidates_b[selected]
+
+
+def _solve_greedy_assignment(rows, columns, costs):
+    """
+    Internal function that selects candidate pairs from the cheapest to the most expensive one skipping the pairs
+    whose row or column is already assigned
+    :param rows: np.array, row of each candidate
+    :param columns: np.array, column of each candidate
+    :param costs: np.array, cost of each candidate
+    :return: np.array, indices of the selected candidates
+    """
+
+    used_rows = set()
+    used_columns = set()
+    selected = list()
+    for i in np.argsort(costs, kind='mergesort').tolist():
+        row = rows[i]
+        column = columns[i]
+        if row in used_rows or column in used_columns:
+            continue
+        used_rows.add(row)
+        used_columns.add(column)
+        selected.append(i)
+
+    return np.array(selected, dtype=np.int64)
+
+
+def _solve_assignment(cost_matrix):
+    """
+    Internal function that solves the minimum cost assignment of the given cost matrix with the Hungarian method
+    :param cost_matrix: np.array, (R, C) cost matrix
+    :return: np.array, (R, ) array with the column assigned to each row; -1 if row has no column assigned
+    """
+
+    cost_matrix = np.asarray(cost_matrix, dtype=np.float64)
+    if cost_matrix.shape[0] > cost_matrix.shape[1]:
+        transposed_assignment = _solve_assignment(cost_matrix.T)
+        assignment = np.full(cost_matrix.shape[0], -1, dtype=np.int64)
+        assigned_columns = np.flatnonzero(transposed_assignment != -1)
+        assignment[transposed_assignment[assigned_columns]] = assigned_columns
+        return assignment
+
+    # Rows and columns are 1-based so index 0 can be used as the virtual column rows are augmented from
+    total_rows, total_columns = cost_matrix.shape
+    row_potentials = np.zeros(total_rows + 1)
+    column_potentials = np.zeros(total_columns + 1)
+    column_rows = np.zeros(total_columns + 1, dtype=np.int64)
+    way = np.zeros(total_columns + 1, dtype=np.int64)
+    for row in range(1, total_rows + 1):
+        column_rows[0] = row
+        column = 0
+        min_values = np.full(total_columns + 1, np.inf)
+        used = np.zeros(total_columns + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current_row = column_rows[column]
+            reduced_costs = np.r_[
+                np.inf, cost_matrix[current_row - 1] - row_potentials[current_row] - column_potentials[1:]]
+            update = ~used & (reduced_costs < min_values)
+            min_values[update] = reduced_costs[update]
+            way[update] = column
+            free_values = np.where(used, np.inf, min_values)
+            next_column = int(np.argmin(free_values))
+            delta = free_values[next_column]
+            row_potentials[column_rows[used]] += delta
+            column_potentials[used] -= delta
+            min_values[~used] -= delta
+            column = next_column
+            if column_rows[column] == 0:
+                break
+        while column:
+            previous_column = way[column]
+            column_rows[column] = column_rows[previous_column]
+            column = previous_column
+
+    assignment = np.full(total_rows, -1, dtype=np.int64)
+    assigned_columns = np.flatnonzero(column_rows[1:])
+    assignment[column_rows[1:][assigned_columns] - 1] = assigned_columns
+
+    return assignment
+
+
+def get_shells(vertex_count, face_counts, face_vertices):
+    """
+    Returns the shell (connected component) each vertex belongs to
+    Faces are given in a compact way: face_counts stores the number of vertices of each face and face_vertices stores
+    the vertex indices of all faces one after the other.
+    :param vertex_count: int, total number of vertices
+    :param face_counts: np.array, number of vertices of each face
+    :param face_vertices: np.array, vertex indices of all faces
+    :return: np.array, (N, ) array of shell indices. Shells are numbered following vertex order
+    """
+
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    face_vertices = np.asarray(face_vertices, dtype=np.int64)
+
+    # Each face vertex is connected with the first vertex of its face, which is enough to know connectivity
+    face_starts = np.cumsum(face_counts) - face_counts
+    edges_a = face_vertices
+    edges_b = np.repeat(face_vertices[face_starts[face_counts > 0]], face_counts[face_counts > 0])
+
+    return get_connected_components(vertex_count, edges_a, edges_b)
+
+
+def get_connected_components(node_count, edges_a, edges_b):
+    """
+    Returns the connected component each node of the given graph belongs to
+    :param node_count: int, total number of nodes
+    :param edges_a: np.array, first node of each edge
+    :param edges_b: np.array, second node of each edge
+    :return: np.array, (N, ) array of component indices. Components are numbered following node order
+    """
+
+    edges_a = np.asarray(edges_a, dtype=np.int64)
+    edges_b = np.asarray(edges_b, dtype=np.int64)
+
+    # Labels are propagated hooking each root to the smallest connected root and then compressing label chains
+    labels = np.arange(node_count, dtype=np.int64)
+    while True:
+        labels_a = labels[edges_a]
+        labels_b = labels[edges_b]
+        new_labels = labels.copy()
+        min_labels = np.minimum(labels_a, labels_b)
+        np.minimum.at(new_labels, labels_a, min_labels)
+        np.minimum.at(new_labels, labels_b, min_labels)
+        while True:
+            compressed = new_labels[new_labels]
+            if np.array_equal(compressed, new_labels):
+                break
+            new_labels = compressed
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    return np.unique(labels, return_inverse=True)[1].reshape(-1)
+
+
+def match_shells(points, shells, axis=0, tolerance=0.001, mid=0.0):
+    """
+    Matches each shell with its mirror shell
+    Shells are only matched with shells of the same vertex count whose mirrored centroid and mirrored bounding box are
+    within a distance scaled to the shell size (consts.SHELL_MATCH_FACTOR of its biggest bounding box side, and never
+    less than tolerance), so shells with a few asymmetric vertices are still matched. Shells that compete for the same
+    mirror shells are resolved with a minimum cost assignment. A shell whose centroid and bounding box center lie on
+    the mirror plane is matched with itself.
+    :param points: np.array, (N, 3) array of points
+    :param shells: np.array, (N, ) array of shell indices
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :return: np.array, (S, ) array with the mirror shell of each shell; -1 if shell has no mirror shell
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    shells = np.asarray(shells, dtype=np.int64)
+    total_shells = int(shells.max()) + 1 if len(shells) else 0
+    shell_map = np.full(total_shells, -1, dtype=np.int64)
+    if not total_shells:
+        return shell_map
+
+    counts = np.bincount(shells, minlength=total_shells)
+    centroids = np.column_stack(
+        [np.bincount(shells, weights=points[:, i], minlength=total_shells) for i in range(3)]) / np.maximum(
+        counts, 1)[:, np.newaxis]
+    min_points = np.full((total_shells, 3), np.inf)
+    max_points = np.full((total_shells, 3), -np.inf)
+    np.minimum.at(min_points, shells, points)
+    np.maximum.at(max_points, shells, points)
+    empty = counts == 0
+    min_points[empty] = max_points[empty] = 0.0
+    distances = np.maximum(tolerance, np.max(max_points - min_points, axis=1) * consts.SHELL_MATCH_FACTOR)
+
+    # Shells are described by their centroid and bounding box; mirrored shells swap bounding box limits in the axis
+    features = np.hstack([centroids, min_points, max_points])
+    mirrored_features = features.copy()
+    mirrored_features[:, axis] = 2 * mid - centroids[:, axis]
+    mirrored_features[:, 3 + axis] = 2 * mid - max_points[:, axis]
+    mirrored_features[:, 6 + axis] = 2 * mid - min_points[:, axis]
+    feature_distances = np.abs(mirrored_features - features).max(axis=1)
+
+    on_seam = ~empty & (feature_distances < distances)
+    shell_map[on_seam] = np.flatnonzero(on_seam)
+    offsets = centroids[:, axis] - mid
+    pos_shells = np.flatnonzero(~empty & ~on_seam & (offsets >= 0))
+    neg_shells = np.flatnonzero(~empty & ~on_seam & (offsets < 0))
+
+    # Candidates are searched among shells with the same vertex count, in a grid of centroids
+    candidates_pos = list()
+    candidates_neg = list()
+    for count in np.intersect1d(counts[pos_shells], counts[neg_shells]):
+        count_pos = pos_shells[counts[pos_shells] == count]
+        count_neg = neg_shells[counts[neg_shells] == count]
+        cell_size = max(distances[count_pos].max(), distances[count_neg].max())
+        found_pos, found_neg = _get_grid_candidates(centroids[count_pos], mirrored_features[count_neg, :3], cell_size)
+        candidates_pos.append(count_pos[found_pos])
+        candidates_neg.append(count_neg[found_neg])
+    candidates_pos = np.concatenate(candidates_pos or [np.zeros(0, dtype=np.int64)])
+    candidates_neg = np.concatenate(candidates_neg or [np.zeros(0, dtype=np.int64)])
+
+    differences = np.abs(features[candidates_pos] - mirrored_features[candidates_neg])
+    valid = differences.max(axis=1) < np.maximum(distances[candidates_pos], distances[candidates_neg])
+    shell_indices = np.full(total_shells, -1, dtype=np.int64)
+    shell_indices[pos_shells] = np.arange(len(pos_shells))
+    shell_indices[neg_shells] = np.arange(len(neg_shells))
+    pair_pos, pair_neg = _resolve_candidates(
+        shell_indices[candidates_pos[valid]], shell_indices[candidates_neg[valid]], len(pos_shells), len(neg_shells),
+        costs=np.sum(differences[valid] ** 2, axis=1))
+    shell_map[pos_shells[pair_pos]] = neg_shells[pair_neg]
+    shell_map[neg_shells[pair_neg]] = pos_shells[pair_pos]
+
+    return shell_map
+
+
+def get_shell_pairs_mask(shells_a, shells_b, shell_map):
+    """
+    Returns which of the given vertex pairs join a shell with its mirror shell. Vertices of shells without mirror
+    shell can only be paired inside their own shell.
+    :param shells_a: np.array, shell of the first vertex of each pair
+    :param shells_b: np.array, shell of the second vertex of each pair
+    :param shell_map: np.array, mirror shell of each shell (see match_shells)
+    :return: np.array, boolean array
+    """
+
+    mirror_shells = shell_map[shells_a]
+
+    return (mirror_shells == shells_b) | ((mirror_shells == -1) & (shells_a == shells_b))
+
+
+def build_shell_symmetry_table(points, shells, axis=0, tolerance=0.001, mid=0.0, shell_map=None, processes=None):
+    """
+    Builds symmetry table of the given points matching vertices inside shells and their mirror shells first
+    Shells are matched first (see match_shells) and then each shell pair is matched independently, in parallel, so
+    vertices of unrelated shells (such as duplicated pieces) are not mixed up. Vertices left unmatched are matched
+    with any other unmatched vertex at the end, so shells that could not be matched are still paired.
+    :param points: np.array, (N, 3) array of points
+    :param shells: np.array, (N, ) array of shell indices
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :param shell_map: np.array or None, mirror shell of each shell. If not given, shells are matched.
+    :param processes: int or None, number of threads used to match shell pairs. If not given, available cores are
+        used.
+    :return: tuple(np.array, np.array, np.array), (K, 2) array of positive/negative vertex index pairs, seam vertex
+        indices and asymmetric vertex indices
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    shells = np.asarray(shells, dtype=np.int64)
+    if shell_map is None:
+        shell_map = match_shells(points, shells, axis=axis, tolerance=tolerance, mid=mid)
+    if len(shell_map) <= 1:
+        return build_symmetry_table(points, axis=axis, tolerance=tolerance, mid=mid)
+
+    order = np.argsort(shells, kind='mergesort')
+    shell_vertices = np.split(order, np.cumsum(np.bincount(shells, minlength=len(shell_map)))[:-1])
+
+    # Shells without mirror shell are matched alone, so their seam vertices are still found
+    jobs = list()
+    for shell, mirror_shell in enumerate(shell_map):
+        if mirror_shell == -1 or mirror_shell == shell:
+            jobs.append(shell_vertices[shell])
+        elif shell < mirror_shell:
+            jobs.append(np.concatenate([shell_vertices[shell], shell_vertices[mirror_shell]]))
+
+    def _match(indices):
+        job_pairs, job_seam, job_asymmetric = build_symmetry_table(
+            points[indices], axis=axis, tolerance=tolerance, mid=mid)
+        return indices[job_pairs], indices[job_seam], indices[job_asymmetric]
+
+    processes = max(1, min(processes or multiprocessing.cpu_count(), len(jobs)))
+    if processes == 1:
+        results = [_match(indices) for indices in jobs]
+    else:
+        thread_pool = pool.ThreadPool(processes=processes)
+        try:
+            results = thread_pool.map(_match, jobs)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
+    unmatched = np.sort(np.concatenate([result[2] for result in results]))
+    unmatched_pairs, _, asymmetric = _match(unmatched)
+    pairs = np.concatenate([result[0] for result in results] + [unmatched_pairs]).reshape(-1, 2)
+    pairs = pairs[np.argsort(pairs[:, 0], kind='mergesort')]
+    seam = np.sort(np.concatenate([result[1] for result in results]))
+
+    return pairs, seam, asymmetric
+
+
+def get_half_edges(face_counts, face_vertices, vertex_count):
+    """
+    Returns the half-edges of the given faces. Half-edge i goes from face vertex i to the next vertex of its face.
+    :param face_counts: np.array, number of vertices of each face
+    :param face_vertices: np.array, vertex indices of all faces
+    :param vertex_count: int, total number of vertices
+    :return: tuple(np.array, np.array, np.array, np.array, np.array), origin vertex, face, next half-edge, previous
+        half-edge and twin half-edge (-1 for border half-edges) of each half-edge
+    """
+
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    origins = np.asarray(face_vertices, dtype=np.int64)
+    faces = np.repeat(np.arange(len(face_counts)), face_counts)
+    face_starts = np.repeat(np.cumsum(face_counts) - face_counts, face_counts)
+    face_sizes = face_counts[faces]
+    local_indices = np.arange(len(origins)) - face_starts
+    next_edges = face_starts + (local_indices + 1) % face_sizes
+    prev_edges = face_starts + (local_indices - 1) % face_sizes
+
+    # Twin of half-edge (u, v) is half-edge (v, u), found with a binary search over sorted half-edge keys
+    targets = origins[next_edges]
+    keys = origins * vertex_count + targets
+    order = np.argsort(keys, kind='mergesort')
+    sorted_keys = keys[order]
+    twin_keys = targets * vertex_count + origins
+    positions = np.minimum(np.searchsorted(sorted_keys, twin_keys), max(len(keys) - 1, 0))
+    found = sorted_keys[positions] == twin_keys if len(keys) else np.zeros(0, dtype=bool)
+    twins = np.where(found, order[positions], -1)
+
+    return origins, faces, next_edges, prev_edges, twins
+
+
+def get_edges(face_counts, face_vertices):
+    """
+    Returns the edges of the given faces. Each edge shared by two faces is returned once.
+    :param face_counts: np.array, number of vertices of each face
+    :param face_vertices: np.array, vertex indices of all faces
+    :return: tuple(np.array, np.array), first and second vertex of each edge
+    """
+
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    origins = np.asarray(face_vertices, dtype=np.int64)
+    face_starts = np.repeat(np.cumsum(face_counts) - face_counts, face_counts)
+    local_indices = np.arange(len(origins)) - face_starts
+    targets = origins[face_starts + (local_indices + 1) % np.repeat(face_counts, face_counts)]
+
+    vertex_count = int(origins.max()) + 1 if len(origins) else 0
+    keys = np.sort(np.minimum(origins, targets) * vertex_count + np.maximum(origins, targets))
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+
+    return keys // vertex_count, keys % vertex_count
+
+
+def find_seam_edges(points, face_counts, face_vertices, axis=0, tolerance=0.001, mid=0.0):
+    """
+    Returns the edges that lie on the mirror plane and separate a face of each side
+    :param points: np.array, (N, 3) array of points
+    :param face_counts: np.array, number of vertices of each face
+    :param face_vertices: np.array, vertex indices of all faces
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :return: np.array, (K, 2) array of edge vertex indices
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    origins, faces, next_edges, _, twins = get_half_edges(face_counts, face_vertices, len(points))
+    offsets = points[:, axis] - mid
+    face_offsets = np.bincount(faces, weights=offsets[origins], minlength=len(face_counts)) / np.maximum(
+        face_counts, 1)
+
+    on_plane = np.abs(offsets) < tolerance
+    targets = origins[next_edges]
+    seam_edges = np.flatnonzero(
+        on_plane[origins] & on_plane[targets] & (twins != -1) & (face_offsets[faces] >= 0) & (
+            face_offsets[faces[np.maximum(twins, 0)]] < 0))
+
+    return np.column_stack([origins[seam_edges], targets[seam_edges]])
+
+
+def build_topology_symmetry_table(points, face_counts, face_vertices, seam_edges, axis=0, mid=0.0):
+    """
+    Builds symmetry table of the given geometry walking its connectivity from the given seam edges
+    Faces at both sides of each seam edge are paired and the walk continues through the edges of each paired face on
+    both sides at once, pairing their vertices by adjacency. Each face is visited once, so the table is built in linear
+    time and does not depend on vertex positions: posed or slightly asymmetric geometries get the same table.
+    Vertices that cannot be reached from seam edges or that get conflicting partners are asymmetric.
+    :param points: np.array, (N, 3) array of points. Only used to know which vertex of each pair is at the positive side
+    :param face_counts: np.array, number of vertices of each face
+    :param face_vertices: np.array, vertex indices of all faces
+    :param seam_edges: list(tuple(int, int)) or np.array, edges (pairs of vertex indices) that lie on the mirror plane
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param mid: float, position of the mirror plane along the mirror axis
+    :return: tuple(np.array, np.array, np.array), (K, 2) array of positive/negative vertex index pairs, seam vertex
+        indices and asymmetric vertex indices
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    vertex_count = len(points)
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    origins, faces, next_edges, prev_edges, twins = get_half_edges(face_counts, face_vertices, vertex_count)
+    half_edge_keys = origins * vertex_count + origins[next_edges]
+    order = np.argsort(half_edge_keys, kind='mergesort')
+    sorted_keys = half_edge_keys[order]
+
+    # Half-edge (u, v) of a face is paired with half-edge (M(v), M(u)) of its mirror face: mirror faces have opposite
+    # winding, so walking forward from the first one matches walking backward from the second one
+    queue = collections.deque()
+    for vertex_a, vertex_b in np.asarray(seam_edges, dtype=np.int64).reshape(-1, 2):
+        for key in (vertex_a * vertex_count + vertex_b, vertex_b * vertex_count + vertex_a):
+            position = np.searchsorted(sorted_keys, key)
+            if position < len(sorted_keys) and sorted_keys[position] == key and twins[order[position]] != -1:
+                queue.append((int(order[position]), int(twins[order[position]])))
+                break
+
+    origins = origins.tolist()
+    faces = faces.tolist()
+    next_edges = next_edges.tolist()
+    prev_edges = prev_edges.tolist()
+    twins = twins.tolist()
+    face_counts = face_counts.tolist()
+    mirror_map = [-1] * vertex_count
+    conflicts = set()
+    visited = [False] * len(face_counts)
+
+    while queue:
+        edge_a, edge_b = queue.popleft()
+        face_a = faces[edge_a]
+        face_b = faces[edge_b]
+        if visited[face_a] or visited[face_b] or face_counts[face_a] != face_counts[face_b]:
+            continue
+        visited[face_a] = visited[face_b] = True
+        for _ in range(face_counts[face_a]):
+            vertex_a = origins[edge_a]
+            vertex_b = origins[next_edges[edge_b]]
+            if mirror_map[vertex_a] == -1 and mirror_map[vertex_b] == -1:
+                mirror_map[vertex_a] = vertex_b
+                mirror_map[vertex_b] = vertex_a
+            elif mirror_map[vertex_a] != vertex_b or mirror_map[vertex_b] != vertex_a:
+                conflicts.update((vertex_a, vertex_b))
+            if twins[edge_a] != -1 and twins[edge_b] != -1:
+                queue.append((twins[edge_a], twins[edge_b]))
+            edge_a = next_edges[edge_a]
+            edge_b = prev_edges[edge_b]
+
+    mirror_map = np.array(mirror_map, dtype=np.int64)
+    if conflicts:
+        conflicts = np.array(sorted(conflicts), dtype=np.int64)
+        partners = mirror_map[conflicts]
+        mirror_map[partners[partners != -1]] = -1
+        mirror_map[conflicts] = -1
+
+    indices = np.arange(vertex_count)
+    seam = np.flatnonzero(mirror_map == indices)
+    paired = np.flatnonzero((mirror_map != -1) & (mirror_map != indices))
+    paired = paired[paired < mirror_map[paired]]
+    partners = mirror_map[paired]
+    positive_first = points[paired, axis] - mid >= points[partners, axis] - mid
+    pairs = np.column_stack([np.where(positive_first, paired, partners), np.where(positive_first, partners, paired)])
+    asymmetric = np.flatnonzero(mirror_map == -1)
+
+    return pairs, seam, asymmetric
+
+
+def precheck_symmetry(points, axis=0, tolerance=0.001, mid=0.0, min_score=0.9, sample_size=1000):
+    """
+    Quick symmetry pre-check used to reject clearly asymmetric geometries before building their symmetry table
+    Mirrored centroid is compared first, as a cheap filter that only rejects geometries that cannot have the given
+    fraction of symmetric vertices. The rest are rejected or accepted by the sampled match score of their vertices.
+    :param points: np.array, (N, 3) array of points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :param min_score: float, minimum fraction of symmetric vertices (between 0 and 1)
+    :param sample_size: int, maximum number of sampled vertices
+    :return: tuple(bool, dict), whether or not the geometry can be symmetric and pre-check values
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    if not len(points):
+        return True, dict()
+
+    # Offsets of symmetric pairs cancel out and seam offsets are below tolerance, so only asymmetric vertices can
+    # move the centroid away from the mirror plane, and each of them no more than the farthest vertex offset
+    offsets = points[:, axis] - mid
+    centroid_offset = abs(float(offsets.mean()))
+    max_offset = float(np.abs(offsets).max())
+    precheck = {'centroid_offset': centroid_offset}
+    if centroid_offset > tolerance + (1.0 - min_score) * max_offset:
+        return False, precheck
+
+    score = get_mirror_match_score(points, axis=axis, tolerance=tolerance, mid=mid, sample_size=sample_size)
+    precheck['score'] = score
+
+    return score >= min_score, precheck
+
+
+def get_symmetry_summary(
+        points, axis=0, tolerance=0.001, mid=0.0, table=False, precheck=False, min_score=0.9, shells=None):
+    """
+    Builds symmetry table of the given points and returns a compact summary of it
+    :param points: np.array, (N, 3) array of points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :param table: bool, whether or not flat symmetry table should be included in the summary
+    :param precheck: bool, whether or not clearly asymmetric geometries are rejected with a quick pre-check before
+        building their symmetry table. Rejected geometries report -1 pairs, seam and asymmetric vertices.
+    :param min_score: float, minimum fraction of symmetric vertices used by pre-check
+    :param shells: np.array or None, shell index of each vertex. If given, vertices are only matched inside shells
+        and their mirror shells.
+    :return: dict
+    """
+
+    if precheck:
+        plausible, precheck_values = precheck_symmetry(
+            points, axis=axis, tolerance=tolerance, mid=mid, min_score=min_score)
+        if not plausible:
+            return get_rejected_summary(len(points), precheck_values, table=table)
+
+    if shells is None:
+        pairs, seam, asymmetric = build_symmetry_table(points, axis=axis, tolerance=tolerance, mid=mid)
+    else:
+        pairs, seam, asymmetric = build_shell_symmetry_table(
+            points, shells, axis=axis, tolerance=tolerance, mid=mid, processes=1)
+    summary = {
+        'vertices': len(points),
+        'pairs': len(pairs),
+        'seam': len(seam),
+        'asymmetric': len(asymmetric),
+        'is_symmetric': not len(asymmetric)
+    }
+    if table:
+        summary['table'] = flatten_table(pairs)
+
+    return summary
+
+
+def get_rejected_summary(vertex_count, precheck_values, table=False):
+    """
+    Returns the summary of a geometry rejected by the symmetry pre-check (see get_symmetry_summary)
+    :param vertex_count: int
+    :param precheck_values: dict, pre-check values (see precheck_symmetry)
+    :param table: bool, whether or not an empty symmetry table should be included in the summary
+    :return: dict
+    """
+
+    summary = {
+        'vertices': vertex_count,
+        'pairs': -1,
+        'seam': -1,
+        'asymmetric': -1,
+        'is_symmetric': False,
+        'rejected': True,
+        'precheck': precheck_values
+    }
+    if table:
+        summary['table'] = list()
+
+    return summary
+
+
+def flatten_table(pairs):
+    """
+    Converts given pairs array into the flat symmetry table list format used by the tool
+    :param pairs: np.array, (K, 2) array of positive/negative vertex index pairs
+    :return: list(int)
+    """
+
+    return np.asarray(pairs).ravel().tolist()
+
+
+def get_mirror_map(pairs, seam, vertex_count):
+    """
+    Returns an array that maps each vertex index with the index of its mirror vertex
+    Seam vertices are mapped to themselves and asymmetric vertices are mapped to -1
+    :param pairs: np.array, (K, 2) array of positive/negative vertex index pairs
+    :param seam: np.array, seam vertex indices
+    :param vertex_count: int, total number of vertices
+    :return: np.array
+    """
+
+    pairs = np.asarray(pairs).reshape(-1, 2)
+    mirror_map = np.full(vertex_count, -1, dtype=np.int64)
+    mirror_map[pairs[:, 0]] = pairs[:, 1]
+    mirror_map[pairs[:, 1]] = pairs[:, 0]
+    mirror_map[seam] = seam
+
+    return mirror_map
+
+
+def get_edge_mirror_map(edges_a, edges_b, mirror_map):
+    """
+    Returns an array that maps each edge index with the index of its mirror edge
+    Mirror edge is the edge that connects the mirror vertices of the edge vertices. Edges with an asymmetric vertex or
+    whose mirror vertices are not connected are mapped to -1
+    :param edges_a: np.array, first vertex of each edge
+    :param edges_b: np.array, second vertex of each edge
+    :param mirror_map: np.array, array that maps each vertex index with the index of its mirror vertex
+    :return: np.array
+    """
+
+    edges_a = np.asarray(edges_a, dtype=np.int64)
+    edges_b = np.asarray(edges_b, dtype=np.int64)
+    mirror_map = np.asarray(mirror_map, dtype=np.int64)
+    vertex_count = len(mirror_map)
+    if not len(edges_a):
+        return np.zeros(0, dtype=np.int64)
+
+    # Edges are found with a binary search over sorted undirected edge keys
+    keys = np.minimum(edges_a, edges_b) * vertex_count + np.maximum(edges_a, edges_b)
+    order = np.argsort(keys, kind='mergesort')
+    sorted_keys = keys[order]
+
+    mirror_a = mirror_map[edges_a]
+    mirror_b = mirror_map[edges_b]
+    valid = (mirror_a != -1) & (mirror_b != -1)
+    mirror_keys = np.minimum(mirror_a, mirror_b) * vertex_count + np.maximum(mirror_a, mirror_b)
+    positions = np.minimum(np.searchsorted(sorted_keys, mirror_keys), len(keys) - 1)
+    found = valid & (sorted_keys[positions] == mirror_keys)
+
+    return np.where(found, order[positions], -1)
+
+
+def get_face_mirror_map(face_counts, face_vertices, mirror_map):
+    """
+    Returns an array that maps each face index with the index of its mirror face
+    Mirror face is the face whose vertices are the mirror vertices of the face vertices. Faces with an asymmetric vertex
+    or with no mirror face are mapped to -1
+    :param face_counts: np.array, number of vertices of each face
+    :param face_vertices: np.array, vertex indices of all faces
+    :param mirror_map: np.array, array that maps each vertex index with the index of its mirror vertex
+    :return: np.array
+    """
+
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    face_vertices = np.asarray(face_vertices, dtype=np.int64)
+    mirror_map = np.asarray(mirror_map, dtype=np.int64)
+    vertex_count = len(mirror_map)
+    face_count = len(face_counts)
+    if not face_count:
+        return np.zeros(0, dtype=np.int64)
+
+    # Faces are identified by their sorted vertex indices, padded with an out of range index up to the largest face
+    faces = np.repeat(np.arange(face_count), face_counts)
+    local_indices = np.arange(len(face_vertices)) - np.repeat(np.cumsum(face_counts) - face_counts, face_counts)
+    mirror_vertices = mirror_map[face_vertices]
+    valid = np.ones(face_count, dtype=bool)
+    valid[faces[mirror_vertices == -1]] = False
+
+    rows = np.full((2 * face_count, int(face_counts.max())), vertex_count, dtype=np.int64)
+    rows[faces, local_indices] = face_vertices
+    rows[faces + face_count, local_indices] = mirror_vertices
+    rows.sort(axis=1)
+
+    order = np.lexsort(rows.T[::-1])
+    sorted_rows = rows[order]
+    row_ids = np.empty(len(rows), dtype=np.int64)
+    row_ids[order] = np.concatenate([[0], np.cumsum(np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1))])
+    face_ids = np.full(row_ids.max() + 1, -1, dtype=np.int64)
+    face_ids[row_ids[:face_count]] = np.arange(face_count)
+    face_mirror_map = face_ids[row_ids[face_count:]]
+    face_mirror_map[~valid] = -1
+
+    return face_mirror_map
+
+
+def get_mirror_indices(
+        base_points, mirror_map, axis=0, base_mid=0.0, tolerance=0.001, neg_to_pos=False, indices=None):
+    """
+    Classifies given vertices using base points and returns the vertex indices involved in a mirror operation
+    Result only depends on base geometry, so it can be computed once and reused to mirror any number of targets.
+    :param base_points: np.array, (N, 3) array of points of the base geometry
+    :param mirror_map: np.array, array that maps each vertex with its mirror vertex (see get_mirror_map)
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param base_mid: float, position of the mirror plane of the base points
+    :param tolerance: float, vertices closer than this value to the base mirror plane are considered seam vertices
+    :param neg_to_pos: bool, whether to mirror from negative side to positive side
+    :param indices: np.array or None, indices of the vertices to operate on. If not given, all vertices are used.
+    :return: tuple(np.array, np.array, np.array), source vertex indices, target vertex indices (mirror of source
+        vertices) and seam vertex indices
+    """
+
+    base_points = np.asarray(base_points, dtype=np.float64)
+    mirror_map = np.asarray(mirror_map)
+    if indices is None:
+        indices = np.arange(len(base_points))
+    indices = np.asarray(indices, dtype=np.int64)
+
+    base_offsets = base_points[indices, axis] - base_mid
+    zero_mask = np.abs(base_offsets) < tolerance
+    zero_verts = indices[zero_mask]
+    source_verts = indices[~zero_mask & (base_offsets < 0 if neg_to_pos else base_offsets > 0)]
+    source_verts = source_verts[mirror_map[source_verts] != -1]
+    target_verts = mirror_map[source_verts]
+
+    return source_verts, target_verts, zero_verts
+
+
+def apply_mirror(points, mirror_indices, axis=0, mid=0.0, flip=False, deltas=False, out=None):
+    """
+    Mirrors (or flips) points using precomputed mirror indices (see get_mirror_indices)
+    Points can be a single (N, 3) array or a stack of targets with shape (T, N, 3) that are mirrored all at once.
+    :param points: np.array, (N, 3) or (T, N, 3) array of points (or deltas)
+    :param mirror_indices: tuple(np.array, np.array, np.array), source, target and seam vertex indices
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param mid: float or np.array, position of the mirror plane. Stacked targets can use one value per target.
+    :param flip: bool, whether to swap both sides instead of mirroring one side into the other
+    :param deltas: bool, whether given points are deltas relative to a symmetric base. Deltas are mirrored flipping
+        the sign of the mirror axis component and mirror plane position is ignored.
+    :param out: np.array or None, array where result is stored. If not given, a new array is allocated.
+    :return: np.array
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    source_verts, target_verts, zero_verts = mirror_indices
+    if out is None:
+        result = points.copy()
+    else:
+        result = out
+        if result is not points:
+            result[:] = points
+
+    if deltas:
+        mid = 0.0
+    elif points.ndim == 3:
+        mid = np.asarray(mid, dtype=np.float64).reshape(-1, 1)
+
+    source_trans = points[..., source_verts, :].copy()
+    source_trans[..., axis] = 2 * mid - source_trans[..., axis]
+    if flip:
+        target_trans = points[..., target_verts, :].copy()
+        target_trans[..., axis] = 2 * mid - target_trans[..., axis]
+        result[..., source_verts, :] = target_trans
+    result[..., target_verts, :] = source_trans
+
+    if flip:
+        result[..., zero_verts, axis] = 2 * mid - points[..., zero_verts, axis]
+    else:
+        result[..., zero_verts, axis] = mid
+
+    return result
+
+
+def symmetrize_points(points, mirror_indices, axis=0, mid=0.0, out=None):
+    """
+    Makes given points exactly symmetric averaging each vertex with the mirrored position of its partner
+    All pairs are processed in one pass and seam vertices are snapped to the mirror plane.
+    :param points: np.array, (N, 3) array of points
+    :param mirror_indices: tuple(np.array, np.array, np.array), source, target and seam vertex indices
+        (see get_mirror_indices)
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param mid: float, position of the mirror plane
+    :param out: np.array or None, array where result is stored. If not given, a new array is allocated.
+    :return: np.array
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    source_verts, target_verts, zero_verts = mirror_indices
+    if out is None:
+        result = points.copy()
+    else:
+        result = out
+        if result is not points:
+            result[:] = points
+
+    target_trans = points[target_verts].copy()
+    target_trans[:, axis] = 2 * mid - target_trans[:, axis]
+    average = (points[source_verts] + target_trans) * 0.5
+    result[source_verts] = average
+    average[:, axis] = 2 * mid - average[:, axis]
+    result[target_verts] = average
+    result[zero_verts, axis] = mid
+
+    return result
+
+
+def get_sparse_deltas(points, base_points, epsilon=1e-9):
+    """
+    Returns the vertices of the given points that moved from base points and their deltas
+    :param points: np.array, (N, 3) array of points
+    :param base_points: np.array, (N, 3) array of base points
+    :param epsilon: float, minimum delta length considered as a movement
+    :return: tuple(np.array, np.array), sorted indices of the moved vertices and (K, 3) array of their deltas
+    """
+
+    deltas = np.asarray(points, dtype=np.float64) - np.asarray(base_points, dtype=np.float64)
+    indices = np.flatnonzero(np.any(np.abs(deltas) > epsilon, axis=1))
+
+    return indices, deltas[indices]
+
+
+def mirror_sparse_deltas(
+        indices, deltas, base_points, mirror_map, axis=0, base_mid=0.0, tolerance=0.001, neg_to_pos=False,
+        flip=False, epsilon=1e-9):
+    """
+    Mirrors (or flips) sparse deltas relative to a symmetric base geometry
+    Only moved vertices and their mirror partners are processed, so cost scales with the edited region instead of the
+    whole mesh. Deltas are mirrored flipping the sign of their mirror axis component.
+    :param indices: np.array, sorted indices of the moved vertices
+    :param deltas: np.array, (K, 3) array of deltas of the moved vertices
+    :param base_points: np.array, (N, 3) array of points of the base geometry (used to classify sides)
+    :param mirror_map: np.array, array that maps each vertex with its mirror vertex (see get_mirror_map)
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param base_mid: float, position of the mirror plane of the base points
+    :param tolerance: float, vertices closer than this value to the base mirror plane are considered seam vertices
+    :param neg_to_pos: bool, whether to mirror from negative side to positive side
+    :param flip: bool, whether to swap both sides instead of mirroring one side into the other
+    :param epsilon: float, minimum delta difference considered as a change
+    :return: tuple(np.array, np.array), indices of the vertices whose delta changed and (M, 3) array of their new
+        deltas
+    """
+
+    indices = np.asarray(indices, dtype=np.int64)
+    deltas = np.asarray(deltas, dtype=np.float64).reshape(-1, 3)
+    mirror_map = np.asarray(mirror_map)
+
+    def _get_deltas(vertex_indices):
+        result = np.zeros((len(vertex_indices), 3))
+        if not len(indices):
+            return result
+        found = np.minimum(np.searchsorted(indices, vertex_indices), len(indices) - 1)
+        valid = indices[found] == vertex_indices
+        result[valid] = deltas[found[valid]]
+        return result
+
+    partners = mirror_map[indices]
+    involved = np.unique(np.concatenate([indices, partners[partners != -1]]))
+    involved_partners = mirror_map[involved]
+    old_deltas = _get_deltas(involved)
+    new_deltas = old_deltas.copy()
+
+    offsets = np.asarray(base_points, dtype=np.float64)[involved, axis] - base_mid
+    seam_mask = np.abs(offsets) < tolerance
+    target_mask = ~seam_mask & (involved_partners != -1)
+    if not flip:
+        target_mask &= (offsets > 0) if neg_to_pos else (offsets < 0)
+
+    partner_deltas = _get_deltas(involved_partners[target_mask])
+    partner_deltas[:, axis] *= -1
+    new_deltas[target_mask] = partner_deltas
+    if flip:
+        new_deltas[seam_mask, axis] *= -1
+    else:
+        new_deltas[seam_mask, axis] = 0.0
+
+    changed = np.any(np.abs(new_deltas - old_deltas) > epsilon, axis=1)
+
+    return involved[changed], new_deltas[changed]
+
+
+def blend_points(points, target_points, weights, out=None):
+    """
+    Blends given points towards target points by the given per vertex weights in one pass
+    :param points: np.array, (N, 3) array of points
+    :param target_points: np.array, (N, 3) array of target points
+    :param weights: np.array, (N, ) array of weights. 0 keeps points and 1 moves them to target points
+    :param out: np.array or None, (N, 3) array where result is stored. If not given, a new array is allocated.
+    :return: np.array
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1, 1)
+    offsets = (np.asarray(target_points, dtype=np.float64) - points) * weights
+    if out is None:
+        return points + offsets
+
+    np.add(points, offsets, out=out)
+
+    return out
+
+
+def mirror_points(
+        points, base_points, mirror_map, axis=0, mid=0.0, base_mid=0.0, tolerance=0.001, neg_to_pos=False,
+        flip=False, indices=None, weights=None, out=None):
+    """
+    Returns a copy of the given points with the given vertices mirrored (or flipped) across the mirror plane
+    Sides are classified using base points, the same way mirror_selected server command does.
+    :param points: np.array, (N, 3) array of points to mirror
+    :param base_points: np.array, (N, 3) array of points of the base geometry
+    :param mirror_map: np.array, array that maps each vertex with its mirror vertex (see get_mirror_map)
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param mid: float, position of the mirror plane of the points
+    :param base_mid: float, position of the mirror plane of the base points
+    :param tolerance: float, vertices closer than this value to the base mirror plane are considered seam vertices
+    :param neg_to_pos: bool, whether to mirror from negative side to positive side
+    :param flip: bool, whether to swap both sides instead of mirroring one side into the other
+    :param indices: np.array or None, indices of the vertices to operate on. If not given, all vertices are used.
+    :param weights: np.array or None, (N, ) array with the weight of each vertex (such as soft selection weights).
+        If given, new positions are blended by the weight of the vertex they are mirrored from, so a target vertex
+        follows the falloff of its source vertex.
+    :param out: np.array or None, (N, 3) array where result is stored (such as a memory-mapped array). If not given,
+        a new array is allocated.
+    :return: np.array
+    """
+
+    mirror_indices = get_mirror_indices(
+        base_points, mirror_map, axis=axis, base_mid=base_mid, tolerance=tolerance, neg_to_pos=neg_to_pos,
+        indices=indices)
+    if weights is None:
+        return apply_mirror(points, mirror_indices, axis=axis, mid=mid, flip=flip, out=out)
+
+    points = np.asarray(points, dtype=np.float64)
+    source_verts, target_verts, _ = mirror_indices
+    blend_weights = np.array(weights, dtype=np.float64)
+    blend_weights[target_verts] = blend_weights[source_verts]
+    new_points = apply_mirror(points, mirror_indices, axis=axis, mid=mid, flip=flip)
+
+    return blend_points(points, new_points, blend_weights, out=out)
+
+
+def get_symmetric_pairs_mask(points, pairs, axis=0, tolerance=0.001, mid=0.0):
+    """
+    Returns which of the given pairs are still symmetric with the given points
+    :param points: np.array, (N, 3) array of points
+    :param pairs: np.array, (K, 2) array of vertex index pairs
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param tolerance: float
+    :param mid: float, position of the mirror plane along the mirror axis
+    :return: np.array, (K, ) boolean array
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    other_axes = [(axis + 1) % 3, (axis + 2) % 3]
+
+    offsets_a = points[pairs[:, 0], axis] - mid
+    offsets_b = points[pairs[:, 1], axis] - mid
+    opposite_sides = (np.minimum(offsets_a, offsets_b) < consts.MID_OFFSET_TOLERANCE) & (
+        np.maximum(offsets_a, offsets_b) >= consts.MID_OFFSET_TOLERANCE)
+    off_seam = (np.abs(offsets_a) >= tolerance) & (np.abs(offsets_b) >= tolerance)
+    same_offset = np.abs(offsets_a + offsets_b) <= tolerance
+    same_others = np.all(np.abs(points[pairs[:, 0]][:, other_axes] - points[pairs[:, 1]][:, other_axes]) < tolerance,
+                         axis=1)
+
+    return opposite_sides & off_seam & same_offset & same_others
+
+
+def get_mirror_distances(points, axis=0, mid=0.0, max_tolerance=0.01):
+    """
+    Returns, for each vertex, the smallest tolerance that makes it symmetric: its distance to the mirror plane or the
+    distance between its mirrored position and its nearest vertex, whichever is smaller.
+    Distances are measured per axis (as tolerance is). Points are hashed in a grid of max_tolerance sized cells and
+    only the cells around each mirrored position are searched, so distances bigger than max_tolerance are returned as
+    infinite.
+    :param points: np.array, (N, 3) array of points
+    :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+    :param mid: float, position of the mirror plane along the mirror axis
+    :param max_tolerance: float, maximum distance searched
+    :return: np.array, (N, ) array of distances
+    """
+
+    points = np.asarray(points, dtype=np.float64)
+    distances = np.abs(points[:, axis] - mid)
+    distances[distances > max_tolerance] = np.inf
+    if not len(points):
+        return distances
+
+    mirrored = points.copy()
+    mirrored[:, axis] = 2 * mid - mirrored[:, axis]
+
+    # Cells are offset by one so neighbour cells of every mirrored position have positive coordinates
+    cells = np.floor(points / max_tolerance).astype(np.int64)
+    mirrored_cells = np.floor(mirrored / max_tolerance).astype(np.int64)
+    min_cell = np.minimum(cells.min(axis=0), mirrored_cells.min(axis=0)) - 1
+    cells -= min_cell
+    mirrored_cells -= min_cell
+    extents = np.maximum(cells.max(axis=0), mirrored_cells.max(axis=0)) + 2
+
+    def _get_keys(cell_coords):
+        return (cell_coords[:, 0] * extents[1] + cell_coords[:, 1]) * extents[2] + cell_coords[:, 2]
+
+    keys = _get_keys(cells)
+    order = np.argsort(keys, kind='mergesort')
+    sorted_keys = keys[order]
+    sorted_points = points[order]
+
+    for offset in np.array(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1])).reshape(3, -1).T:
+        neighbour_keys = _get_keys(mirrored_cells + offset)
+        lower = np.searchsorted(sorted_keys, neighbour_keys, side='left')
+        upper = np.searchsorted(sorted_keys, neighbour_keys, side='right')
+
+        # Candidates of each vertex are a contiguous window of the sorted points, so windows are walked one position
+        # at a time for all vertices at once instead of looping over vertices
+        active = np.flatnonzero(upper > lower)
+        position = lower[active]
+        while len(active):
+            candidate_distances = np.max(np.abs(sorted_points[position] - mirrored[active]), axis=1)
+            distances[active] = np.minimum(distances[active], candidate_distances)
+            position += 1
+            remaining = position < upper[active]
+            active = active[remaining]
+            position = position[remaining]
+
+    distances[distances > max_tolerance] = np.inf
+
+    return distances
+
+
+class IncrementalSymmetryCheck(object):
+    """
+    Class that keeps the last symmetry table of a geometry and the points it was built with, so symmetry can be
+    re-checked validating only the vertices that changed (and their mirror partners)
+    Points are referenced, not copied (so memory-mapped points stay memory-mapped). Given arrays must not be modified
+    in place; new points must be given as new arrays.
+    """
+
+    __slots__ = ('axis', 'tolerance', 'mid', '_points', '_mirror_map', '_shells', '_shell_map')
+
+    def __init__(self, points, axis=0, tolerance=0.001, mid=0.0, shells=None):
+        """
+        :param points: np.array, (N, 3) array of points
+        :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+        :param tolerance: float
+        :param mid: float, position of the mirror plane along the mirror axis
+        :param shells: np.array or None, shell index of each vertex. If given, vertices are matched inside shells
+            and their mirror shells first (see build_shell_symmetry_table).
+        """
+
+        self.axis = axis
+        self.tolerance = tolerance
+        self.mid = mid
+        self._points = np.asarray(points, dtype=np.float64)
+        self._shells = None if shells is None else np.asarray(shells, dtype=np.int64)
+        self._shell_map = None
+
+        if self._shells is None:
+            pairs, seam, _ = build_symmetry_table(self._points, axis=axis, tolerance=tolerance, mid=mid)
+        else:
+            self._shell_map = match_shells(self._points, self._shells, axis=axis, tolerance=tolerance, mid=mid)
+            pairs, seam, _ = build_shell_symmetry_table(
+                self._points, self._shells, axis=axis, tolerance=tolerance, mid=mid, shell_map=self._shell_map)
+        self._mirror_map = get_mirror_map(pairs, seam, len(self._points))
+
+    @property
+    def vertex_count(self):
+        return len(self._points)
+
+    @property
+    def mirror_map(self):
+        return self._mirror_map
+
+    @property
+    def asymmetric(self):
+        return np.flatnonzero(self._mirror_map == -1)
+
+    @property
+    def seam(self):
+        return np.flatnonzero(self._mirror_map == np.arange(len(self._mirror_map)))
+
+    @property
+    def is_symmetric(self):
+        return not np.any(self._mirror_map == -1)
+
+    @property
+    def pairs(self):
+        """
+        Returns current symmetry pairs with positive side vertex first
+        :return: np.array, (K, 2) array of positive/negative vertex index pairs
+        """
+
+        indices = np.arange(len(self._mirror_map))
+        paired = (self._mirror_map != -1) & (self._mirror_map != indices)
+        positive = (self._points[:, self.axis] - self.mid) >= consts.MID_OFFSET_TOLERANCE
+        pos_verts = indices[paired & positive]
+
+        return np.column_stack([pos_verts, self._mirror_map[pos_verts]])
+
+    def matches(self, axis, tolerance, mid, vertex_count):
+        """
+        Returns whether or not this check was built with the given settings
+        :param axis: int
+        :param tolerance: float
+        :param mid: float
+        :param vertex_count: int
+        :return: bool
+        """
+
+        return axis == self.axis and tolerance == self.tolerance and mid == self.mid and (
+            vertex_count == self.vertex_count)
+
+    def update(self, points):
+        """
+        Updates symmetry data with the given points. Only changed vertices and their partners are validated again.
+        :param points: np.array, (N, 3) array of points. Check references this array from now on.
+        :return: np.array, indices of the vertices that changed
+        """
+
+        points = np.asarray(points, dtype=np.float64)
+        changed = np.flatnonzero(np.any(points != self._points, axis=1)) if points is not self._points else \
+            np.zeros(0, dtype=np.int64)
+        self._points = points
+        if not len(changed):
+            return changed
+
+        mirror_map = self._mirror_map
+        partners = mirror_map[changed]
+        affected = np.unique(np.concatenate([changed, partners[partners != -1]]))
+
+        # Affected vertices are unpaired and validated again: pairs that are still symmetric are kept, seam vertices
+        # are classified again and the rest are added to the pool of vertices that need to be matched
+        affected_partners = mirror_map[affected]
+        seam_mask = affected_partners == affected
+        pair_mask = (affected_partners != -1) & ~seam_mask
+        pairs = np.column_stack([affected[pair_mask], affected_partners[pair_mask]])
+        broken = pairs[~get_symmetric_pairs_mask(self._points, pairs, self.axis, self.tolerance, self.mid)]
+        mirror_map[broken.ravel()] = -1
+        mirror_map[affected[seam_mask]] = -1
+
+        unpaired = affected[mirror_map[affected] == -1]
+        on_seam = unpaired[np.abs(self._points[unpaired, self.axis] - self.mid) < self.tolerance]
+        mirror_map[on_seam] = on_seam
+
+        pool = np.flatnonzero(mirror_map == -1)
+        if len(pool):
+            pool_pairs, _, _ = build_symmetry_table(
+                self._points[pool], axis=self.axis, tolerance=self.tolerance, mid=self.mid,
+                shells=None if self._shells is None else self._shells[pool], shell_map=self._shell_map)
+            pool_pairs = pool[pool_pairs]
+            mirror_map[pool_pairs[:, 0]] = pool_pairs[:, 1]
+            mirror_map[pool_pairs[:, 1]] = pool_pairs[:, 0]
+
+        return changed
+
+
+class ToleranceSweep(object):
+    """
+    Class that stores the sorted mirror distances of a geometry, so the number of vertices that are symmetric with
+    any tolerance is answered with a binary search instead of checking symmetry again
+    """
+
+    __slots__ = ('axis', 'mid', 'max_tolerance', '_distances')
+
+    def __init__(self, points, axis=0, mid=0.0, max_tolerance=0.01):
+        self.axis = axis
+        self.mid = mid
+        self.max_tolerance = max_tolerance
+        self._distances = np.sort(get_mirror_distances(points, axis=axis, mid=mid, max_tolerance=max_tolerance))
+
+    @property
+    def vertex_count(self):
+        return len(self._distances)
+
+    def matches(self, axis, mid, vertex_count, tolerance=0.0):
+        """
+        Returns whether or not this sweep was built with the given settings and covers the given tolerance
+        :param axis: int
+        :param mid: float
+        :param vertex_count: int
+        :param tolerance: float
+        :return: bool
+        """
+
+        return axis == self.axis and mid == self.mid and vertex_count == self.vertex_count and (
+            tolerance <= self.max_tolerance)
+
+    def count(self, tolerance):
+        """
+        Returns the number of matched and unmatched vertices with the given tolerance
+        Matched vertices are the ones that have a mirrored vertex (or are seam vertices) within tolerance. Vertex
+        pairs are not required to be unique, so matched vertices are an upper bound of the vertices a symmetry table
+        built with the same tolerance pairs.
+        :param tolerance: float
+        :return: tuple(int, int)
+        """
+
+        matched = int(np.searchsorted(self._distances, tolerance, side='left'))
+
+        return matched, len(self._distances) - matched
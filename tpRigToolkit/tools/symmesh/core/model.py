@@ -9,18 +9,22 @@ from __future__ import print_function, division, absolute_import
 
 from Qt.QtCore import QObject, Signal
 
-from tpDcc.libs.python import python
-
 
 class SymmeshModel(QObject):
 
     mirrorAxisChanged = Signal(int)
+    autoMirrorAxisChanged = Signal(bool)
     globalToleranceChanged = Signal(float)
+    toleranceCountsChanged = Signal(int, int)
     operateFromPositiveToNegativeXAxisChanged = Signal(bool)
     usePivotAsOriginChanged = Signal(bool)
+    topologySymmetryChanged = Signal(bool)
+    mirrorDeltasChanged = Signal(bool)
+    selectionMirrorModeChanged = Signal(int)
+    useSoftSelectionChanged = Signal(bool)
     baseGeoChanged = Signal(str)
     altBaseGeoChanged = Signal(str)
-    symmetryTableChanged = Signal(list)
+    symmetryTableChanged = Signal(object)
     isSymmetricChanged = Signal(bool)
     revertBiasChanged = Signal(float)
     liveRevertBiasChanged = Signal(bool)
@@ -29,13 +33,19 @@ class SymmeshModel(QObject):
         super(SymmeshModel, self).__init__()
 
         self._mirror_axis = 0
+        self._auto_mirror_axis = False
         self._global_tolerance = 0.0010
+        self._tolerance_counts = (-1, -1)
         self._operate_from_positive_to_negative_x_axis = False
         self._use_pivot_as_origin = True
+        self._topology_symmetry = False
+        self._mirror_deltas = False
+        self._selection_mirror_mode = 0
+        self._use_soft_selection = False
         self._base_geo = ''
         self._alt_base_geo = ''
-        self._selected_vertices = list()
-        self._symmetry_table = list()
+        self._selected_vertices = None
+        self._symmetry_table = None
         self._is_symmetric = False
         self._revert_bias = 1.0
         self._live_revert_bias = False
@@ -49,6 +59,15 @@ class SymmeshModel(QObject):
         self._mirror_axis = int(value)
         self.mirrorAxisChanged.emit(self._mirror_axis)
 
+    @property
+    def auto_mirror_axis(self):
+        return self._auto_mirror_axis
+
+    @auto_mirror_axis.setter
+    def auto_mirror_axis(self, flag):
+        self._auto_mirror_axis = bool(flag)
+        self.autoMirrorAxisChanged.emit(self._auto_mirror_axis)
+
     @property
     def global_tolerance(self):
         return self._global_tolerance
@@ -58,6 +77,16 @@ class SymmeshModel(QObject):
         self._global_tolerance = float(value)
         self.globalToleranceChanged.emit(self._global_tolerance)
 
+    @property
+    def tolerance_counts(self):
+        return self._tolerance_counts
+
+    @tolerance_counts.setter
+    def tolerance_counts(self, value):
+        matched, unmatched = value
+        self._tolerance_counts = (int(matched), int(unmatched))
+        self.toleranceCountsChanged.emit(*self._tolerance_counts)
+
     @property
     def operate_from_positive_to_negative_x_axis(self):
         return self._operate_from_positive_to_negative_x_axis
@@ -76,6 +105,42 @@ class SymmeshModel(QObject):
         self._use_pivot_as_origin = bool(flag)
         self.usePivotAsOriginChanged.emit(self._use_pivot_as_origin)
 
+    @property
+    def topology_symmetry(self):
+        return self._topology_symmetry
+
+    @topology_symmetry.setter
+    def topology_symmetry(self, flag):
+        self._topology_symmetry = bool(flag)
+        self.topologySymmetryChanged.emit(self._topology_symmetry)
+
+    @property
+    def mirror_deltas(self):
+        return self._mirror_deltas
+
+    @mirror_deltas.setter
+    def mirror_deltas(self, flag):
+        self._mirror_deltas = bool(flag)
+        self.mirrorDeltasChanged.emit(self._mirror_deltas)
+
+    @property
+    def selection_mirror_mode(self):
+        return self._selection_mirror_mode
+
+    @selection_mirror_mode.setter
+    def selection_mirror_mode(self, value):
+        self._selection_mirror_mode = int(value)
+        self.selectionMirrorModeChanged.emit(self._selection_mirror_mode)
+
+    @property
+    def use_soft_selection(self):
+        return self._use_soft_selection
+
+    @use_soft_selection.setter
+    def use_soft_selection(self, flag):
+        self._use_soft_selection = bool(flag)
+        self.useSoftSelectionChanged.emit(self._use_soft_selection)
+
     @property
     def base_geo(self):
         return self._base_geo
@@ -99,8 +164,8 @@ class SymmeshModel(QObject):
         return self._selected_vertices
 
     @selected_vertices.setter
-    def selected_vertices(self, vertices_list):
-        self._selected_vertices = python.force_list(vertices_list)
+    def selected_vertices(self, vertex_selection):
+        self._selected_vertices = vertex_selection
 
     @property
     def symmetry_table(self):
@@ -108,7 +173,12 @@ class SymmeshModel(QObject):
 
     @symmetry_table.setter
     def symmetry_table(self, value):
-        self._symmetry_table = python.force_list(value)
+        """
+        Sets symmetry table. Table is stored and emitted by reference, so its arrays are never copied
+        :param value: SymmetryTable or None
+        """
+
+        self._symmetry_table = value
         self.symmetryTableChanged.emit(self._symmetry_table)
 
     @property
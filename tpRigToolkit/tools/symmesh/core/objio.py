@@ -0,0 +1,264 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains Wavefront OBJ reading and writing functions used by tpRigToolkit-tools-symmesh offline tools
+OBJ files are streamed so memory footprint only depends on the size of the returned arrays and the chunk size
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_PRECISION = 6
+
+VERTEX_RECORD = b'v'
+
+
+class ObjMesh(object):
+    """
+    Class that stores the geometry data of an OBJ file
+    Faces are stored in a compact way: face_counts stores the number of vertices of each face and face_vertices
+    stores the vertex indices of all faces one after the other
+    """
+
+    __slots__ = ('points', 'face_counts', 'face_vertices')
+
+    def __init__(self, points, face_counts=None, face_vertices=None):
+        self.points = points
+        self.face_counts = face_counts if face_counts is not None else np.zeros(0, dtype=np.int32)
+        self.face_vertices = face_vertices if face_vertices is not None else np.zeros(0, dtype=np.int32)
+
+    @property
+    def vertex_count(self):
+        return len(self.points)
+
+    @property
+    def face_count(self):
+        return len(self.face_counts)
+
+
+def count_obj_records(file_path):
+    """
+    Counts vertex and face records of the given OBJ file without storing any of them
+    :param file_path: str, path of the OBJ file
+    :return: tuple(int, int, int), number of vertices, number of faces and total number of face vertices
+    """
+
+    total_vertices = total_faces = total_face_vertices = 0
+    with open(file_path, 'rb') as obj_file:
+        for line in obj_file:
+            record = line[:2]
+            if record == b'v ' or record == b'v\t':
+                total_vertices += 1
+            elif record == b'f ' or record == b'f\t':
+                total_faces += 1
+                total_face_vertices += len(line.split()) - 1
+
+    return total_vertices, total_faces, total_face_vertices
+
+
+def read_obj(file_path, read_faces=True, chunk_size=DEFAULT_CHUNK_SIZE, allocate_points=None):
+    """
+    Reads vertex positions and faces of the given OBJ file
+    File is read twice: first pass counts records so output arrays can be preallocated and second pass parses
+    records in chunks of the given size directly into those arrays.
+    :param file_path: str, path of the OBJ file
+    :param read_faces: bool, whether or not face records should be read
+    :param chunk_size: int, number of records parsed at once
+    :param allocate_points: callable or None, function that receives the shape of the points array and returns the
+        array where points are stored (such as PointCache.create). If not given, a new array is allocated.
+    :return: ObjMesh
+    """
+
+    total_vertices, total_faces, total_face_vertices = count_obj_records(file_path)
+    if allocate_points:
+        points = allocate_points((total_vertices, 3))
+    else:
+        points = np.empty((total_vertices, 3), dtype=np.float64)
+    face_counts = np.empty(total_faces if read_faces else 0, dtype=np.int32)
+    face_vertices = np.empty(total_face_vertices if read_faces else 0, dtype=np.int32)
+
+    vertex_buffer = list()
+    face_buffer = list()
+    face_vertex_counts = list()
+    vertex_index = face_index = face_vertex_index = 0
+
+    def _flush_vertices():
+        values = np.array(b' '.join(vertex_buffer).split(), dtype=np.float64).reshape(-1, 3)
+        points[vertex_index:vertex_index + len(values)] = values
+        del vertex_buffer[:]
+        return vertex_index + len(values)
+
+    def _flush_faces():
+        counts = np.array([len(face) for face in face_buffer], dtype=np.int32)
+        indices = np.array(
+            [token.split(b'/', 1)[0] for face in face_buffer for token in face], dtype=np.int64)
+        # OBJ indices are 1-based and negative indices are relative to the vertices read so far
+        vertices_so_far = np.repeat(np.array(face_vertex_counts, dtype=np.int64), counts)
+        indices = np.where(indices < 0, vertices_so_far + indices, indices - 1)
+        face_counts[face_index:face_index + len(counts)] = counts
+        face_vertices[face_vertex_index:face_vertex_index + len(indices)] = indices
+        del face_buffer[:]
+        del face_vertex_counts[:]
+        return face_index + len(counts), face_vertex_index + len(indices)
+
+    with open(file_path, 'rb') as obj_file:
+        for line in obj_file:
+            record = line[:2]
+            if record == b'v ' or record == b'v\t':
+                vertex_buffer.append(b' '.join(line.split()[1:4]))
+                if len(vertex_buffer) >= chunk_size:
+                    vertex_index = _flush_vertices()
+            elif read_faces and (record == b'f ' or record == b'f\t'):
+                face_buffer.append(line.split()[1:])
+                face_vertex_counts.append(vertex_index + len(vertex_buffer))
+                if len(face_buffer) >= chunk_size:
+                    face_index, face_vertex_index = _flush_faces()
+        if vertex_buffer:
+            vertex_index = _flush_vertices()
+        if face_buffer:
+            face_index, face_vertex_index = _flush_faces()
+
+    return ObjMesh(points, face_counts, face_vertices)
+
+
+def read_obj_points(file_path, chunk_size=DEFAULT_CHUNK_SIZE, allocate_points=None):
+    """
+    Reads vertex positions of the given OBJ file
+    :param file_path: str, path of the OBJ file
+    :param chunk_size: int, number of records parsed at once
+    :param allocate_points: callable or None, function that returns the array where points are stored
+    :return: np.array, (N, 3) array of vertex positions
+    """
+
+    return read_obj(file_path, read_faces=False, chunk_size=chunk_size, allocate_points=allocate_points).points
+
+
+def _format_vertex_line(tokens, point, precision):
+    """
+    Internal function that returns a new vertex record line with the given position
+    Extra vertex values (such as vertex colors) are kept
+    :param tokens: list(bytes), tokens of the original vertex record
+    :param point: np.array, vertex position
+    :param precision: int, number of decimals
+    :return: bytes
+    """
+
+    values = ['{:.{}f}'.format(value, precision).encode('ascii') for value in point]
+
+    return b' '.join([VERTEX_RECORD] + values + tokens[4:])
+
+
+def _changed_vertices_mask(points, indices):
+    """
+    Internal function that returns a boolean mask with the vertices that should be written
+    :param points: np.array
+    :param indices: list(int) or np.array or None
+    :return: np.array
+    """
+
+    mask = np.zeros(len(points), dtype=bool)
+    if indices is None:
+        mask[:] = True
+    else:
+        mask[np.asarray(indices, dtype=np.int64)] = True
+
+    return mask
+
+
+def write_obj_points(file_path, points, output_path=None, indices=None, precision=DEFAULT_PRECISION):
+    """
+    Writes given vertex positions into an OBJ file rewriting only the vertex records that changed
+    All other records (faces, normals, uvs, groups, ...) are kept untouched
+    :param file_path: str, path of the source OBJ file
+    :param points: np.array, (N, 3) array of vertex positions
+    :param output_path: str or None, path where new OBJ file is written. If not given, source file is patched in
+        place.
+    :param indices: list(int) or None, indices of the vertices to write. If not given, all vertices whose position
+        differs from the one stored in the file are written.
+    :param precision: int, number of decimals used to write vertex positions
+    """
+
+    if not output_path or os.path.normpath(output_path) == os.path.normpath(file_path):
+        if _patch_obj_points(file_path, points, indices=indices, precision=precision):
+            return
+        output_path = None
+
+    points = np.asarray(points)
+    mask = _changed_vertices_mask(points, indices)
+    epsilon = 0.5 * 10 ** -precision
+    target_path = output_path
+    if not output_path:
+        file_handle, target_path = tempfile.mkstemp(suffix='.obj', dir=os.path.dirname(os.path.abspath(file_path)))
+        os.close(file_handle)
+
+    vertex_index = 0
+    with open(file_path, 'rb') as obj_file:
+        with open(target_path, 'wb') as output_file:
+            for line in obj_file:
+                record = line[:2]
+                if record == b'v ' or record == b'v\t':
+                    if mask[vertex_index]:
+                        tokens = line.split()
+                        old_point = np.array(tokens[1:4], dtype=np.float64)
+                        if np.any(np.abs(old_point - points[vertex_index]) > epsilon):
+                            # Original line terminator is kept, so CRLF files do not end with mixed line endings
+                            line_ending = line[len(line.rstrip(b'\r\n')):]
+                            line = _format_vertex_line(tokens, points[vertex_index], precision) + line_ending
+                    vertex_index += 1
+                output_file.write(line)
+
+    if not output_path:
+        shutil.move(target_path, file_path)
+
+
+def _patch_obj_points(file_path, points, indices=None, precision=DEFAULT_PRECISION):
+    """
+    Internal function that patches vertex records of the given OBJ file in place
+    New records are padded with spaces to keep the original record length, so the rest of the file is not touched.
+    :param file_path: str, path of the OBJ file
+    :param points: np.array, (N, 3) array of vertex positions
+    :param indices: list(int) or None, indices of the vertices to write
+    :param precision: int, number of decimals used to write vertex positions
+    :return: bool, True if all changed records could be patched in place; False if some new record does not fit
+        in its original record and the file needs to be rewritten.
+    """
+
+    points = np.asarray(points)
+    mask = _changed_vertices_mask(points, indices)
+    epsilon = 0.5 * 10 ** -precision
+
+    vertex_index = 0
+    with open(file_path, 'r+b') as obj_file:
+        while True:
+            offset = obj_file.tell()
+            line = obj_file.readline()
+            if not line:
+                break
+            record = line[:2]
+            if record != b'v ' and record != b'v\t':
+                continue
+            write_vertex = mask[vertex_index]
+            point = points[vertex_index]
+            vertex_index += 1
+            if not write_vertex:
+                continue
+            tokens = line.split()
+            old_point = np.array(tokens[1:4], dtype=np.float64)
+            if not np.any(np.abs(old_point - point) > epsilon):
+                continue
+            content = line.rstrip(b'\r\n')
+            new_content = _format_vertex_line(tokens, point, precision)
+            if len(new_content) > len(content):
+                return False
+            obj_file.seek(offset)
+            obj_file.write(new_content.ljust(len(content)))
+            obj_file.seek(offset + len(line))
+
+    return True
@@ -0,0 +1,154 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains opt-in profiling utilities used by tpRigToolkit-tools-symmesh server commands
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+import time
+import logging
+import cProfile
+import functools
+
+try:
+    import tracemalloc
+except ImportError:
+    # tracemalloc is only available in Python 3
+    tracemalloc = None
+
+from tpRigToolkit.tools.symmesh.core import consts
+
+logger = logging.getLogger(consts.TOOL_ID)
+
+
+def get_default_profiles_directory():
+    """
+    Returns default directory where profile files are stored
+    :return: str
+    """
+
+    return os.path.normpath(
+        os.path.join(os.path.expanduser('~'), 'tpRigToolkit', 'logs', 'tools', 'symmesh_profiles'))
+
+
+class CommandProfiler(object):
+    """
+    Class that profiles the next N executed commands with cProfile and tracemalloc
+    """
+
+    def __init__(self):
+        super(CommandProfiler, self).__init__()
+
+        self._remaining = 0
+        self._output_directory = get_default_profiles_directory()
+        self._profile_index = 0
+
+    @property
+    def remaining(self):
+        return self._remaining
+
+    @property
+    def output_directory(self):
+        return self._output_directory
+
+    def enable(self, count=1, output_directory=None):
+        """
+        Enables profiling for the next given number of commands
+        :param count: int, number of commands to profile
+        :param output_directory: str or None, directory where profile files are stored
+        """
+
+        self._remaining = max(0, int(count))
+        self._output_directory = output_directory or get_default_profiles_directory()
+
+    def disable(self):
+        """
+        Disables profiling of commands
+        """
+
+        self._remaining = 0
+
+    def run(self, command_name, geo, fn, *args, **kwargs):
+        """
+        Executes given function profiling it if profiling is enabled
+        :param command_name: str, name of the command being executed
+        :param geo: str, name of the geometry the command operates on
+        :param fn: callable
+        :return: object, result of the function call
+        """
+
+        if self._remaining <= 0:
+            return fn(*args, **kwargs)
+        self._remaining -= 1
+
+        base_path = self._get_base_path(command_name, geo)
+        profile = cProfile.Profile()
+        trace_memory = tracemalloc is not None and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start()
+        try:
+            return profile.runcall(fn, *args, **kwargs)
+        finally:
+            snapshot = tracemalloc.take_snapshot() if trace_memory else None
+            if trace_memory:
+                tracemalloc.stop()
+            self._save(base_path, profile, snapshot)
+
+    def _get_base_path(self, command_name, geo):
+        """
+        Internal function that returns base path (without extension) of the profile files of the given command
+        Names include milliseconds and an increasing profile index, so commands profiled within the same second (or
+        with no geometry) never overwrite each other
+        :param command_name: str
+        :param geo: str
+        :return: str
+        """
+
+        geo_name = re.sub(r'[^\w\-]+', '_', geo or '').strip('_') or 'no_geo'
+        current_time = time.time()
+        self._profile_index += 1
+        file_name = '{}_{}_{}_{:03d}_{:04d}'.format(
+            command_name, geo_name, time.strftime('%Y%m%d_%H%M%S', time.localtime(current_time)),
+            int(current_time * 1000) % 1000, self._profile_index)
+
+        return os.path.join(self._output_directory, file_name)
+
+    def _save(self, base_path, profile, snapshot=None):
+        """
+        Internal function that stores profile and memory allocation snapshot files
+        :param base_path: str
+        :param profile: cProfile.Profile
+        :param snapshot: tracemalloc.Snapshot or None
+        """
+
+        try:
+            if not os.path.isdir(self._output_directory):
+                os.makedirs(self._output_directory)
+            profile_path = '{}.prof'.format(base_path)
+            profile.dump_stats(profile_path)
+            logger.info('Command profile stored: {}'.format(profile_path))
+            if snapshot is not None:
+                snapshot_path = '{}.tracemalloc'.format(base_path)
+                snapshot.dump(snapshot_path)
+                logger.info('Command memory allocation snapshot stored: {}'.format(snapshot_path))
+        except Exception as exc:
+            logger.error('Error while storing command profile: {}'.format(exc))
+
+
+def profile_command(fn):
+    """
+    Decorator that allows server commands to be profiled by the server command profiler
+    Decorated function must be a server command method and the server must have a profiler property
+    :param fn: callable
+    :return: callable
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, data, reply):
+        return self.profiler.run(fn.__name__, data.get('geo', ''), fn, self, data, reply)
+
+    return wrapper
@@ -0,0 +1,334 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains vertex selection implementation used by tpRigToolkit-tools-symmesh
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import base64
+import struct
+
+import numpy as np
+
+REPLACE_MODE = 0
+ADD_MODE = 1
+TOGGLE_MODE = 2
+INTERSECT_MODE = 3
+
+BITSET_ENCODING = 0
+INDICES_ENCODING = 1
+
+INDICES_DTYPE = np.dtype('<i4')
+HEADER_FORMAT = '<BI'
+
+# Number of set bits of each byte value
+POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def combine_masks(mask, mirror_mask, mode=REPLACE_MODE):
+    """
+    Combines a selection with its mirror selection. Works both with boolean masks and packed bitsets
+    :param mask: np.array, selection boolean mask or bitset
+    :param mirror_mask: np.array, mirror selection boolean mask or bitset
+    :param mode: int, REPLACE_MODE (mirror selection), ADD_MODE (union), TOGGLE_MODE (vertices selected in only one of
+        them) or INTERSECT_MODE (vertices selected in both)
+    :return: np.array
+    """
+
+    if mode == REPLACE_MODE:
+        return mirror_mask.copy()
+    elif mode == ADD_MODE:
+        return mask | mirror_mask
+    elif mode == TOGGLE_MODE:
+        return mask ^ mirror_mask
+    elif mode == INTERSECT_MODE:
+        return mask & mirror_mask
+
+    raise ValueError('Invalid selection mirror mode: {}'.format(mode))
+
+
+class VertexSelection(object):
+    """
+    Class that stores a selection of vertices of a geometry as a bitset (one bit per vertex)
+    Selecting half of a 2M vertices geometry takes 250KB. When serialized, selections are stored as a bitset or as a
+    sorted index array, whatever is smaller.
+    """
+
+    __slots__ = ('bits', 'vertex_count')
+
+    def __init__(self, bits, vertex_count):
+        """
+        :param bits: np.array, packed bitset (see np.packbits) with one bit per vertex
+        :param vertex_count: int, total number of vertices of the geometry
+        """
+
+        self.bits = np.asarray(bits, dtype=np.uint8)
+        self.vertex_count = int(vertex_count)
+
+    def __len__(self):
+        return int(POPCOUNT_TABLE[self.bits].sum(dtype=np.int64))
+
+    def __bool__(self):
+        return bool(np.any(self.bits))
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, vertex_index):
+        if vertex_index < 0 or vertex_index >= self.vertex_count:
+            return False
+
+        return bool(self.bits[vertex_index >> 3] & (0x80 >> (vertex_index & 7)))
+
+    def __iter__(self):
+        return iter(self.indices.tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, VertexSelection):
+            return NotImplemented
+
+        return self.vertex_count == other.vertex_count and np.array_equal(self.bits, other.bits)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __xor__(self, other):
+        return self.symmetric_difference(other)
+
+    def __repr__(self):
+        return '{}(selected={}, vertices={})'.format(self.__class__.__name__, len(self), self.vertex_count)
+
+    @classmethod
+    def empty(cls, vertex_count):
+        """
+        Creates a new selection with no vertices selected
+        :param vertex_count: int, total number of vertices of the geometry
+        :return: VertexSelection
+        """
+
+        return cls(np.zeros((vertex_count + 7) // 8, dtype=np.uint8), vertex_count)
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        Creates a new selection from the given boolean mask
+        :param mask: np.array, (N, ) boolean array
+        :return: VertexSelection
+        """
+
+        mask = np.asarray(mask, dtype=bool)
+
+        return cls(np.packbits(mask), len(mask))
+
+    @classmethod
+    def from_indices(cls, indices, vertex_count):
+        """
+        Creates a new selection from the given vertex indices
+        :param indices: list(int) or np.array, vertex indices. Indices out of range are ignored.
+        :param vertex_count: int, total number of vertices of the geometry
+        :return: VertexSelection
+        """
+
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        mask = np.zeros(vertex_count, dtype=bool)
+        mask[indices[(indices >= 0) & (indices < vertex_count)]] = True
+
+        return cls.from_mask(mask)
+
+    @property
+    def mask(self):
+        """
+        Returns the selection as a boolean mask
+        :return: np.array, (N, ) boolean array
+        """
+
+        return np.unpackbits(self.bits)[:self.vertex_count].astype(bool)
+
+    @property
+    def indices(self):
+        """
+        Returns the sorted indices of the selected vertices
+        :return: np.array
+        """
+
+        return np.flatnonzero(np.unpackbits(self.bits)[:self.vertex_count])
+
+    def copy(self):
+        """
+        Returns a copy of this selection
+        :return: VertexSelection
+        """
+
+        return self.__class__(self.bits.copy(), self.vertex_count)
+
+    def union(self, other):
+        """
+        Returns a new selection with the vertices selected in this selection or in the given one
+        :param other: VertexSelection
+        :return: VertexSelection
+        """
+
+        self._check_vertex_count(other)
+
+        return self.__class__(self.bits | other.bits, self.vertex_count)
+
+    def intersection(self, other):
+        """
+        Returns a new selection with the vertices selected both in this selection and in the given one
+        :param other: VertexSelection
+        :return: VertexSelection
+        """
+
+        self._check_vertex_count(other)
+
+        return self.__class__(self.bits & other.bits, self.vertex_count)
+
+    def difference(self, other):
+        """
+        Returns a new selection with the vertices of this selection that are not selected in the given one
+        :param other: VertexSelection
+        :return: VertexSelection
+        """
+
+        self._check_vertex_count(other)
+
+        return self.__class__(self.bits & ~other.bits, self.vertex_count)
+
+    def symmetric_difference(self, other):
+        """
+        Returns a new selection with the vertices selected in only one of this selection and the given one
+        :param other: VertexSelection
+        :return: VertexSelection
+        """
+
+        self._check_vertex_count(other)
+
+        return self.__class__(self.bits ^ other.bits, self.vertex_count)
+
+    def mirror(self, mirror_map):
+        """
+        Returns a new selection with the mirror vertices of the selected vertices
+        Vertices with no mirror vertex (mapped to -1) keep themselves selected
+        :param mirror_map: np.array, array that maps each vertex index with the index of its mirror vertex
+        :return: VertexSelection
+        """
+
+        mirror_map = np.asarray(mirror_map)
+        if len(mirror_map) != self.vertex_count:
+            raise ValueError('Mirror map vertex count ({}) does not match selection vertex count ({})'.format(
+                len(mirror_map), self.vertex_count))
+
+        indices = self.indices
+        mirror_indices = mirror_map[indices]
+
+        return self.from_indices(np.where(mirror_indices != -1, mirror_indices, indices), self.vertex_count)
+
+    def combine(self, mirror_selection, mode=REPLACE_MODE):
+        """
+        Returns a new selection that combines this selection with the given mirror selection (see combine_masks)
+        :param mirror_selection: VertexSelection
+        :param mode: int, REPLACE_MODE, ADD_MODE, TOGGLE_MODE or INTERSECT_MODE
+        :return: VertexSelection
+        """
+
+        self._check_vertex_count(mirror_selection)
+
+        return self.__class__(combine_masks(self.bits, mirror_selection.bits, mode=mode), self.vertex_count)
+
+    def grow(self, edges_a, edges_b, steps=1):
+        """
+        Returns a new selection grown to the vertices connected to the selected ones by an edge
+        Edges are given as two vertex arrays (such as mesh edges or engine.get_edges), so each step is a single pass
+        :param edges_a: np.array, first vertex of each edge
+        :param edges_b: np.array, second vertex of each edge
+        :param steps: int, number of times selection is grown
+        :return: VertexSelection
+        """
+
+        edges_a = np.asarray(edges_a, dtype=np.int64)
+        edges_b = np.asarray(edges_b, dtype=np.int64)
+
+        mask = self.mask
+        for _ in range(steps):
+            new_mask = mask.copy()
+            new_mask[edges_b[mask[edges_a]]] = True
+            new_mask[edges_a[mask[edges_b]]] = True
+            if np.array_equal(new_mask, mask):
+                break
+            mask = new_mask
+
+        return self.from_mask(mask)
+
+    def to_bytes(self):
+        """
+        Serializes the selection into bytes: encoding, vertex count and bitset or sorted vertex indices, whatever is
+        smaller
+        :return: bytes
+        """
+
+        indices = self.indices
+        if len(indices) * INDICES_DTYPE.itemsize < len(self.bits):
+            encoding, data = INDICES_ENCODING, indices.astype(INDICES_DTYPE).tobytes()
+        else:
+            encoding, data = BITSET_ENCODING, self.bits.tobytes()
+
+        return struct.pack(HEADER_FORMAT, encoding, self.vertex_count) + data
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a new selection from the given bytes (see to_bytes)
+        :param data: bytes
+        :return: VertexSelection
+        """
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        encoding, vertex_count = struct.unpack(HEADER_FORMAT, data[:header_size])
+        if encoding == INDICES_ENCODING:
+            return cls.from_indices(np.frombuffer(data, dtype=INDICES_DTYPE, offset=header_size), vertex_count)
+
+        return cls(np.frombuffer(data, dtype=np.uint8, offset=header_size).copy(), vertex_count)
+
+    def dumps(self):
+        """
+        Serializes the selection into an ASCII string that can be sent within JSON commands
+        :return: str
+        """
+
+        return base64.b64encode(self.to_bytes()).decode('ascii')
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Creates a new selection from the given string (see dumps)
+        :param data: str
+        :return: VertexSelection or None, None if no data is given
+        """
+
+        if not data:
+            return None
+
+        return cls.from_bytes(base64.b64decode(data))
+
+    def _check_vertex_count(self, other):
+        """
+        Internal function that raises an error if given selection belongs to a geometry with other vertex count
+        :param other: VertexSelection
+        """
+
+        if other.vertex_count != self.vertex_count:
+            raise ValueError('Selection vertex counts do not match: {} != {}'.format(
+                self.vertex_count, other.vertex_count))
@@ -0,0 +1,249 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains symmetry table implementation used by tpRigToolkit-tools-symmesh
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import json
+import base64
+import struct
+import hashlib
+
+import numpy as np
+
+from tpRigToolkit.tools.symmesh.core import consts, engine
+
+SIDE_POSITIVE = 1
+SIDE_NEGATIVE = 2
+SIDE_SEAM = 4
+SIDE_ASYMMETRIC = 8
+SIDE_ALL = SIDE_POSITIVE | SIDE_NEGATIVE | SIDE_SEAM
+
+PAIRS_DTYPE = np.dtype('<i4')
+SIDES_DTYPE = np.dtype('u1')
+HEADER_SIZE_FORMAT = '<I'
+
+
+def get_topology_fingerprint(vertex_count, face_counts=None, face_vertices=None):
+    """
+    Returns a fingerprint of the given topology. Geometries with the same vertex count and faces get the same one
+    :param vertex_count: int, total number of vertices
+    :param face_counts: np.array or None, number of vertices of each face
+    :param face_vertices: np.array or None, vertex indices of all faces
+    :return: str
+    """
+
+    fingerprint = hashlib.sha1(struct.pack('<q', int(vertex_count)))
+    if face_counts is not None and face_vertices is not None:
+        fingerprint.update(np.ascontiguousarray(face_counts, dtype=PAIRS_DTYPE).tobytes())
+        fingerprint.update(np.ascontiguousarray(face_vertices, dtype=PAIRS_DTYPE).tobytes())
+
+    return fingerprint.hexdigest()
+
+
+class SymmetryTable(object):
+    """
+    Class that stores the symmetry table of a geometry: positive/negative vertex index pairs, the side of each vertex
+    and the settings and topology it was built with.
+    Arrays are stored in compact form (int32 pairs and uint8 side flags) and are serialized without copying them.
+    """
+
+    __slots__ = ('pairs', 'sides', 'axis', 'tolerance', 'mid', 'fingerprint', '_mirror_map')
+
+    def __init__(self, pairs, sides, axis=0, tolerance=0.001, mid=0.0, fingerprint=''):
+        """
+        :param pairs: np.array, (K, 2) array of positive/negative vertex index pairs
+        :param sides: np.array, (N, ) array with the side flags of each vertex
+        :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+        :param tolerance: float
+        :param mid: float, position of the mirror plane along the mirror axis
+        :param fingerprint: str, topology fingerprint of the geometry (see get_topology_fingerprint)
+        """
+
+        self.pairs = np.asarray(pairs, dtype=PAIRS_DTYPE).reshape(-1, 2)
+        self.sides = np.asarray(sides, dtype=SIDES_DTYPE)
+        self.axis = int(axis)
+        self.tolerance = float(tolerance)
+        self.mid = float(mid)
+        self.fingerprint = fingerprint
+        self._mirror_map = None
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def __repr__(self):
+        return '{}(vertices={}, pairs={}, axis={})'.format(
+            self.__class__.__name__, self.vertex_count, len(self.pairs), consts.AXIS[self.axis])
+
+    @classmethod
+    def from_table(cls, points, pairs, seam, asymmetric, axis=0, tolerance=0.001, mid=0.0, fingerprint=''):
+        """
+        Creates a new symmetry table from the given symmetry data. Vertex sides are classified with given points.
+        :param points: np.array, (N, 3) array of points the table was built with
+        :param pairs: np.array, (K, 2) array of positive/negative vertex index pairs
+        :param seam: np.array, seam vertex indices
+        :param asymmetric: np.array, asymmetric vertex indices
+        :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+        :param tolerance: float
+        :param mid: float, position of the mirror plane along the mirror axis
+        :param fingerprint: str, topology fingerprint of the geometry
+        :return: SymmetryTable
+        """
+
+        points = np.asarray(points, dtype=np.float64)
+        sides = np.where(
+            points[:, axis] - mid >= consts.MID_OFFSET_TOLERANCE, SIDE_POSITIVE, SIDE_NEGATIVE).astype(SIDES_DTYPE)
+        sides[np.asarray(seam, dtype=np.int64)] = SIDE_SEAM
+        sides[np.asarray(asymmetric, dtype=np.int64)] |= SIDE_ASYMMETRIC
+
+        return cls(pairs, sides, axis=axis, tolerance=tolerance, mid=mid, fingerprint=fingerprint)
+
+    @property
+    def vertex_count(self):
+        return len(self.sides)
+
+    @property
+    def seam(self):
+        return np.flatnonzero(self.sides & SIDE_SEAM)
+
+    @property
+    def asymmetric(self):
+        return np.flatnonzero(self.sides & SIDE_ASYMMETRIC)
+
+    @property
+    def is_symmetric(self):
+        return not np.any(self.sides & SIDE_ASYMMETRIC)
+
+    @property
+    def mirror_map(self):
+        """
+        Returns an array that maps each vertex index with the index of its mirror vertex. Seam vertices are mapped to
+        themselves and asymmetric vertices are mapped to -1
+        :return: np.array
+        """
+
+        if self._mirror_map is None:
+            self._mirror_map = engine.get_mirror_map(self.pairs, self.seam, self.vertex_count)
+
+        return self._mirror_map
+
+    def get_side_mask(self, sides):
+        """
+        Returns which vertices belong to any of the given sides
+        :param sides: int, side flags bitmask (such as SIDE_NEGATIVE | SIDE_SEAM)
+        :return: np.array, (N, ) boolean array
+        """
+
+        return (self.sides & sides) != 0
+
+    def matches(self, vertex_count, fingerprint=None):
+        """
+        Returns whether or not this table can be used with a geometry with the given topology
+        :param vertex_count: int
+        :param fingerprint: str or None, topology fingerprint. If not given, only vertex count is compared.
+        :return: bool
+        """
+
+        if vertex_count != self.vertex_count:
+            return False
+
+        return not fingerprint or not self.fingerprint or fingerprint == self.fingerprint
+
+    def get_digest(self):
+        """
+        Returns a digest of the table settings and data. Tables with the same digest map vertices in the same way, so it
+        can be used to cache data derived from the table (such as edge and face mirror maps)
+        :return: str
+        """
+
+        header, buffers = self.get_buffers()
+        digest = hashlib.sha1(json.dumps(header, sort_keys=True).encode('utf-8'))
+        for buffer in buffers:
+            digest.update(buffer)
+
+        return digest.hexdigest()
+
+    def get_buffers(self):
+        """
+        Returns the header and the data buffers of the table. Buffers reference table arrays, so no data is copied.
+        :return: tuple(dict, list(memoryview))
+        """
+
+        header = {
+            'pairs': len(self.pairs),
+            'vertices': self.vertex_count,
+            'axis': self.axis,
+            'tolerance': self.tolerance,
+            'mid': self.mid,
+            'fingerprint': self.fingerprint
+        }
+
+        return header, [memoryview(np.ascontiguousarray(self.pairs)), memoryview(np.ascontiguousarray(self.sides))]
+
+    @classmethod
+    def from_buffers(cls, header, buffers):
+        """
+        Creates a new symmetry table from the given header and data buffers. Table arrays are views of the given
+        buffers, so no data is copied (and arrays are read-only if buffers are).
+        :param header: dict
+        :param buffers: list(buffer), pairs and sides buffers
+        :return: SymmetryTable
+        """
+
+        pairs = np.frombuffer(buffers[0], dtype=PAIRS_DTYPE, count=header['pairs'] * 2).reshape(-1, 2)
+        sides = np.frombuffer(buffers[1], dtype=SIDES_DTYPE, count=header['vertices'])
+
+        return cls(
+            pairs, sides, axis=header['axis'], tolerance=header['tolerance'], mid=header['mid'],
+            fingerprint=header['fingerprint'])
+
+    def to_bytes(self):
+        """
+        Serializes the table into bytes: header size, JSON header and data buffers one after the other
+        :return: bytes
+        """
+
+        header, buffers = self.get_buffers()
+        header = json.dumps(header).encode('utf-8')
+
+        return b''.join([struct.pack(HEADER_SIZE_FORMAT, len(header)), header] + [bytes(buffer) for buffer in buffers])
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a new symmetry table from the given bytes (see to_bytes). Table arrays are views of the given data.
+        :param data: bytes
+        :return: SymmetryTable
+        """
+
+        data = memoryview(data)
+        header_start = struct.calcsize(HEADER_SIZE_FORMAT)
+        header_end = header_start + struct.unpack(HEADER_SIZE_FORMAT, data[:header_start].tobytes())[0]
+        header = json.loads(data[header_start:header_end].tobytes().decode('utf-8'))
+        sides_start = header_end + header['pairs'] * 2 * PAIRS_DTYPE.itemsize
+
+        return cls.from_buffers(header, [data[header_end:sides_start], data[sides_start:]])
+
+    def dumps(self):
+        """
+        Serializes the table into an ASCII string that can be sent within JSON commands
+        :return: str
+        """
+
+        return base64.b64encode(self.to_bytes()).decode('ascii')
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Creates a new symmetry table from the given string (see dumps)
+        :param data: str
+        :return: SymmetryTable or None, None if no data is given
+        """
+
+        if not data:
+            return None
+
+        return cls.from_bytes(base64.b64decode(data))
@@ -8,7 +8,7 @@ Module that contains tpRigTooklit-tools-symmesh view implementation
 from __future__ import print_function, division, absolute_import
 
 from Qt.QtCore import Qt
-from Qt.QtWidgets import QSizePolicy, QWidget, QButtonGroup, QSpacerItem
+from Qt.QtWidgets import QSizePolicy, QWidget, QButtonGroup, QSpacerItem, QComboBox
 
 from tpDcc.managers import resources
 from tpDcc.libs.qt.core import base, contexts as qt_contexts
@@ -44,23 +44,45 @@ class SymmeshView(base.BaseWidget):
         axis_radio_layout.addWidget(self._yz_radio)
         axis_radio_layout.addWidget(self._xz_radio)
         axis_radio_layout.addWidget(self._xy_radio)
+        self._auto_axis_cbx = checkbox.BaseCheckBox('Auto', parent=self)
+        self._auto_axis_cbx.setToolTip('Detect mirror axis automatically when base geometry is selected')
+        axis_radio_layout.addWidget(self._auto_axis_cbx)
         axis_radio_layout.addStretch()
         global_tolerance_lbl = label.BaseLabel('Global Tolerance: ', parent=self)
         self._global_tolerance_spn = spinbox.BaseDoubleSpinBox(parent=self)
         self._global_tolerance_spn.setDecimals(4)
         self._global_tolerance_spn.setValue(0.0010)
+        self._tolerance_counts_lbl = label.BaseLabel('', parent=self)
+        self._tolerance_counts_lbl.setToolTip('Base geometry vertices matched and unmatched with global tolerance')
+        tolerance_layout = layouts.HorizontalLayout(spacing=2, margins=(2, 2, 2, 2))
+        tolerance_layout.addWidget(self._global_tolerance_spn)
+        tolerance_layout.addWidget(self._tolerance_counts_lbl)
+        tolerance_layout.addStretch()
         top_layout.addWidget(mirror_axis_lbl, 0, 0, Qt.AlignRight)
         top_layout.addLayout(axis_radio_layout, 0, 1)
         top_layout.addWidget(global_tolerance_lbl, 1, 0)
-        top_layout.addWidget(self._global_tolerance_spn, 1, 1)
+        top_layout.addLayout(tolerance_layout, 1, 1)
 
         options_cbx_layout = layouts.HorizontalLayout(spacing=2, margins=(2, 2, 2, 2))
         self._neg_to_pos_cbx = checkbox.BaseCheckBox('Operate -X to +X', parent=self)
         self._use_pivot_as_origin_cbx = checkbox.BaseCheckBox('Use Pivot as Origin', parent=self)
         self._use_pivot_as_origin_cbx.setChecked(True)
+        self._topology_symmetry_cbx = checkbox.BaseCheckBox('Topology', parent=self)
+        self._topology_symmetry_cbx.setToolTip(
+            'Build symmetry table walking mesh connectivity from selected seam edge (or from edges on mirror plane)')
+        self._mirror_deltas_cbx = checkbox.BaseCheckBox('Mirror Deltas', parent=self)
+        self._mirror_deltas_cbx.setToolTip('Mirror Selected Meshes only mirrors their deltas from base geometry')
+        self._soft_selection_cbx = checkbox.BaseCheckBox('Soft Selection', parent=self)
+        self._soft_selection_cbx.setToolTip('Mirror, Flip and Revert blend vertices by soft selection weights')
         options_cbx_layout.addWidget(self._neg_to_pos_cbx)
         options_cbx_layout.addItem(QSpacerItem(10, 0, QSizePolicy.Fixed, QSizePolicy.Fixed))
         options_cbx_layout.addWidget(self._use_pivot_as_origin_cbx)
+        options_cbx_layout.addItem(QSpacerItem(10, 0, QSizePolicy.Fixed, QSizePolicy.Fixed))
+        options_cbx_layout.addWidget(self._topology_symmetry_cbx)
+        options_cbx_layout.addItem(QSpacerItem(10, 0, QSizePolicy.Fixed, QSizePolicy.Fixed))
+        options_cbx_layout.addWidget(self._mirror_deltas_cbx)
+        options_cbx_layout.addItem(QSpacerItem(10, 0, QSizePolicy.Fixed, QSizePolicy.Fixed))
+        options_cbx_layout.addWidget(self._soft_selection_cbx)
         options_cbx_layout.addStretch()
 
         select_geo_layout = layouts.HorizontalLayout(spacing=2, margins=(2, 2, 2, 2))
@@ -84,10 +106,18 @@ class SymmeshView(base.BaseWidget):
         revert_widget.setLayout(revert_layout)
 
         self._check_symmetry_btn = buttons.BaseButton('Check Symmetry', parent=self)
+        self._check_symmetry_batch_btn = buttons.BaseButton('Check Selected Meshes', parent=self)
         self._selection_mirror_btn = buttons.BaseButton('Selection Mirror', parent=self)
+        self._selection_mirror_mode_combo = QComboBox(parent=self)
+        self._selection_mirror_mode_combo.addItems(consts.SELECTION_MIRROR_MODES)
+        self._selection_mirror_mode_combo.setToolTip(
+            'How mirrored components are combined with current selection (replace, add, toggle or intersect)')
         self._select_moved_vertices_btn = buttons.BaseButton('Select Moved Vertices', parent=self)
         self._mirror_selected_btn = buttons.BaseButton('Mirror Selected', parent=self)
         self._flip_selected_btn = buttons.BaseButton('Flip Selected', parent=self)
+        self._symmetrize_selected_btn = buttons.BaseButton('Symmetrize Selected', parent=self)
+        self._mirror_targets_btn = buttons.BaseButton('Mirror Selected Meshes', parent=self)
+        self._flip_targets_btn = buttons.BaseButton('Flip Selected Meshes', parent=self)
         self._revert_selected_to_base = buttons.BaseButton('Revert Selected to Base', parent=self)
         self._revert_bias_slider = sliders.HoudiniDoubleSlider(parent=self, slider_range=[0.0, 1.0])
 
@@ -96,17 +126,26 @@ class SymmeshView(base.BaseWidget):
         self._live_revert_bias_cbx.setVisible(False)
 
         self._check_symmetry_btn.setIcon(resources.icon('refresh'))
+        self._check_symmetry_batch_btn.setIcon(resources.icon('refresh'))
         self._selection_mirror_btn.setIcon(resources.icon('vertex'))
         self._select_moved_vertices_btn.setIcon(resources.icon('cursor'))
         self._mirror_selected_btn.setIcon(resources.icon('mirror'))
         self._flip_selected_btn.setIcon(resources.icon('flip_vertical'))
+        self._symmetrize_selected_btn.setIcon(resources.icon('mirror'))
+        self._mirror_targets_btn.setIcon(resources.icon('mirror'))
+        self._flip_targets_btn.setIcon(resources.icon('flip_vertical'))
         self._revert_selected_to_base.setIcon(resources.icon('rollback'))
 
         selection_layout.addWidget(self._check_symmetry_btn)
+        selection_layout.addWidget(self._check_symmetry_batch_btn)
         selection_layout.addWidget(self._selection_mirror_btn)
+        selection_layout.addWidget(self._selection_mirror_mode_combo)
         selection_layout.addWidget(self._select_moved_vertices_btn)
         mirror_flip_layout.addWidget(self._mirror_selected_btn)
         mirror_flip_layout.addWidget(self._flip_selected_btn)
+        mirror_flip_layout.addWidget(self._symmetrize_selected_btn)
+        mirror_flip_layout.addWidget(self._mirror_targets_btn)
+        mirror_flip_layout.addWidget(self._flip_targets_btn)
         revert_layout.addWidget(self._revert_selected_to_base)
         revert_layout.addWidget(self._revert_bias_slider)
         revert_layout.addWidget(self._live_revert_bias_cbx)
@@ -126,24 +165,40 @@ class SymmeshView(base.BaseWidget):
         self.main_layout.addStretch()
 
     def setup_signals(self):
-        self._axis_radio_grp.buttonToggled.connect(self._controller.clear_selection)
+        self._axis_radio_grp.buttonToggled.connect(self._on_axis_toggled)
+        self._auto_axis_cbx.toggled.connect(self._controller.set_auto_mirror_axis)
         self._global_tolerance_spn.valueChanged.connect(self._controller.set_global_tolerance)
         self._select_base_geo_btn.clicked.connect(self._controller.set_base_geo_from_selection)
         self._neg_to_pos_cbx.toggled.connect(self._controller.set_operate_positive_to_negative_x_axis)
         self._use_pivot_as_origin_cbx.toggled.connect(self._controller.set_use_pivot_as_origin)
+        self._topology_symmetry_cbx.toggled.connect(self._controller.set_topology_symmetry)
+        self._mirror_deltas_cbx.toggled.connect(self._controller.set_mirror_deltas)
+        self._soft_selection_cbx.toggled.connect(self._controller.set_use_soft_selection)
         self._check_symmetry_btn.clicked.connect(self._controller.check_symmetry)
+        self._check_symmetry_batch_btn.clicked.connect(self._controller.check_symmetry_batch)
         self._selection_mirror_btn.clicked.connect(self._controller.selection_mirror)
+        self._selection_mirror_mode_combo.currentIndexChanged.connect(self._controller.set_selection_mirror_mode)
         self._select_moved_vertices_btn.clicked.connect(self._controller.select_moved_vertices)
         self._mirror_selected_btn.clicked.connect(self._controller.mirror_selected)
         self._flip_selected_btn.clicked.connect(self._controller.flip_selected)
+        self._symmetrize_selected_btn.clicked.connect(self._controller.symmetrize_selected)
+        self._mirror_targets_btn.clicked.connect(self._controller.mirror_selected_targets)
+        self._flip_targets_btn.clicked.connect(self._controller.flip_selected_targets)
         self._revert_selected_to_base.clicked.connect(self._controller.revert_selected_to_base)
         self._revert_bias_slider.valueChanged.connect(self._controller.set_revert_bias)
         self._live_revert_bias_cbx.toggled.connect(self._controller.set_live_revert_bias)
 
+        self._model.mirrorAxisChanged.connect(self._on_mirror_axis_changed)
+        self._model.autoMirrorAxisChanged.connect(self._on_auto_mirror_axis_changed)
         self._model.globalToleranceChanged.connect(self._on_global_tolerance_changed)
+        self._model.toleranceCountsChanged.connect(self._on_tolerance_counts_changed)
         self._model.operateFromPositiveToNegativeXAxisChanged.connect(
             self._on_operate_positive_to_negative_x_axis_changed)
         self._model.usePivotAsOriginChanged.connect(self._on_use_pivot_as_origin_changed)
+        self._model.topologySymmetryChanged.connect(self._on_topology_symmetry_changed)
+        self._model.mirrorDeltasChanged.connect(self._on_mirror_deltas_changed)
+        self._model.selectionMirrorModeChanged.connect(self._on_selection_mirror_mode_changed)
+        self._model.useSoftSelectionChanged.connect(self._on_use_soft_selection_changed)
         self._model.baseGeoChanged.connect(self._on_base_geo_changed)
         self._model.revertBiasChanged.connect(self._on_revert_bias_changed)
         self._model.liveRevertBiasChanged.connect(self._on_live_revert_bias_changed)
@@ -151,9 +206,15 @@ class SymmeshView(base.BaseWidget):
 
     def refresh(self):
         self._radios[self._model.mirror_axis].setChecked(True)
+        self._auto_axis_cbx.setChecked(self._model.auto_mirror_axis)
         self._global_tolerance_spn.setValue(self._model.global_tolerance)
+        self._on_tolerance_counts_changed(*self._model.tolerance_counts)
         self._neg_to_pos_cbx.setChecked(self._model.operate_from_positive_to_negative_x_axis)
         self._use_pivot_as_origin_cbx.setChecked(self._model.use_pivot_as_origin)
+        self._topology_symmetry_cbx.setChecked(self._model.topology_symmetry)
+        self._mirror_deltas_cbx.setChecked(self._model.mirror_deltas)
+        self._selection_mirror_mode_combo.setCurrentIndex(self._model.selection_mirror_mode)
+        self._soft_selection_cbx.setChecked(self._model.use_soft_selection)
         self._select_geo_line.setText(self._model.base_geo)
         self._revert_bias_slider.set_value(self._model.revert_bias)
         self._on_refresh_symmetric_message(self._model.is_symmetric)
@@ -170,11 +231,46 @@ class SymmeshView(base.BaseWidget):
         enabled = bool(geo_name)
         self._check_symmetry_btn.setEnabled(enabled)
         self._selection_mirror_btn.setEnabled(enabled)
+        self._selection_mirror_mode_combo.setEnabled(enabled)
         self._select_moved_vertices_btn.setEnabled(enabled)
         self._mirror_selected_btn.setEnabled(enabled)
         self._flip_selected_btn.setEnabled(enabled)
+        self._symmetrize_selected_btn.setEnabled(enabled)
+        self._mirror_targets_btn.setEnabled(enabled)
+        self._flip_targets_btn.setEnabled(enabled)
         self._revert_selected_to_base.setEnabled(enabled)
 
+    def _on_axis_toggled(self, button, checked):
+        """
+        Internal callback function that is called when a mirror axis radio button is toggled
+        :param button: QAbstractButton
+        :param checked: bool
+        """
+
+        if not checked:
+            return
+
+        self._controller.set_mirror_axis(self._radios.index(button))
+
+    def _on_mirror_axis_changed(self, axis):
+        """
+        Internal callback function that is called when mirror axis changes in the model (for example, when it is
+        detected automatically)
+        :param axis: int, mirror axis index
+        """
+
+        with qt_contexts.block_signals(self._axis_radio_grp):
+            self._radios[axis].setChecked(True)
+
+    def _on_auto_mirror_axis_changed(self, flag):
+        """
+        Internal callback function that is called when auto mirror axis flag changes in the model
+        :param flag: bool
+        """
+
+        with qt_contexts.block_signals(self._model):
+            self._auto_axis_cbx.setChecked(flag)
+
     def _on_global_tolerance_changed(self, tolerance_value):
         """
         Internal callback function that is called when global tolerance value is updated in the model
@@ -184,6 +280,18 @@ class SymmeshView(base.BaseWidget):
         with qt_contexts.block_signals(self._model):
             self._global_tolerance_spn.setValue(tolerance_value)
 
+    def _on_tolerance_counts_changed(self, matched, unmatched):
+        """
+        Internal callback function that is called when matched and unmatched vertices counts are updated in the model
+        :param matched: int, number of base geometry vertices matched with global tolerance
+        :param unmatched: int, number of base geometry vertices not matched with global tolerance
+        """
+
+        if matched < 0:
+            self._tolerance_counts_lbl.setText('')
+        else:
+            self._tolerance_counts_lbl.setText('{} matched | {} unmatched'.format(matched, unmatched))
+
     def _on_operate_positive_to_negative_x_axis_changed(self, flag):
         """
         Internal callback function that is called when operate positive ot negate x axis flag changes in the model
@@ -202,6 +310,42 @@ class SymmeshView(base.BaseWidget):
         with qt_contexts.block_signals(self._model):
             self._use_pivot_as_origin_cbx.setChecked(flag)
 
+    def _on_topology_symmetry_changed(self, flag):
+        """
+        Internal callback function that is called when topology symmetry flag changes in the model
+        :param flag: bool
+        """
+
+        with qt_contexts.block_signals(self._model):
+            self._topology_symmetry_cbx.setChecked(flag)
+
+    def _on_mirror_deltas_changed(self, flag):
+        """
+        Internal callback function that is called when mirror deltas flag changes in the model
+        :param flag: bool
+        """
+
+        with qt_contexts.block_signals(self._model):
+            self._mirror_deltas_cbx.setChecked(flag)
+
+    def _on_selection_mirror_mode_changed(self, mode):
+        """
+        Internal callback function that is called when selection mirror mode changes in the model
+        :param mode: int, selection mirror mode index
+        """
+
+        with qt_contexts.block_signals(self._model):
+            self._selection_mirror_mode_combo.setCurrentIndex(mode)
+
+    def _on_use_soft_selection_changed(self, flag):
+        """
+        Internal callback function that is called when use soft selection flag changes in the model
+        :param flag: bool
+        """
+
+        with qt_contexts.block_signals(self._model):
+            self._soft_selection_cbx.setChecked(flag)
+
     def _on_revert_bias_changed(self, value):
         """
         Internal callback function that is called when revert bias value changes in the model
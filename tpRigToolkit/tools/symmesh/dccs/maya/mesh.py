@@ -0,0 +1,376 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains Maya bulk mesh functions used by tpRigToolkit-tools-symmesh server
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import itertools
+
+import numpy as np
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+
+from tpDcc import dcc
+
+from tpRigToolkit.tools.symmesh.core import consts, engine, selection
+
+VERTEX_COMPONENT = 'vtx'
+EDGE_COMPONENT = 'e'
+FACE_COMPONENT = 'f'
+
+COMPONENT_TYPES = {
+    VERTEX_COMPONENT: OpenMaya.MFn.kMeshVertComponent,
+    EDGE_COMPONENT: OpenMaya.MFn.kMeshEdgeComponent,
+    FACE_COMPONENT: OpenMaya.MFn.kMeshPolygonComponent
+}
+
+
+def get_mesh_dag_path(geo):
+    """
+    Returns the DAG path of the mesh shape of the given geometry
+    :param geo: str, name of the geometry transform or mesh shape
+    :return: OpenMaya.MDagPath
+    """
+
+    selection_list = OpenMaya.MSelectionList()
+    selection_list.add(geo)
+    dag_path = selection_list.getDagPath(0)
+    if not dag_path.hasFn(OpenMaya.MFn.kMesh):
+        raise RuntimeError('"{}" is not a polygon geometry'.format(geo))
+    if dag_path.apiType() != OpenMaya.MFn.kMesh:
+        dag_path.extendToShape()
+
+    return dag_path
+
+
+def get_selected_geos():
+    """
+    Returns all selected polygon geometries (transforms)
+    :return: list(str)
+    """
+
+    shapes = cmds.ls(selection=True, dag=True, long=True, type='mesh', noIntermediate=True) or list()
+    geos = list()
+    for shape in shapes:
+        geo = (cmds.listRelatives(shape, parent=True, fullPath=True) or [shape])[0]
+        if geo not in geos:
+            geos.append(geo)
+
+    return geos
+
+
+def get_vertex_count(geo):
+    """
+    Returns the total number of vertices of the given geometry
+    :param geo: str, name of the geometry
+    :return: int
+    """
+
+    return OpenMaya.MFnMesh(get_mesh_dag_path(geo)).numVertices
+
+
+def get_face_vertices(geo):
+    """
+    Returns the vertices of all the faces of the given geometry with a single mesh query
+    :param geo: str, name of the geometry
+    :return: tuple(np.array, np.array), number of vertices of each face and vertex indices of all faces
+    """
+
+    face_counts, face_vertices = OpenMaya.MFnMesh(get_mesh_dag_path(geo)).getVertices()
+
+    return np.array(face_counts, dtype=np.int32), np.array(face_vertices, dtype=np.int32)
+
+
+def get_shells(geo):
+    """
+    Returns the shell each vertex of the given geometry belongs to
+    :param geo: str, name of the geometry
+    :return: np.array, (N, ) array of shell indices
+    """
+
+    face_counts, face_vertices = get_face_vertices(geo)
+
+    return engine.get_shells(get_vertex_count(geo), face_counts, face_vertices)
+
+
+def get_world_matrix(geo):
+    """
+    Returns the world matrix of the given geometry
+    :param geo: str, name of the geometry
+    :return: np.array, (4, 4) world matrix (row-vector convention)
+    """
+
+    matrix = get_mesh_dag_path(geo).inclusiveMatrix()
+
+    return np.array([matrix.getElement(row, column) for row in range(4) for column in range(4)]).reshape(4, 4)
+
+
+def get_points(geo, world_space=False, out=None):
+    """
+    Returns positions of all the vertices of the given geometry with a single mesh query
+    Point coordinates are streamed from the mesh point array straight into one NumPy array, without building Python
+    objects per point. World space positions are computed transforming object space positions by the world matrix in
+    one pass.
+    :param geo: str, name of the geometry
+    :param world_space: bool, whether to return world space or object space positions
+    :param out: np.array or None, (N, 3) array (for example, a memory-mapped array created by a PointCache) where
+        positions are stored. If not given, a new array is allocated.
+    :return: np.array, (N, 3) array of vertex positions
+    """
+
+    mesh_fn = OpenMaya.MFnMesh(get_mesh_dag_path(geo))
+    mesh_points = mesh_fn.getPoints(OpenMaya.MSpace.kObject)
+    point_count = len(mesh_points)
+
+    # MPoint items are homogeneous (x, y, z, w) coordinates
+    points = np.fromiter(
+        itertools.chain.from_iterable(mesh_points), dtype=np.float64, count=point_count * 4).reshape(-1, 4)[:, :3]
+    if world_space:
+        points = engine.transform_points(points, get_world_matrix(geo))
+    if out is None:
+        return np.ascontiguousarray(points)
+
+    out[:] = points
+
+    return out
+
+
+def set_points(geo, points, indices, world_space=False):
+    """
+    Sets positions of the given vertices of the given geometry
+    Only given vertices are converted to object space and written; all the other vertices keep their positions.
+    :param geo: str, name of the geometry
+    :param points: np.array, (N, 3) array of vertex positions
+    :param indices: list(int) or np.array, indices of the vertices to set
+    :param world_space: bool, whether given positions are in world space or in object space. World space positions
+        are converted to object space with the inverse world matrix in one pass.
+    """
+
+    indices = np.asarray(indices, dtype=np.int64)
+    set_vertex_points(geo, indices, np.asarray(points, dtype=np.float64)[indices], world_space=world_space)
+
+
+def set_vertex_points(geo, indices, points, world_space=False):
+    """
+    Sets positions of the given vertices of the given geometry from sparse positions
+    Few vertices are written one by one, so cost scales with the number of changed vertices. Above
+    consts.MAX_SET_POINT_VERTICES vertices, a single bulk mesh update is faster than one API call per vertex, so all
+    mesh points are read and written back at once.
+    :param geo: str, name of the geometry
+    :param indices: list(int) or np.array, indices of the vertices to set
+    :param points: np.array, (K, 3) array with the positions of the given vertices
+    :param world_space: bool, whether given positions are in world space or in object space. World space positions
+        are converted to object space with the inverse world matrix in one pass.
+    """
+
+    indices = np.asarray(indices, dtype=np.int64)
+    if not len(indices):
+        return
+
+    new_points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if world_space:
+        new_points = engine.transform_points(new_points, np.linalg.inv(get_world_matrix(geo)))
+
+    mesh_fn = OpenMaya.MFnMesh(get_mesh_dag_path(geo))
+    if len(indices) <= consts.MAX_SET_POINT_VERTICES:
+        for vertex_index, point in zip(indices.tolist(), new_points.tolist()):
+            mesh_fn.setPoint(vertex_index, OpenMaya.MPoint(point[0], point[1], point[2]), OpenMaya.MSpace.kObject)
+        mesh_fn.updateSurface()
+        return
+
+    mesh_points = mesh_fn.getPoints(OpenMaya.MSpace.kObject)
+    for vertex_index, point in zip(indices.tolist(), new_points.tolist()):
+        mesh_points[vertex_index] = OpenMaya.MPoint(point[0], point[1], point[2])
+    mesh_fn.setPoints(mesh_points, OpenMaya.MSpace.kObject)
+
+
+def add_dirty_callbacks(geo, callback):
+    """
+    Registers a callback that is called each time the given geometry (its shape or its transform) is dirtied or its
+    world matrix changes (for example, when any of its ancestor transforms is moved)
+    :param geo: str, name of the geometry
+    :param callback: callable
+    :return: list(int), list of callback IDs
+    """
+
+    dag_path = get_mesh_dag_path(geo)
+    nodes = [dag_path.node(), dag_path.transform()]
+    callback_ids = [OpenMaya.MNodeMessage.addNodeDirtyCallback(node, callback) for node in nodes]
+    callback_ids.append(OpenMaya.MDagMessage.addWorldMatrixModifiedCallback(dag_path, callback))
+
+    return callback_ids
+
+
+def remove_callbacks(callback_ids):
+    """
+    Removes given callbacks
+    :param callback_ids: list(int)
+    """
+
+    for callback_id in callback_ids:
+        try:
+            OpenMaya.MMessage.removeCallback(callback_id)
+        except RuntimeError:
+            pass
+
+
+def get_selected_edges(geo):
+    """
+    Returns the selected edges of the given geometry
+    :param geo: str, name of the geometry
+    :return: list(tuple(int, int)), vertex indices of each selected edge
+    """
+
+    mesh_path = get_mesh_dag_path(geo).fullPathName()
+    selection_list = OpenMaya.MGlobal.getActiveSelectionList()
+    edges = list()
+    for i in range(selection_list.length()):
+        dag_path, component = selection_list.getComponent(i)
+        if component.isNull() or not component.hasFn(OpenMaya.MFn.kMeshEdgeComponent):
+            continue
+        if dag_path.apiType() != OpenMaya.MFn.kMesh:
+            dag_path.extendToShape()
+        if dag_path.fullPathName() != mesh_path:
+            continue
+        edge_it = OpenMaya.MItMeshEdge(dag_path, component)
+        while not edge_it.isDone():
+            edges.append((edge_it.vertexId(0), edge_it.vertexId(1)))
+            edge_it.next()
+
+    return edges
+
+
+def get_selected_component_indices(geo, component_type=VERTEX_COMPONENT):
+    """
+    Returns the indices of the selected components of the given geometry without querying component names
+    :param geo: str, name of the geometry
+    :param component_type: str, component type (VERTEX_COMPONENT, EDGE_COMPONENT or FACE_COMPONENT)
+    :return: np.array
+    """
+
+    mesh_path = get_mesh_dag_path(geo).fullPathName()
+    component_fn_type = COMPONENT_TYPES[component_type]
+    selection_list = OpenMaya.MGlobal.getActiveSelectionList()
+    indices = list()
+    for i in range(selection_list.length()):
+        dag_path, component = selection_list.getComponent(i)
+        if component.isNull() or not component.hasFn(component_fn_type):
+            continue
+        if dag_path.apiType() != OpenMaya.MFn.kMesh:
+            dag_path.extendToShape()
+        if dag_path.fullPathName() != mesh_path:
+            continue
+        indices.append(np.array(OpenMaya.MFnSingleIndexedComponent(component).getElements(), dtype=np.int64))
+
+    return np.unique(np.concatenate(indices)) if indices else np.zeros(0, dtype=np.int64)
+
+
+def get_soft_selection_weights(geo):
+    """
+    Returns the vertices of the given geometry affected by soft selection and their weights with a single rich
+    selection query. If soft selection is disabled, no vertices are returned
+    The API has no bulk weight getter, so the weights of each component are read in one pass straight into an array.
+    :param geo: str, name of the geometry
+    :return: tuple(np.array, np.array), sorted vertex indices and their soft selection weights
+    """
+
+    if not cmds.softSelect(query=True, softSelectEnabled=True):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+    dag_path = get_mesh_dag_path(geo)
+    mesh_path = dag_path.fullPathName()
+    weights = np.zeros(OpenMaya.MFnMesh(dag_path).numVertices, dtype=np.float64)
+    selection_list = OpenMaya.MGlobal.getRichSelection().getSelection()
+    for i in range(selection_list.length()):
+        component_path, component = selection_list.getComponent(i)
+        if component.isNull() or not component.hasFn(OpenMaya.MFn.kMeshVertComponent):
+            continue
+        if component_path.apiType() != OpenMaya.MFn.kMesh:
+            component_path.extendToShape()
+        if component_path.fullPathName() != mesh_path:
+            continue
+        component_fn = OpenMaya.MFnSingleIndexedComponent(component)
+        indices = np.array(component_fn.getElements(), dtype=np.int64)
+        if component_fn.hasWeights:
+            component_weights = np.fromiter(
+                (component_fn.weight(j).influence for j in range(len(indices))), dtype=np.float64, count=len(indices))
+        else:
+            component_weights = np.ones(len(indices), dtype=np.float64)
+        np.maximum.at(weights, indices, component_weights)
+
+    indices = np.flatnonzero(weights > 0)
+
+    return indices, weights[indices]
+
+
+def get_selected_vertices(geo):
+    """
+    Returns the selected vertices of the given geometry
+    :param geo: str, name of the geometry
+    :return: VertexSelection
+    """
+
+    return selection.VertexSelection.from_indices(
+        get_selected_component_indices(geo, VERTEX_COMPONENT), get_vertex_count(geo))
+
+
+def get_edges(geo):
+    """
+    Returns the edges of the given geometry. Edges are returned in geometry edge index order
+    MFnMesh has no bulk query for edge vertices, so MFnMesh.getEdgeVertices is called once per edge and its results
+    are streamed straight into one array. Use engine.get_edges with the face vertices when edge order is not needed.
+    :param geo: str, name of the geometry
+    :return: tuple(np.array, np.array), first and second vertex of each edge
+    """
+
+    mesh_fn = OpenMaya.MFnMesh(get_mesh_dag_path(geo))
+    edge_count = mesh_fn.numEdges
+    edges = np.fromiter(
+        itertools.chain.from_iterable(mesh_fn.getEdgeVertices(edge_index) for edge_index in range(edge_count)),
+        dtype=np.int64, count=edge_count * 2).reshape(-1, 2)
+
+    return edges[:, 0], edges[:, 1]
+
+
+def select_vertices(geo, vertex_selection, replace_selection=True):
+    """
+    Selects the vertices of the given selection. Consecutive vertices are selected as vertex ranges (obj.vtx[0:10]),
+    so no name is built per vertex
+    :param geo: str, name of the geometry
+    :param vertex_selection: VertexSelection
+    :param replace_selection: bool
+    :return: bool, True if any vertex was selected
+    """
+
+    vertex_names = get_component_range_names(geo, vertex_selection.indices, VERTEX_COMPONENT)
+    if not vertex_names:
+        return False
+
+    dcc.select_node(vertex_names, replace_selection=replace_selection)
+
+    return True
+
+
+def get_component_range_names(geo, indices, component_type=VERTEX_COMPONENT):
+    """
+    Returns component range names (obj.vtx[0:10], obj.e[0:10] or obj.f[0:10]) covering the given component indices
+    :param geo: str, name of the geometry
+    :param indices: list(int) or np.array, sorted component indices
+    :param component_type: str, component type (VERTEX_COMPONENT, EDGE_COMPONENT or FACE_COMPONENT)
+    :return: list(str)
+    """
+
+    indices = np.asarray(indices, dtype=np.int64)
+    if not len(indices):
+        return list()
+
+    breaks = np.flatnonzero(np.diff(indices) != 1) + 1
+    starts = indices[np.concatenate([[0], breaks])]
+    ends = indices[np.concatenate([breaks - 1, [len(indices) - 1]])]
+
+    return [
+        '{}.{}[{}:{}]'.format(geo, component_type, start, end) for start, end in zip(starts.tolist(), ends.tolist())]
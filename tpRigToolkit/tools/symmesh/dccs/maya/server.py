@@ -7,19 +7,19 @@ Module that contains tpRigToolkit-tools-symmesh server implementation
 
 from __future__ import print_function, division, absolute_import
 
-import math
 import logging
 import traceback
+import multiprocessing
+from multiprocessing import pool
 
-import re
+import numpy as np
 
 from tpDcc.core import server
 
 from tpDcc import dcc
-from tpDcc.dcc import progressbar
-from tpDcc.libs.python import mathlib
 
-from tpRigToolkit.tools.symmesh.core import consts
+from tpRigToolkit.tools.symmesh.core import consts, profiler, cache, engine, symmetry, selection
+from tpRigToolkit.tools.symmesh.dccs.maya import mesh
 
 logger = logging.getLogger(consts.TOOL_ID)
 
@@ -27,23 +27,88 @@ logger = logging.getLogger(consts.TOOL_ID)
 class SymmeshServer(server.DccServer, object):
     PORT = 25221
 
+    def __init__(self, *args, **kwargs):
+        super(SymmeshServer, self).__init__(*args, **kwargs)
+
+        self._profiler = profiler.CommandProfiler()
+        self._snapshots = cache.PointCache()
+        self._base_snapshots = dict()
+        self._symmetry_checks = dict()
+        self._symmetry_results = dict()
+        self._tolerance_sweeps = dict()
+        self._component_mirror_maps = dict()
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    def set_profiling(self, data, reply):
+        """
+        Function that enables profiling (cProfile and tracemalloc) of the next N executed commands
+        Profile files are named after the command and the geometry they operate on
+        """
+
+        count = data.get('count', 1)
+        output_directory = data.get('output_directory', None)
+
+        if count > 0:
+            self._profiler.enable(count=count, output_directory=output_directory)
+            logger.info('Profiling next {} command(s) into: {}'.format(count, self._profiler.output_directory))
+        else:
+            self._profiler.disable()
+
+        reply['success'] = True
+        reply['result'] = self._profiler.remaining
+
+    def set_snapshot_cache(self, data, reply):
+        """
+        Function that configures how geometry point snapshots are stored
+        If memory mapping is enabled, snapshots are spilled to .npy files and memory-mapped.
+        """
+
+        memory_map = data.get('memory_map', False)
+        directory = data.get('directory', None)
+        min_vertices = data.get('min_vertices', 0)
+
+        self._clear_base_snapshots()
+        self._snapshots.clear()
+        self._snapshots = cache.PointCache(memory_map=memory_map, directory=directory, min_vertices=min_vertices)
+
+        reply['success'] = True
+
+    def set_base_geo(self, data, reply):
+        """
+        Function that takes a snapshot of the base geometry points, bounding box and pivot
+        Snapshot is reused by all commands that operate with base geometry until base geometry changes
+        """
+
+        base_geo = data['base_geo']
+
+        try:
+            self._clear_base_snapshots()
+            self._take_base_snapshot(base_geo)
+            reply['success'] = True
+        except Exception as exc:
+            logger.error('Error while storing base geometry snapshot: {} | {}'.format(exc, traceback.format_exc()))
+            reply['success'] = False
+
     def get_selected_info(self, data, reply):
         """
-        Function that returns selected geometry info (its name and its vertices)
-        :return: tuple(str, list(list(float, float, float))
+        Function that returns selected geometry info (its name and its serialized selected vertices)
+        Selection is not flattened, so no name is queried per selected vertex
+        :return: tuple(str, str)
         """
 
-        nodes = dcc.selected_nodes(flatten=True)
+        nodes = dcc.selected_nodes(flatten=False)
         selected_geo = dcc.filter_nodes_by_selected_components(filter_type=12, nodes=nodes, full_path=True)
-        selected_vertices = None
+        component_mode = False
         if selected_geo:
             selected_geo = selected_geo[0]
         if not selected_geo:
             hilited_geo = dcc.selected_hilited_nodes(full_path=True)
             if len(hilited_geo) == 1:
                 selected_geo = hilited_geo[0]
-                selected_vertices = dcc.filter_nodes_by_selected_components(
-                    filter_type=31, nodes=nodes, full_path=False)
+                component_mode = True
             elif len(hilited_geo) > 1:
                 logger.warning('Only one object can be hilited in component mode!')
 
@@ -53,12 +118,39 @@ class SymmeshServer(server.DccServer, object):
 
         if not selected_geo or not dcc.node_exists(selected_geo):
             reply['success'] = False
-            reply['result'] = '', list()
+            reply['result'] = '', ''
             return
 
+        selected_vertices = mesh.get_selected_vertices(selected_geo) if component_mode else None
+
         reply['success'] = True
-        reply['result'] = selected_geo, selected_vertices
+        reply['result'] = selected_geo, selected_vertices.dumps() if selected_vertices else ''
+
+    @profiler.profile_command
+    def detect_mirror_axis(self, data, reply):
+        """
+        Function that detects the mirror axis of the given geometry evaluating YZ, XZ and XY planes at once from a
+        single bulk read of its points
+        """
 
+        obj = data['geo']
+        tolerance = data['tolerance']
+        use_pivot = data['use_pivot']
+
+        try:
+            snapshot = self._get_base_snapshot(obj)
+            best_axis, scores = engine.detect_mirror_axis(
+                snapshot.world_points, tolerance=tolerance, use_pivot=use_pivot, pivot=snapshot.pivot)
+            logger.info('Detected mirror axis: {} (match scores: {})'.format(
+                consts.AXIS[best_axis], ', '.join('{}: {:.2f}'.format(*item) for item in zip(consts.AXIS, scores))))
+            reply['success'] = True
+            reply['result'] = best_axis, scores
+        except Exception as exc:
+            logger.error('Error while detecting mirror axis: {} | {}'.format(exc, traceback.format_exc()))
+            reply['success'] = False
+            reply['result'] = -1, list()
+
+    @profiler.profile_command
     def check_symmetry(self, data, reply):
         obj = data['geo']
         axis = data['axis']
@@ -66,111 +158,47 @@ class SymmeshServer(server.DccServer, object):
         table = data['table']
         use_pivot = data['use_pivot']
         select_asymmetric_vertices = data['select_asymmetric_vertices']
+        topology = data.get('topology', False)
 
-        pos_verts = list()
-        neg_verts = list()
-        pos_verts_int = list()
-        neg_verts_int = list()
-        pos_verts_trans = list()
-        neg_verts_trans = list()
-        vert_counter = 0
-        non_symm_verts = list()
+        non_symm_verts = None
+        symmetry_table = None
         is_symmetric = False
 
         axis_ind = axis
-        axis_2_ind = (axis_ind + 1) % 3
-        axis_3_ind = (axis_ind + 2) % 3
-
-        if use_pivot:
-            vtx_trans = dcc.node_world_space_translation(obj)
-            mid = vtx_trans[axis_ind]
-        else:
-            if table:
-                bounding_box = dcc.node_world_bounding_box(obj)
-                mid = bounding_box[axis_ind] + ((bounding_box[axis_ind + 3] - bounding_box[axis_ind]) / 2)
-            else:
-                mid = 0
-
-        symmetry_table = list()
-
-        total_vertices = dcc.total_vertices(obj)
 
         dcc.enable_wait_cursor()
-        dcc_progress_bar = progressbar.ProgressBar(title='Working', count=total_vertices)
-        dcc_progress_bar.status('Sorting')
-        mod = math.ceil(total_vertices / 50)
-
         try:
-            for i in range(total_vertices):
-                if i % mod == 0:
-                    prog_num = i
-                    prog = (prog_num / total_vertices) * 100.0
-                    dcc_progress_bar.inc(prog)
-
-                vtx = dcc.node_vertex_name(obj, i)
-                vtx_trans = dcc.node_vertex_world_space_translation(obj, i)
-                mid_offset = vtx_trans[axis_ind] - mid
-                if mid_offset >= consts.MID_OFFSET_TOLERANCE:
-                    pos_verts.append(vtx)
-                    if table:
-                        pos_verts_int.append(i)
-                    pos_verts_trans.append(vtx_trans[axis_ind])
+            snapshot = self._get_base_snapshot(obj)
+            selected_edges = mesh.get_selected_edges(obj) if topology else list()
+            result_key = (obj, axis_ind, tolerance, use_pivot, table, topology, tuple(map(tuple, selected_edges)))
+            cached_result = self._symmetry_results.get(result_key, None)
+            if cached_result:
+                non_symm_verts, symmetry_table, is_symmetric = cached_result
+            else:
+                mid = self._get_check_mid(axis_ind, use_pivot, table, snapshot.pivot, snapshot.bounding_box)
+                if topology:
+                    pairs, seam, asymmetric = self._build_topology_symmetry_table(
+                        snapshot, axis_ind, tolerance, mid, seam_edges=selected_edges)
                 else:
-                    if mid_offset < consts.MID_OFFSET_TOLERANCE:
-                        neg_verts.append(vtx)
-                        if table:
-                            neg_verts_int.append(i)
-                        neg_verts_trans.append(vtx_trans[axis_ind])
-
-            msg = 'Building Symmetry Table' if table else 'Checking for Symmetry'
-            dcc_progress_bar.set_progress(0)
-            dcc_progress_bar.status(msg)
-            for i in range(len(pos_verts)):
-                # if i % mod == 0:
-                #     prog_num = i
-                #     prog = (prog_num / total_vertices) * 100.0
-                #     dcc_progress_bar.inc(prog)
-
-                vtx = pos_verts[i]
-                pos_offset = pos_verts_trans[i] - mid
-                if pos_offset < tolerance:
-                    pos_verts[i] = consts.MATCH_STR
-                    vert_counter += 1
-                    continue
-
-                for j in range(len(neg_verts)):
-                    if neg_verts[j] == consts.MATCH_STR:
-                        continue
-                    neg_offset = mid - neg_verts_trans[j]
-                    if neg_offset < tolerance:
-                        neg_verts[j] = consts.MATCH_STR
-                        vert_counter += 1
-                        continue
+                    symmetry_check = self._get_symmetry_check(snapshot, axis_ind, tolerance, mid)
+                    pairs = seam = None
+                    asymmetric = symmetry_check.asymmetric
+                non_symm_verts = selection.VertexSelection.from_indices(asymmetric, snapshot.vertex_count)
+
+                if table:
+                    if pairs is None:
+                        pairs, seam = symmetry_check.pairs, symmetry_check.seam
+                    symmetry_table = symmetry.SymmetryTable.from_table(
+                        snapshot.world_points, pairs, seam, asymmetric, axis=axis_ind, tolerance=tolerance, mid=mid,
+                        fingerprint=self._get_topology_fingerprint(snapshot))
+                    if len(asymmetric):
+                        logger.warning('Base geometry is not symmetrical, not all vertices can be mirrored')
+                    else:
+                        logger.info('Base geometry is symmetrical')
+                        is_symmetric = True
 
-                    if abs(pos_offset - neg_offset) <= tolerance:
-                        vtx_trans = dcc.node_vertex_world_space_translation(vtx)
-                        vtx2_trans = dcc.node_vertex_world_space_translation(neg_verts[j])
-                        test1 = vtx_trans[axis_2_ind] - vtx2_trans[axis_2_ind]
-                        test2 = vtx_trans[axis_3_ind] - vtx2_trans[axis_3_ind]
-                        if abs(test1) < tolerance and abs(test2) < tolerance:
-                            if table:
-                                symmetry_table.append(pos_verts_int[i])
-                                symmetry_table.append(neg_verts_int[j])
-                                vert_counter += 2
-
-                            pos_verts[i] = neg_verts[j] = consts.MATCH_STR
-                            break
-
-            pos_verts = [x for x in pos_verts if x not in [consts.MATCH_STR]]
-            neg_verts = [x for x in neg_verts if x not in [consts.MATCH_STR]]
-            non_symm_verts = pos_verts + neg_verts
-
-            if table:
-                if vert_counter != total_vertices:
-                    logger.warning('Base geometry is not symmetrical, not all vertices can be mirrored')
-                else:
-                    logger.info('Base geometry is symmetrical')
-                    is_symmetric = True
+                # Results are valid until base snapshot is taken again (when geometry changes)
+                self._symmetry_results[result_key] = non_symm_verts, symmetry_table, is_symmetric
 
             reply['success'] = True
         except Exception as exc:
@@ -178,53 +206,136 @@ class SymmeshServer(server.DccServer, object):
             reply['success'] = False
         finally:
             dcc.disable_wait_cursor()
-            dcc_progress_bar.end()
 
         if select_asymmetric_vertices:
-            total_vertices_to_select = len(non_symm_verts)
+            total_vertices_to_select = len(non_symm_verts) if non_symm_verts is not None else 0
             if total_vertices_to_select > 0:
                 dcc.enable_component_selection()
-                dcc.select_node(non_symm_verts)
+                mesh.select_vertices(obj, non_symm_verts)
                 logger.info('{} asymmetric vert(s)'.format(total_vertices_to_select))
             else:
                 dcc.select_node(obj)
 
-        reply['result'] = non_symm_verts, symmetry_table, is_symmetric
+        reply['result'] = (
+            non_symm_verts.dumps() if non_symm_verts is not None else '',
+            symmetry_table.dumps() if symmetry_table is not None else '', is_symmetric)
 
-    @dcc.undo_decorator()
-    def select_moved_vertices(self, data, reply):
+    @profiler.profile_command
+    def get_tolerance_counts(self, data, reply):
+        """
+        Function that returns the number of vertices of the given geometry that are matched and unmatched with the given
+        tolerance.
+        Mirror distances of all vertices are computed once, so any other tolerance is answered with a binary search
+        until the geometry or the mirror settings change
+        """
 
         obj = data['geo']
-        base_obj = data['base_geo']
+        axis = data['axis']
         tolerance = data['tolerance']
+        use_pivot = data['use_pivot']
 
-        moved_vertices = list()
+        try:
+            snapshot = self._get_base_snapshot(obj)
+            mid = snapshot.get_mid(axis, use_pivot=use_pivot)
+            tolerance_sweep = self._tolerance_sweeps.get(obj, None)
+            if not tolerance_sweep or not tolerance_sweep.matches(axis, mid, snapshot.vertex_count, tolerance):
+                tolerance_sweep = engine.ToleranceSweep(
+                    snapshot.world_points, axis=axis, mid=mid,
+                    max_tolerance=max(consts.TOLERANCE_SWEEP_RANGE, tolerance * 2))
+                self._tolerance_sweeps[obj] = tolerance_sweep
+            reply['success'] = True
+            reply['result'] = tolerance_sweep.count(tolerance)
+        except Exception as exc:
+            logger.error('Error while counting symmetric vertices: {} | {}'.format(exc, traceback.format_exc()))
+            reply['success'] = False
+            reply['result'] = -1, -1
 
-        total_vertices = dcc.total_vertices(obj)
+    @profiler.profile_command
+    def check_symmetry_batch(self, data, reply):
+        """
+        Function that checks symmetry of multiple geometries in one request
+        Points of all geometries are read in bulk first and then symmetry tables are computed in parallel
+        If no geometries are given, selected geometries are used
+        If pre-check is enabled, clearly asymmetric geometries are rejected without reading their shells nor building
+        their symmetry table
+        Summaries are returned in the same order as the given geometries
+        """
 
-        dcc_progress_bar = progressbar.ProgressBar(title='Working', count=total_vertices)
-        dcc_progress_bar.status('Checking Verts')
-        mod = math.ceil(total_vertices / 50)
+        geos = data.get('geos', None) or mesh.get_selected_geos()
+        axis = data['axis']
+        tolerance = data['tolerance']
+        use_pivot = data['use_pivot']
+        table = data.get('table', False)
+        precheck = data.get('precheck', False)
+        min_score = data.get('min_score', 0.9)
+
+        summaries = [None] * len(geos)
 
         dcc.enable_wait_cursor()
         try:
-            for i in range(total_vertices):
-                if i % mod == 0:
-                    prog_num = i
-                    prog = (prog_num / total_vertices) * 100.0
-                    dcc_progress_bar.inc(prog)
+            geos_data = list()
+            for i, geo in enumerate(geos):
+                if not dcc.node_exists(geo):
+                    summaries[i] = {'geo': geo, 'success': False, 'msg': 'Geometry does not exists'}
+                    continue
+                points = mesh.get_points(geo, world_space=True)
+                mid = self._get_check_mid(
+                    axis, use_pivot, table, dcc.node_world_space_translation(geo), dcc.node_world_bounding_box(geo))
+                if precheck:
+                    plausible, precheck_values = engine.precheck_symmetry(
+                        points, axis=axis, tolerance=tolerance, mid=mid, min_score=min_score)
+                    if not plausible:
+                        summary = engine.get_rejected_summary(len(points), precheck_values, table=table)
+                        summary.update({'geo': geo, 'success': True})
+                        summaries[i] = summary
+                        continue
+                geos_data.append((i, geo, points, mesh.get_shells(geo), mid))
+
+            def _check(geo_data):
+                _, geo, points, shells, mid = geo_data
+                summary = engine.get_symmetry_summary(
+                    points, axis=axis, tolerance=tolerance, mid=mid, table=table, shells=shells)
+                summary.update({'geo': geo, 'success': True})
+                return summary
+
+            thread_pool = pool.ThreadPool(processes=max(1, min(multiprocessing.cpu_count(), len(geos_data))))
+            try:
+                for geo_data, summary in zip(geos_data, thread_pool.map(_check, geos_data)):
+                    summaries[geo_data[0]] = summary
+            finally:
+                thread_pool.close()
+                thread_pool.join()
+
+            reply['success'] = True
+        except Exception as exc:
+            logger.error('Error while checking symmetry of geometries: {} | {}'.format(exc, traceback.format_exc()))
+            reply['success'] = False
+        finally:
+            dcc.disable_wait_cursor()
+
+        reply['result'] = summaries
 
-                vtx = dcc.node_vertex_name(obj, i)
-                vec1 = mathlib.Vector(*dcc.node_vertex_object_space_translation(base_obj, i))
-                vec2 = mathlib.Vector(*dcc.node_vertex_object_space_translation(obj, i))
+    @profiler.profile_command
+    @dcc.undo_decorator()
+    def select_moved_vertices(self, data, reply):
 
-                if mathlib.get_distance_between_vectors(vec1, vec2) > tolerance:
-                    moved_vertices.append(vtx)
+        obj = data['geo']
+        base_obj = data['base_geo']
+        tolerance = data['tolerance']
+
+        moved_vertices = None
+
+        dcc.enable_wait_cursor()
+        try:
+            base_points = self._get_base_snapshot(base_obj).points
+            points = mesh.get_points(obj)
+            distances = np.linalg.norm(points - base_points, axis=1)
+            moved_vertices = selection.VertexSelection.from_mask(distances > tolerance)
 
-            if len(moved_vertices) > 0:
+            if moved_vertices:
                 dcc.select_node(obj)
                 dcc.enable_component_selection()
-                dcc.select_node(moved_vertices, replace_selection=False)
+                mesh.select_vertices(obj, moved_vertices, replace_selection=False)
 
             reply['success'] = True
 
@@ -233,31 +344,54 @@ class SymmeshServer(server.DccServer, object):
             reply['success'] = False
         finally:
             dcc.disable_wait_cursor()
-            dcc_progress_bar.end()
 
-        reply['result'] = moved_vertices
+        reply['result'] = moved_vertices.dumps() if moved_vertices else ''
 
+    @profiler.profile_command
     @dcc.undo_decorator()
     def selection_mirror(self, data, reply):
+        """
+        Function that selects the mirror components of the selected vertices, edges and faces
+        Edges and faces are mirrored with edge and face mirror maps lifted from the vertex symmetry table. Those maps
+        are built once and cached until the geometry changes. Components with no mirror component keep selected.
+        Mirror components replace the selection or are combined with it (union, toggle or intersection), and the
+        result is selected with a single call. If nothing is mirrored, current selection is left untouched; it is only
+        cleared when toggling or intersecting a selection gives an empty result.
+        """
 
         selected_geo = data['geo']
-        selected_vertices = data['selected_vertices']
-        symmetry_table = data['symmetry_table']
+        mode = data.get('mode', selection.REPLACE_MODE)
 
-        mirror_vertices = list()
+        mirror_vertices = None
 
         dcc.enable_wait_cursor()
         try:
-            for selected_vertex in selected_vertices:
-                vert_num = int(re.search(r'\[(\w+)\]', selected_vertex).group(1))
-                mirror_vert_num = consts.get_mirror_vertex_index(symmetry_table, vert_num)
-                if mirror_vert_num != -1:
-                    mirror_vertices.append(dcc.node_vertex_name(selected_geo, mirror_vert_num))
-                else:
-                    mirror_vertices.append(dcc.node_vertex_name(selected_geo, vert_num))
-
-            if mirror_vertices:
-                dcc.select_node(mirror_vertices)
+            snapshot = self._get_base_snapshot(selected_geo)
+            symmetry_table = self._load_symmetry_table(data['symmetry_table'], snapshot)
+            selected_vertices = self._load_vertex_selection(data['selected_vertices'], selected_geo)
+            mirror_vertices = selected_vertices.combine(selected_vertices.mirror(symmetry_table.mirror_map), mode=mode)
+            component_names = mesh.get_component_range_names(
+                selected_geo, mirror_vertices.indices, mesh.VERTEX_COMPONENT)
+            has_selection = bool(selected_vertices)
+            for component_type in (mesh.EDGE_COMPONENT, mesh.FACE_COMPONENT):
+                component_indices = mesh.get_selected_component_indices(selected_geo, component_type)
+                if not len(component_indices):
+                    continue
+                has_selection = True
+                component_mirror_map = self._get_component_mirror_map(snapshot, symmetry_table, component_type)
+                mirror_indices = component_mirror_map[component_indices]
+                component_mask = np.zeros(len(component_mirror_map), dtype=bool)
+                component_mask[component_indices] = True
+                mirror_mask = np.zeros(len(component_mirror_map), dtype=bool)
+                mirror_mask[np.where(mirror_indices != -1, mirror_indices, component_indices)] = True
+                component_names.extend(mesh.get_component_range_names(
+                    selected_geo, np.flatnonzero(selection.combine_masks(component_mask, mirror_mask, mode=mode)),
+                    component_type))
+
+            if component_names:
+                dcc.select_node(component_names)
+            elif has_selection and mode in (selection.TOGGLE_MODE, selection.INTERSECT_MODE):
+                dcc.clear_selection()
 
             reply['success'] = True
 
@@ -267,12 +401,14 @@ class SymmeshServer(server.DccServer, object):
         finally:
             dcc.disable_wait_cursor()
 
-        reply['result'] = mirror_vertices
+        reply['result'] = mirror_vertices.dumps() if mirror_vertices else ''
 
+    @profiler.profile_command
     def get_side_selected_vertices(self, data, reply):
         """
         Function that selects a side of the object (located on the origin).
-        This function does not uses any symmetrical data, so its faster
+        If a symmetry table built with the same mirror axis is given, vertices are resolved with a lookup of the side
+        flags stored in the table. Otherwise, sides are classified using base geometry snapshot.
         """
 
         obj = data['geo']
@@ -281,48 +417,44 @@ class SymmeshServer(server.DccServer, object):
         select_negative = data['select_negative']
         use_pivot = data['use_pivot']
         tolerance = data['tolerance']
-
-        side_vertices = list()
+        symmetry_table = symmetry.SymmetryTable.loads(data.get('symmetry_table', None))
 
         # From (1 to 3) to (0 to 2)
         axis_ind = axis
 
-        total_vertices = dcc.total_vertices(obj)
-
-        reply['success'] = True
-
         if select_negative == 2:
-            for i in range(total_vertices):
-                vtx = dcc.node_vertex_name(obj, i)
-                side_vertices.append(vtx)
-                reply['result'] = side_vertices
-                return
+            sides = symmetry.SIDE_ALL
+        elif select_negative:
+            sides = symmetry.SIDE_NEGATIVE | symmetry.SIDE_SEAM
+        else:
+            sides = symmetry.SIDE_POSITIVE | symmetry.SIDE_SEAM
 
-        if use_pivot:
-            vtx_trans = dcc.node_world_space_translation(base_obj)
-            base_mid = vtx_trans[axis_ind]
+        vertex_count = mesh.get_vertex_count(obj)
+        if symmetry_table is not None and symmetry_table.axis == axis_ind and symmetry_table.matches(vertex_count):
+            side_mask = symmetry_table.get_side_mask(sides)
+        elif sides == symmetry.SIDE_ALL:
+            side_mask = np.ones(vertex_count, dtype=bool)
         else:
-            bounding_box = dcc.node_world_bounding_box(base_obj)
-            base_mid = bounding_box[axis_ind] + ((bounding_box[axis_ind + 3] - bounding_box[axis_ind]) / 2)
-
-        for i in range(total_vertices):
-            vertex_name = dcc.node_vertex_name(obj, i)
-            vtx_trans = dcc.node_vertex_world_space_translation(base_obj, i)
-            base_mid_offset = vtx_trans[axis_ind] - base_mid
-            if abs(base_mid_offset) < tolerance:
-                side_vertices.append(vertex_name)
-                continue
-            if base_mid_offset > 0 and not select_negative:
-                side_vertices.append(vertex_name)
-                continue
-            if base_mid_offset < 0 and select_negative:
-                side_vertices.append(vertex_name)
-                continue
-
-        reply['result'] = side_vertices
+            base_snapshot = self._get_base_snapshot(base_obj)
+            base_mid = base_snapshot.get_mid(axis_ind, use_pivot=use_pivot)
+            base_mid_offsets = base_snapshot.world_points[:, axis_ind] - base_mid
+            side_mask = np.abs(base_mid_offsets) < tolerance
+            if select_negative:
+                side_mask |= base_mid_offsets < 0
+            else:
+                side_mask |= base_mid_offsets > 0
+
+        reply['success'] = True
+        reply['result'] = selection.VertexSelection.from_mask(side_mask).dumps()
 
+    @profiler.profile_command
     @dcc.undo_decorator()
     def mirror_selected(self, data, reply):
+        """
+        Function that mirrors (or flips) selected vertices
+        If soft selection is used, vertices affected by soft selection are mirrored and new positions are blended by
+        soft selection weights
+        """
 
         obj = data['geo']
         base_obj = data['base_geo']
@@ -333,10 +465,7 @@ class SymmeshServer(server.DccServer, object):
         tolerance = data['tolerance']
         flip = data['flip']
         symmetry_table = data['symmetry_table']
-
-        zero_verts_int = list()
-        pos_verts_int = list()
-        neg_verts_int = list()
+        soft_selection = data.get('soft_selection', False)
 
         axis_ind = axis
 
@@ -345,105 +474,157 @@ class SymmeshServer(server.DccServer, object):
             reply['msg'] = 'No vertices selected'
             return
 
-        total_vertices = len(selected_verts)
-
+        base_snapshot = self._get_base_snapshot(base_obj)
+        base_mid = base_snapshot.get_mid(axis_ind, use_pivot=use_pivot)
         if use_pivot:
             vtx_trans = dcc.node_world_space_translation(obj)
             mid = vtx_trans[axis_ind]
-            vtx_trans = dcc.node_world_space_translation(base_obj)
-            base_mid = vtx_trans[axis_ind]
         else:
             mid = 0
-            bounding_box = dcc.node_world_bounding_box(base_obj)
-            base_mid = bounding_box[axis_ind] + ((bounding_box[axis_ind + 3] - bounding_box[axis_ind]) / 2)
 
-        show_progress = False
         dcc.enable_wait_cursor()
-        if total_vertices > consts.MAX_PROGRESS_BAR_THRESHOLD:
-            show_progress = True
-            progress_status = 'Flipping Vertices' if flip else 'Mirroring Vertices'
-            dcc_progress_bar = progressbar.ProgressBar(title='Working', count=total_vertices)
-            dcc_progress_bar.status(progress_status)
-            mod = math.ceil(total_vertices / 50)
+        try:
+            vertex_indices = self._load_vertex_selection(selected_verts, obj).indices
+            points = mesh.get_points(obj, world_space=True)
+            weights = None
+            if soft_selection:
+                vertex_indices, weights = self._get_soft_selection_weights(obj, vertex_indices, len(points))
+            mirror_map = self._load_symmetry_table(symmetry_table, base_snapshot).mirror_map
+            new_points = engine.mirror_points(
+                points, base_snapshot.world_points, mirror_map, axis=axis_ind, mid=mid, base_mid=base_mid,
+                tolerance=tolerance, neg_to_pos=neg_to_pos, flip=flip, indices=vertex_indices, weights=weights)
+            changed = np.flatnonzero(np.any(new_points != points, axis=1))
+            mesh.set_points(obj, new_points, changed, world_space=True)
 
+            reply['success'] = True
+        except Exception as exc:
+            error_msg = 'Error while flipping vertices' if flip else 'Error while mirroring vertices'
+            logger.error('{}: {} | {}'.format(error_msg, exc, traceback.format_exc()))
+            reply['success'] = False
+        finally:
+            dcc.disable_wait_cursor()
+
+    @profiler.profile_command
+    @dcc.undo_decorator()
+    def symmetrize_selected(self, data, reply):
+        """
+        Function that makes geometry exactly symmetric averaging each vertex pair of the symmetry table
+        If vertices are selected, only selected vertices and their mirror vertices are symmetrized
+        """
+
+        obj = data['geo']
+        base_obj = data['base_geo']
+        selected_verts = data['selected_vertices']
+        axis = data['axis']
+        use_pivot = data['use_pivot']
+        tolerance = data['tolerance']
+        symmetry_table = data['symmetry_table']
+
+        dcc.enable_wait_cursor()
         try:
-            for i in range(total_vertices):
-                if show_progress:
-                    if i % mod == 0:
-                        prog_num = i
-                        prog = (prog_num / total_vertices) * 50.0
-                        dcc_progress_bar.inc(prog)
-
-                vtx = selected_verts[i]
-                vert_num = int(re.search(r'\[(\w+)\]', vtx).group(1))
-                vtx_trans = dcc.node_vertex_world_space_translation(base_obj, vert_num)
-                base_mid_offset = vtx_trans[axis_ind] - base_mid
-                if abs(base_mid_offset) < tolerance:
-                    zero_verts_int.append(vert_num)
-                    continue
-                if base_mid_offset > 0:
-                    pos_verts_int.append(vert_num)
-                    continue
-                if base_mid_offset < 0:
-                    neg_verts_int.append(vert_num)
-                    continue
+            base_snapshot = self._get_base_snapshot(base_obj)
+            base_mid = base_snapshot.get_mid(axis, use_pivot=use_pivot)
+            mid = dcc.node_world_space_translation(obj)[axis] if use_pivot else 0
+            mirror_map = self._load_symmetry_table(symmetry_table, base_snapshot).mirror_map
+
+            vertex_indices = None
+            if selected_verts:
+                vertex_indices = self._load_vertex_selection(selected_verts, obj).indices
+                partners = mirror_map[vertex_indices]
+                vertex_indices = np.unique(np.concatenate([vertex_indices, partners[partners != -1]]))
+            mirror_indices = engine.get_mirror_indices(
+                base_snapshot.world_points, mirror_map, axis=axis, base_mid=base_mid, tolerance=tolerance,
+                indices=vertex_indices)
+
+            points = mesh.get_points(obj, world_space=True)
+            new_points = engine.symmetrize_points(points, mirror_indices, axis=axis, mid=mid)
+            changed = np.flatnonzero(np.any(new_points != points, axis=1))
+            mesh.set_points(obj, new_points, changed, world_space=True)
+
+            reply['success'] = True
+        except Exception as exc:
+            logger.error('Error while symmetrizing vertices: {} | {}'.format(exc, traceback.format_exc()))
+            reply['success'] = False
+        finally:
+            dcc.disable_wait_cursor()
 
-            if neg_to_pos:
-                pos_verts_int = neg_verts_int
+    @profiler.profile_command
+    @dcc.undo_decorator()
+    def mirror_targets(self, data, reply):
+        """
+        Function that mirrors (or flips) multiple target geometries (such as blendshape targets) using one shared
+        symmetry table. Base data and mirror indices are computed once and reused for all targets.
+        If no targets are given, selected geometries (excluding base geometry) are used
+        In deltas mode, only the deltas of the targets relative to base geometry are mirrored and only the vertices
+        whose delta changes are written
+        """
 
-            if show_progress:
-                mod = math.ceil(len(pos_verts_int) / 50)
+        base_obj = data['base_geo']
+        targets = data.get('targets', None) or [geo for geo in mesh.get_selected_geos() if geo != base_obj]
+        axis = data['axis']
+        neg_to_pos = data['neg_to_pos']
+        use_pivot = data['use_pivot']
+        tolerance = data['tolerance']
+        flip = data['flip']
+        symmetry_table = data['symmetry_table']
+        deltas = data.get('deltas', False)
 
-            for i in range(len(pos_verts_int)):
-                if show_progress:
-                    if i % mod == 0:
-                        prog_num = i
-                        prog = (prog_num / total_vertices) * 50.0 + 50
-                        dcc_progress_bar.inc(prog)
+        if not targets:
+            reply['success'] = False
+            reply['msg'] = 'No target geometries selected'
+            return
 
-                vert_num = consts.get_mirror_vertex_index(symmetry_table, pos_verts_int[i])
-                if vert_num != -1:
-                    vtx_trans = dcc.node_vertex_world_space_translation(obj, pos_verts_int[i])
-                    vtx_trans[axis_ind] = 2 * mid - vtx_trans[axis_ind]
+        mirrored_targets = list()
 
-                    if not flip:
-                        dcc.set_node_vertex_world_space_translation(
-                            obj, vertex_id=vert_num, translate_list=vtx_trans)
-                    else:
-                        flip_vtx_trans = dcc.node_vertex_world_space_translation(obj, vert_num)
-                        flip_vtx_trans[axis_ind] = 2 * mid - flip_vtx_trans[axis_ind]
-                        dcc.set_node_vertex_world_space_translation(
-                            obj, vertex_id=vert_num, translate_list=vtx_trans)
-                        dcc.set_node_vertex_world_space_translation(
-                            obj, vertex_id=pos_verts_int[i], translate_list=flip_vtx_trans)
-
-            for i in range(len(zero_verts_int)):
-                vtx_trans = dcc.node_vertex_world_space_translation(obj, zero_verts_int[i])
-                if flip:
-                    vtx_trans[axis_ind] = 2 * mid - vtx_trans[axis_ind]
+        dcc.enable_wait_cursor()
+        try:
+            base_snapshot = self._get_base_snapshot(base_obj)
+            base_mid = base_snapshot.get_mid(axis, use_pivot=use_pivot)
+            mirror_map = self._load_symmetry_table(symmetry_table, base_snapshot).mirror_map
+            mirror_indices = engine.get_mirror_indices(
+                base_snapshot.world_points, mirror_map, axis=axis, base_mid=base_mid, tolerance=tolerance,
+                neg_to_pos=neg_to_pos)
+
+            for target in targets:
+                if mesh.get_vertex_count(target) != base_snapshot.vertex_count:
+                    logger.warning('Skipping "{}": vertex count does not match base geometry'.format(target))
+                    continue
+                if deltas:
+                    self._mirror_target_deltas(
+                        target, base_snapshot, mirror_map, axis=axis, base_mid=base_mid, tolerance=tolerance,
+                        neg_to_pos=neg_to_pos, flip=flip)
                 else:
-                    vtx_trans[axis_ind] = mid
-                dcc.set_node_vertex_world_space_translation(
-                    obj, vertex_id=zero_verts_int[i], translate_list=vtx_trans)
+                    mid = dcc.node_world_space_translation(target)[axis] if use_pivot else 0
+                    points = mesh.get_points(target, world_space=True)
+                    new_points = engine.apply_mirror(points, mirror_indices, axis=axis, mid=mid, flip=flip)
+                    changed = np.flatnonzero(np.any(new_points != points, axis=1))
+                    mesh.set_points(target, new_points, changed, world_space=True)
+                mirrored_targets.append(target)
 
             reply['success'] = True
         except Exception as exc:
-            error_msg = 'Error while flipping vertices' if flip else 'Error while mirroring vertices'
+            error_msg = 'Error while flipping targets' if flip else 'Error while mirroring targets'
             logger.error('{}: {} | {}'.format(error_msg, exc, traceback.format_exc()))
             reply['success'] = False
         finally:
             dcc.disable_wait_cursor()
-            if show_progress:
-                dcc_progress_bar.end()
 
+        reply['result'] = mirrored_targets
+
+    @profiler.profile_command
     @dcc.undo_decorator()
     def revert_selected_to_base(self, data, reply):
+        """
+        Function that reverts selected vertices to base geometry positions by the given bias
+        If soft selection is used, vertices affected by soft selection are reverted and bias is scaled by soft
+        selection weights
+        """
+
         geo = data['geo']
         base_obj = data['base_geo']
         selected_verts = data['selected_vertices']
         bias = data['bias']
-
-        total_vertices = len(selected_verts)
+        soft_selection = data.get('soft_selection', False)
 
         if bias > 1:
             bias = 1
@@ -453,38 +634,300 @@ class SymmeshServer(server.DccServer, object):
         if bias < 0.01:
             bias = 0
 
-        show_progress = False
         dcc.enable_wait_cursor()
-        if total_vertices > consts.MAX_PROGRESS_BAR_THRESHOLD:
-            show_progress = True
-            dcc_progress_bar = progressbar.ProgressBar(title='Working', count=total_vertices)
-            dcc_progress_bar.status('Reverting Vertices')
-            mod = math.ceil(total_vertices / 50)
-
         try:
-            for i in range(total_vertices):
-                if show_progress:
-                    if i % mod == 0:
-                        prog_num = i
-                        prog = (prog_num / total_vertices) * 50.0 + 50
-                        dcc_progress_bar.inc(prog)
-
-                vtx = selected_verts[i]
-                vert_num = int(re.search(r'\[(\w+)\]', vtx).group(1))
-                obj_trans = mathlib.Vector(*dcc.node_vertex_object_space_translation(vtx))
-                base_trans = mathlib.Vector(*dcc.node_vertex_object_space_translation(base_obj, vert_num))
-
-                if mathlib.get_distance_between_vectors(obj_trans, base_trans) > 0:
-                    dcc.set_node_vertex_object_space_translation(vtx, translate_list=[
-                        base_trans.x + (obj_trans.x - base_trans.x) * bias,
-                        base_trans.y + (obj_trans.y - base_trans.y) * bias,
-                        base_trans.z + (obj_trans.z - base_trans.z) * bias,
-                    ])
+            vertex_indices = self._load_vertex_selection(selected_verts, geo).indices
+            base_points = self._get_base_snapshot(base_obj).points
+            points = mesh.get_points(geo)
+            weights = None
+            if soft_selection:
+                vertex_indices, weights = self._get_soft_selection_weights(geo, vertex_indices, len(points))
+            moved = vertex_indices[np.any(points[vertex_indices] != base_points[vertex_indices], axis=1)]
+            if weights is None:
+                points[moved] = base_points[moved] + (points[moved] - base_points[moved]) * bias
+            else:
+                points[moved] = engine.blend_points(points[moved], base_points[moved], (1 - bias) * weights[moved])
+            mesh.set_points(geo, points, moved)
             reply['success'] = True
         except Exception as exc:
             reply['success'] = False
             logger.error('Error while reverting vertices: {} | {}'.format(exc, traceback.format_exc()))
         finally:
             dcc.disable_wait_cursor()
-            if show_progress:
-                dcc_progress_bar.end()
+
+    def _mirror_target_deltas(self, target, base_snapshot, mirror_map, axis, base_mid, tolerance, neg_to_pos, flip):
+        """
+        Internal function that mirrors (or flips) the deltas of the given target relative to base geometry
+        Deltas are computed in object space and oriented in world space with the target world matrix, so they are
+        mirrored across the world mirror axis. Target points are read with a single bulk query, but only vertices whose
+        delta changes are processed and written.
+        :param target: str, name of the target geometry
+        :param base_snapshot: GeometrySnapshot
+        :param mirror_map: np.array
+        :param axis: int
+        :param base_mid: float
+        :param tolerance: float
+        :param neg_to_pos: bool
+        :param flip: bool
+        """
+
+        orientation = mesh.get_world_matrix(target)[:3, :3]
+        indices, deltas = engine.get_sparse_deltas(mesh.get_points(target), base_snapshot.points)
+        changed, new_deltas = engine.mirror_sparse_deltas(
+            indices, np.dot(deltas, orientation), base_snapshot.world_points, mirror_map, axis=axis,
+            base_mid=base_mid, tolerance=tolerance, neg_to_pos=neg_to_pos, flip=flip)
+        if not len(changed):
+            return
+
+        mesh.set_vertex_points(
+            target, changed, base_snapshot.points[changed] + np.dot(new_deltas, np.linalg.inv(orientation)))
+
+    def _get_check_mid(self, axis, use_pivot, table, pivot, bounding_box):
+        """
+        Internal function that returns the position of the mirror plane used to check symmetry of a geometry
+        Pivot is used if enabled. Otherwise, bounding box center is used to build symmetry tables and origin to check
+        symmetry.
+        :param axis: int, mirror axis index (0: YZ, 1: XZ, 2: XY)
+        :param use_pivot: bool
+        :param table: bool, whether or not a symmetry table is built
+        :param pivot: list(float, float, float), world space pivot of the geometry
+        :param bounding_box: list(float), world space bounding box of the geometry (min and max values)
+        :return: float
+        """
+
+        if use_pivot:
+            return pivot[axis]
+        if table:
+            return bounding_box[axis] + ((bounding_box[axis + 3] - bounding_box[axis]) / 2)
+
+        return 0.0
+
+    def _take_base_snapshot(self, geo):
+        """
+        Internal function that stores a snapshot of the given base geometry
+        Snapshot is marked as dirty each time the geometry is changed
+        :param geo: str, name of the geometry
+        :return: GeometrySnapshot
+        """
+
+        # Symmetry check is kept, so symmetry of the new snapshot is validated only for the vertices that changed
+        self._remove_base_snapshot(geo, keep_symmetry_check=True)
+
+        # Points are written straight into the cache arrays (memory-mapped for big meshes), so they are not copied twice
+        # and world space points are computed from object space ones instead of querying the mesh again
+        shape = (mesh.get_vertex_count(geo), 3)
+        points = mesh.get_points(geo, out=self._snapshots.create('{}_object'.format(geo), shape))
+        world_points = self._snapshots.create('{}_world'.format(geo), shape)
+        world_points[:] = engine.transform_points(points, mesh.get_world_matrix(geo))
+        snapshot = cache.GeometrySnapshot(
+            geo, points, world_points, bounding_box=dcc.node_world_bounding_box(geo),
+            pivot=dcc.node_world_space_translation(geo))
+        snapshot.callbacks = mesh.add_dirty_callbacks(geo, snapshot.set_dirty)
+        self._base_snapshots[geo] = snapshot
+
+        symmetry_check = self._symmetry_checks.get(geo, None)
+        if symmetry_check is not None:
+            if symmetry_check.vertex_count == snapshot.vertex_count:
+                # Check references the new snapshot points, so the previous ones are released
+                symmetry_check.update(world_points)
+            else:
+                self._symmetry_checks.pop(geo)
+
+        return snapshot
+
+    def _get_symmetry_check(self, snapshot, axis, tolerance, mid):
+        """
+        Internal function that returns the symmetry check of the given geometry snapshot
+        If a check was already done with the same settings, only the vertices that changed since then are validated
+        Vertices are matched inside shells and their mirror shells first, so duplicated pieces are not mixed up
+        :param snapshot: GeometrySnapshot
+        :param axis: int
+        :param tolerance: float
+        :param mid: float
+        :return: IncrementalSymmetryCheck
+        """
+
+        symmetry_check = self._symmetry_checks.get(snapshot.geo, None)
+        if symmetry_check and symmetry_check.matches(axis, tolerance, mid, snapshot.vertex_count):
+            changed = symmetry_check.update(snapshot.world_points)
+            logger.debug('Symmetry re-checked for {} changed vertices'.format(len(changed)))
+        else:
+            if snapshot.shells is None:
+                snapshot.shells = mesh.get_shells(snapshot.geo)
+            symmetry_check = engine.IncrementalSymmetryCheck(
+                snapshot.world_points, axis=axis, tolerance=tolerance, mid=mid, shells=snapshot.shells)
+            self._symmetry_checks[snapshot.geo] = symmetry_check
+
+        return symmetry_check
+
+    def _build_topology_symmetry_table(self, snapshot, axis, tolerance, mid, seam_edges=None):
+        """
+        Internal function that builds the symmetry table of the given geometry snapshot walking its connectivity
+        :param snapshot: GeometrySnapshot
+        :param axis: int
+        :param tolerance: float, only used to detect seam edges if no seam edges are given
+        :param mid: float
+        :param seam_edges: list(tuple(int, int)) or None, edges the walk starts from. If not given, edges that lie on
+            the mirror plane are used.
+        :return: tuple(np.array, np.array, np.array), pairs, seam vertices and asymmetric vertices
+        """
+
+        face_counts, face_vertices = mesh.get_face_vertices(snapshot.geo)
+        if seam_edges is None or not len(seam_edges):
+            seam_edges = engine.find_seam_edges(
+                snapshot.world_points, face_counts, face_vertices, axis=axis, tolerance=tolerance, mid=mid)
+            if not len(seam_edges):
+                logger.warning('No seam edges found on the mirror plane. Select a seam edge please')
+
+        return engine.build_topology_symmetry_table(
+            snapshot.world_points, face_counts, face_vertices, seam_edges, axis=axis, mid=mid)
+
+    def _get_topology_fingerprint(self, snapshot):
+        """
+        Internal function that returns the topology fingerprint of the given geometry snapshot
+        :param snapshot: GeometrySnapshot
+        :return: str
+        """
+
+        if snapshot.fingerprint is None:
+            face_counts, face_vertices = mesh.get_face_vertices(snapshot.geo)
+            snapshot.fingerprint = symmetry.get_topology_fingerprint(snapshot.vertex_count, face_counts, face_vertices)
+
+        return snapshot.fingerprint
+
+    def _load_symmetry_table(self, data, snapshot):
+        """
+        Internal function that loads given serialized symmetry table and checks that it was built with the topology of
+        the given base geometry snapshot
+        :param data: str, serialized symmetry table
+        :param snapshot: GeometrySnapshot
+        :return: SymmetryTable
+        """
+
+        symmetry_table = symmetry.SymmetryTable.loads(data)
+        if symmetry_table is None or not symmetry_table.matches(
+                snapshot.vertex_count, self._get_topology_fingerprint(snapshot)):
+            raise ValueError(
+                'Symmetry table does not match "{}" topology. Check symmetry again please'.format(snapshot.geo))
+
+        return symmetry_table
+
+    def _get_component_mirror_map(self, snapshot, symmetry_table, component_type):
+        """
+        Internal function that returns the edge or face mirror map of the given geometry snapshot lifted from the given
+        symmetry table. Maps are built from bulk connectivity queries and cached until the geometry changes
+        :param snapshot: GeometrySnapshot
+        :param symmetry_table: SymmetryTable
+        :param component_type: str, mesh.EDGE_COMPONENT or mesh.FACE_COMPONENT
+        :return: np.array
+        """
+
+        map_key = (snapshot.geo, component_type, symmetry_table.get_digest())
+        component_mirror_map = self._component_mirror_maps.get(map_key, None)
+        if component_mirror_map is not None:
+            return component_mirror_map
+
+        if component_type == mesh.EDGE_COMPONENT:
+            if snapshot.edges is None:
+                snapshot.edges = mesh.get_edges(snapshot.geo)
+            component_mirror_map = engine.get_edge_mirror_map(
+                snapshot.edges[0], snapshot.edges[1], symmetry_table.mirror_map)
+        else:
+            face_counts, face_vertices = mesh.get_face_vertices(snapshot.geo)
+            component_mirror_map = engine.get_face_mirror_map(face_counts, face_vertices, symmetry_table.mirror_map)
+        self._component_mirror_maps[map_key] = component_mirror_map
+
+        return component_mirror_map
+
+    def _get_soft_selection_weights(self, geo, vertex_indices, vertex_count):
+        """
+        Internal function that returns the vertices affected by the soft selection of the given geometry and the weight
+        of each vertex. If soft selection is disabled, given vertices are returned with full weight
+        :param geo: str, name of the geometry
+        :param vertex_indices: np.array, indices of the selected vertices
+        :param vertex_count: int, total number of vertices of the geometry
+        :return: tuple(np.array, np.array), vertex indices and (N, ) array of vertex weights
+        """
+
+        soft_indices, soft_weights = mesh.get_soft_selection_weights(geo)
+        weights = np.zeros(vertex_count, dtype=np.float64)
+        if not len(soft_indices):
+            weights[vertex_indices] = 1.0
+            return vertex_indices, weights
+
+        weights[soft_indices] = soft_weights
+
+        return soft_indices, weights
+
+    def _load_vertex_selection(self, data, geo):
+        """
+        Internal function that loads given serialized vertex selection and checks that it belongs to a geometry with the
+        same vertex count as the given one
+        :param data: str, serialized vertex selection
+        :param geo: str, name of the geometry
+        :return: VertexSelection
+        """
+
+        vertex_count = mesh.get_vertex_count(geo)
+        vertex_selection = selection.VertexSelection.loads(data)
+        if vertex_selection is None:
+            return selection.VertexSelection.empty(vertex_count)
+        if vertex_selection.vertex_count != vertex_count:
+            raise ValueError('Selected vertices do not match "{}" vertex count'.format(geo))
+
+        return vertex_selection
+
+    def _get_base_snapshot(self, geo):
+        """
+        Internal function that returns the snapshot of the given base geometry
+        Snapshot is taken again if it does not exist yet or if it is dirty
+        :param geo: str, name of the geometry
+        :return: GeometrySnapshot
+        """
+
+        snapshot = self._base_snapshots.get(geo, None)
+        if not snapshot or snapshot.dirty or snapshot.vertex_count != mesh.get_vertex_count(geo):
+            snapshot = self._take_base_snapshot(geo)
+
+        return snapshot
+
+    def _remove_base_snapshot(self, geo, keep_symmetry_check=False):
+        """
+        Internal function that removes the snapshot of the given base geometry
+        :param geo: str, name of the geometry
+        :param keep_symmetry_check: bool, whether or not the symmetry check of the geometry is kept so it can be updated
+            with the next snapshot
+        """
+
+        if not keep_symmetry_check:
+            self._symmetry_checks.pop(geo, None)
+        self._clear_symmetry_results(geo)
+        self._tolerance_sweeps.pop(geo, None)
+        for map_key in list(self._component_mirror_maps.keys()):
+            if map_key[0] == geo:
+                self._component_mirror_maps.pop(map_key)
+        snapshot = self._base_snapshots.pop(geo, None)
+        if not snapshot:
+            return
+
+        mesh.remove_callbacks(snapshot.callbacks)
+        self._snapshots.remove('{}_object'.format(geo))
+        self._snapshots.remove('{}_world'.format(geo))
+
+    def _clear_symmetry_results(self, geo):
+        """
+        Internal function that removes all cached symmetry check results of the given geometry
+        :param geo: str, name of the geometry
+        """
+
+        for result_key in list(self._symmetry_results.keys()):
+            if result_key[0] == geo:
+                self._symmetry_results.pop(result_key)
+
+    def _clear_base_snapshots(self):
+        """
+        Internal function that removes all stored base geometry snapshots
+        """
+
+        for geo in list(self._base_snapshots.keys()):
+            self._remove_base_snapshot(geo)